@@ -0,0 +1,6 @@
+"""
+Benchmarks for SIGMArec's detection hot paths.
+
+Run with `python -m benchmarks` from the repository root. See
+benchmarks/__main__.py for options.
+"""
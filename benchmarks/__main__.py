@@ -0,0 +1,114 @@
+"""
+Run the benchmark suite.
+
+Usage:
+    python -m benchmarks [--quick] [--filter NAME] [--output results.json]
+                         [--baseline baseline.json] [--save-baseline]
+                         [--threshold 0.5]
+
+Results are written as JSON. Every benchmark is compared against a baseline
+and the run fails if any of them got slower than the threshold allows. The
+committed benchmarks/baseline.json is the reference for the CI machine.
+Baselines are machine specific, so record one with --save-baseline on the
+machine that will run the comparison, and refresh it after intentional
+performance changes. A baseline passed with --baseline must exist.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from src.replay.stubs import install_win32_stubs
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_LOG_SIZES = "1,20,200"
+QUICK_LOG_SIZES = "1"
+
+
+def main() -> int:
+    """Entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="SIGMArec benchmarks")
+    parser.add_argument("--filter", help="Only run benchmarks containing this text")
+    parser.add_argument(
+        "--quick", action="store_true", help="Fewer rounds and only the 1 MB log"
+    )
+    parser.add_argument(
+        "--log-sizes",
+        help=f"Comma separated log sizes in MB (default {DEFAULT_LOG_SIZES})",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help=f"Baseline to compare against (default {DEFAULT_BASELINE.name})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing against it",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown against the baseline (0.5 = 50%%)",
+    )
+    args = parser.parse_args()
+
+    install_win32_stubs()
+
+    # Detection imports Windows modules, so it is only loaded once they are stubbed
+    from . import bench_log, bench_obs, bench_pixel, bench_state_machine
+    from .common import load_default_games
+    from .harness import BenchmarkRunner, compare_to_baseline, save_results
+
+    log_sizes = args.log_sizes or (QUICK_LOG_SIZES if args.quick else DEFAULT_LOG_SIZES)
+    runner = BenchmarkRunner(
+        rounds=3 if args.quick else 5,
+        min_round_time=0.02 if args.quick else 0.05,
+        name_filter=args.filter,
+    )
+    games = load_default_games()
+
+    bench_pixel.run(runner, games)
+    bench_log.run_reader(runner, [int(size) for size in log_sizes.split(",")])
+    bench_log.run_log_game(runner, games)
+    bench_state_machine.run(runner)
+    bench_obs.run(runner)
+
+    report = runner.to_dict()
+    save_results(report, args.output)
+    print(f"\nResults written to {args.output}")
+
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    if args.save_baseline:
+        save_results(report, baseline_path)
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        if args.baseline is not None:
+            print(f"Baseline {baseline_path} does not exist", file=sys.stderr)
+            return 2
+        print(f"No baseline at {baseline_path}, skipping comparison")
+        return 0
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare_to_baseline(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\nNo regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Java XML log reading and LogGame state resolution.
+"""
+
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from src.detection.log_reader import IncrementalLogReader
+from src.detection.log_service import LogService
+from src.detection.process_metadata import (
+    ProcessMetadataCache,
+    StaticProcessMetadataProvider,
+)
+from src.games import Game, LogGame
+
+from .harness import BenchmarkRunner
+
+LOG_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+    '<!DOCTYPE log SYSTEM "logger.dtd">\n'
+    "<log>\n"
+)
+RECORD_TEMPLATE = (
+    "<record>\n"
+    "  <date>2024-01-01T00:{minute:02d}:{second:02d}.{sequence:06d}Z</date>\n"
+    "  <millis>{millis}</millis>\n"
+    "  <sequence>{sequence}</sequence>\n"
+    "  <logger>bms.player.beatoraja</logger>\n"
+    "  <level>INFO</level>\n"
+    "  <class>{class_name}</class>\n"
+    "  <method>{method_name}</method>\n"
+    "  <thread>1</thread>\n"
+    "  <message>{message}</message>\n"
+    "</record>\n"
+)
+NOISE_CLASSES = [
+    ("bms.player.beatoraja.audio.AudioDriver", "play"),
+    ("bms.player.beatoraja.skin.SkinLoader", "load"),
+    ("bms.player.beatoraja.input.BMSPlayerInputProcessor", "poll"),
+    ("bms.player.beatoraja.song.SongDatabaseAccessor", "getSongDatas"),
+]
+ENTRY_COUNTS = (10, 100, 1000, 10000)
+COPIES = 64
+
+
+def _record(sequence: int, class_name: str, method_name: str) -> str:
+    return RECORD_TEMPLATE.format(
+        minute=(sequence // 60) % 60,
+        second=sequence % 60,
+        sequence=sequence,
+        millis=1704067200000 + sequence,
+        class_name=class_name,
+        method_name=method_name,
+        message=f"synthetic entry {sequence} &amp; more",
+    )
+
+
+def write_log(path: Path, size_bytes: int, seed: int = 0) -> int:
+    """
+    Write a synthetic Java XMLFormatter log of roughly the given size.
+
+    Returns:
+        Number of records written
+    """
+    rng = random.Random(seed)
+    sequence = 0
+    written = 0
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(LOG_HEADER)
+        while written < size_bytes:
+            chunk = []
+            for _ in range(1000):
+                class_name, method_name = rng.choice(NOISE_CLASSES)
+                chunk.append(_record(sequence, class_name, method_name))
+                sequence += 1
+            text = "".join(chunk)
+            f.write(text)
+            written += len(text)
+
+    return sequence
+
+
+def _log_service() -> LogService:
+    return LogService(ProcessMetadataCache(StaticProcessMetadataProvider()))
+
+
+def run_reader(runner: BenchmarkRunner, sizes_mb: Sequence[int]) -> None:
+    """Benchmark LogService.read_log_entries on synthetic logs."""
+    with tempfile.TemporaryDirectory(prefix="sigmarec-bench-") as tmp:
+        for size_mb in sizes_mb:
+            prefix = f"log.read.{size_mb}mb"
+            if not any(
+                runner.wants(f"{prefix}.{kind}")
+                for kind in ("first_read", "full_parse", "append")
+            ):
+                continue
+
+            path = Path(tmp) / f"log_{size_mb}mb.xml"
+            write_log(path, size_mb * 1024 * 1024)
+            size = os.path.getsize(path)
+
+            # A newly seen file: only the tail is parsed
+            def first_read(path=str(path)):
+                service = _log_service()
+                return service.read_log_entries(path)
+
+            runner.run(f"{prefix}.first_read", first_read)
+
+            # Worst case of parsing the whole file, measured once
+            if runner.wants(f"{prefix}.full_parse"):
+                reader = IncrementalLogReader(initial_tail_bytes=size)
+                start = time.perf_counter()
+                reader.read(str(path))
+                runner.record(
+                    f"{prefix}.full_parse", time.perf_counter() - start, size
+                )
+
+            # Steady state: one record appended per read
+            service = _log_service()
+            service.read_log_entries(str(path))
+            sequence = [size]
+
+            def append_and_read(path=str(path), service=service, sequence=sequence):
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(_record(sequence[0], *NOISE_CLASSES[0]))
+                sequence[0] += 1
+                return service.read_log_entries(path)
+
+            runner.run(f"{prefix}.append", append_and_read)
+
+
+def _entries(game: LogGame, count: int, deciding_index: int) -> List[Dict[str, str]]:
+    """Noise entries with one entry matching the game's last state."""
+    rng = random.Random(count)
+    entries = []
+    for i in range(count):
+        class_name, method_name = rng.choice(NOISE_CLASSES)
+        entries.append(
+            {"class": class_name, "method": method_name, "message": "", "date": str(i)}
+        )
+
+    state = list(game.states.values())[-1]
+    pattern = state.patterns[0]
+    entries[deciding_index] = {
+        "class": pattern.class_name,
+        "method": pattern.method_name,
+        "message": "",
+        "date": str(deciding_index),
+    }
+    return entries
+
+
+def run_log_game(runner: BenchmarkRunner, games: List[Game]) -> None:
+    """Benchmark LogGame.get_current_state with growing entry counts."""
+    for game in games:
+        if not isinstance(game, LogGame) or not game.states:
+            continue
+
+        for count in ENTRY_COUNTS:
+            for position, index in (("newest", count - 1), ("oldest", 0)):
+                name = f"log_game.{game.shortname}.{count}_entries.{position}"
+                if not runner.wants(name):
+                    continue
+
+                entries = _entries(game, count, index)
+                # Detection passes a new sequence every tick, so cycle through copies
+                copies = [tuple(entries) for _ in range(COPIES)]
+                position_ref = [0]
+
+                def resolve(game=game, copies=copies, position_ref=position_ref):
+                    i = position_ref[0]
+                    position_ref[0] = (i + 1) % len(copies)
+                    return game.get_current_state(copies[i])
+
+                runner.run(name, resolve)
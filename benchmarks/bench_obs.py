@@ -0,0 +1,117 @@
+"""
+OBS request round trips, event delivery and reconnects against the fake OBS.
+"""
+
+import threading
+import time
+
+import obsws_python as obsws
+
+from src.config.settings import AppSettings
+from src.fake_obs import FakeOBSServer
+
+from .harness import BenchmarkRunner
+
+PASSWORD = "benchmark"
+EVENT_TIMEOUT = 2.0
+RECONNECT_ROUNDS = 5
+
+
+def _wait_until(condition, timeout: float = EVENT_TIMEOUT) -> None:
+    """Spin until a condition holds, failing the benchmark on timeout."""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Fake OBS did not respond in time")
+        time.sleep(0)
+
+
+def run(runner: BenchmarkRunner) -> None:
+    """Benchmark the OBS connection against a local fake OBS."""
+    from src.obs.controller import OBSController
+
+    with FakeOBSServer(password=PASSWORD) as server:
+        settings = AppSettings(
+            obs_host=server.host, obs_port=server.port, obs_password=PASSWORD
+        )
+        obs = OBSController.connect(settings, background=False)
+        if not obs.connect_once():
+            raise RuntimeError("Could not connect to the fake OBS")
+
+        runner.run("obs.request.get_version", obs.req_client.get_version)
+        runner.run("obs.state.get_current_scene", obs.get_current_scene)
+
+        _bench_reconfigure(runner, obs)
+
+        if runner.wants("obs.event.delivery"):
+            _bench_event_delivery(runner, server)
+
+        def record_cycle():
+            obs.start_recording()
+            _wait_until(lambda: obs.recording_active)
+            obs.stop_recording()
+            _wait_until(lambda: not obs.recording_active)
+
+        runner.run("obs.record.start_stop_cycle", record_cycle)
+
+        if runner.wants("obs.reconnect"):
+            timings = []
+            for _ in range(RECONNECT_ROUNDS):
+                start = time.perf_counter()
+                server.disconnect_clients()
+                # The first check notices the lost connection, the next ones
+                # reconnect and report the regular keep-alive interval
+                while obs.check_connection() != settings.obs_timeout:
+                    pass
+                timings.append(time.perf_counter() - start)
+            runner.record("obs.reconnect", min(timings))
+
+        obs.shutdown()
+
+
+def _bench_reconfigure(runner: BenchmarkRunner, obs) -> None:
+    """Time the scene and video settings changes of a game change."""
+    from src.obs import OBSVideoSettings
+
+    configurations = [
+        ("Playing", OBSVideoSettings(1280, 720, 1280, 720, 60, 1)),
+        ("Scene", OBSVideoSettings(1920, 1080, 1920, 1080, 60, 1)),
+    ]
+    position = [0]
+
+    def reconfigure():
+        scene, video_settings = configurations[position[0]]
+        position[0] ^= 1
+        obs.set_video_settings(video_settings)
+        obs.set_current_scene(scene)
+
+    def reconfigure_batched():
+        with obs.batched():
+            reconfigure()
+
+    runner.run("obs.reconfigure.sequential", reconfigure)
+    runner.run("obs.reconfigure.batched", reconfigure_batched)
+
+
+def _bench_event_delivery(runner: BenchmarkRunner, server: FakeOBSServer) -> None:
+    """Time an event from the server until the client's callback runs."""
+    delivered = threading.Event()
+
+    def on_current_program_scene_changed(event):
+        delivered.set()
+
+    client = obsws.EventClient(
+        host=server.host, port=server.port, password=PASSWORD
+    )
+    client.callback.register(on_current_program_scene_changed)
+
+    def deliver():
+        delivered.clear()
+        server.emit_event("CurrentProgramSceneChanged", {"sceneName": "Scene"})
+        if not delivered.wait(EVENT_TIMEOUT):
+            raise TimeoutError("Event was not delivered")
+
+    try:
+        runner.run("obs.event.delivery", deliver)
+    finally:
+        client.disconnect()
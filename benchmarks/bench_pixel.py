@@ -0,0 +1,84 @@
+"""
+Pixel state evaluation on synthetic frames.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from mss.screenshot import ScreenShot
+
+from src.detection.capture import CaptureSession, FrameCaptureBackend
+from src.games import Game, PixelGame, PixelState
+
+from .harness import BenchmarkRunner
+
+RESOLUTIONS = {
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4k": (3840, 2160),
+}
+
+
+def _noise_frame(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """Random BGRA frame that matches no pattern."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+
+
+def _state_frame(
+    game: PixelGame, width: int, height: int
+) -> Tuple[Optional[PixelState], np.ndarray]:
+    """
+    Frame matching the last state of the game that has a pattern at this size.
+
+    The last state is used since earlier states are rejected before it.
+    """
+    frame = _noise_frame(width, height, seed=1)
+
+    for state in reversed(list(game.states.values())):
+        for pattern in state.patterns:
+            if tuple(pattern.resolution) != (width, height):
+                continue
+            for pixel in pattern.pixels:
+                frame[pixel.y, pixel.x, :3] = (pixel.b, pixel.g, pixel.r)
+            return state, frame
+
+    return None, frame
+
+
+def _screenshot(frame: np.ndarray) -> ScreenShot:
+    height, width = frame.shape[:2]
+    monitor = {"left": 0, "top": 0, "width": width, "height": height}
+    return ScreenShot(bytearray(frame.tobytes()), monitor)
+
+
+def run(runner: BenchmarkRunner, games: List[Game]) -> None:
+    """Benchmark PixelGame.get_current_state for every pixel game."""
+    for game in games:
+        if not isinstance(game, PixelGame):
+            continue
+
+        for label, (width, height) in RESOLUTIONS.items():
+            prefix = f"pixel.{game.shortname}.{label}"
+            if not any(runner.wants(f"{prefix}.{kind}") for kind in ("miss", "hit")):
+                continue
+
+            miss = _screenshot(_noise_frame(width, height))
+            runner.run(f"{prefix}.miss", lambda g=game, s=miss: g.get_current_state(s))
+
+            state, frame = _state_frame(game, width, height)
+            if state is None:
+                continue
+
+            hit = _screenshot(frame)
+            assert game.get_current_state(hit) is state
+            runner.run(f"{prefix}.hit", lambda g=game, s=hit: g.get_current_state(s))
+
+            backend = FrameCaptureBackend(title=game.name)
+            backend.set_frame(frame)
+            regions = CaptureSession(backend).grab_regions(game.matcher.get_layout)
+            if regions is not None:
+                runner.run(
+                    f"{prefix}.hit_regions",
+                    lambda g=game, r=regions: g.get_current_state(r),
+                )
@@ -0,0 +1,56 @@
+"""
+Transition pattern matching in StateMachine.push_state.
+"""
+
+import random
+
+from src.detection.state_machine import WILDCARD, StateMachine, TransitionPattern
+
+from .harness import BenchmarkRunner
+
+STATES = ["Select", "Playing", "Result", "Unknown", "Loading", "Options"]
+PATTERN_COUNTS = (9, 100, 1000)
+MAX_HISTORY = 10
+SEQUENCE_LENGTH = 4096
+
+
+def _patterns(count: int, rng: random.Random):
+    tokens = STATES + [WILDCARD]
+    return [
+        TransitionPattern(
+            f"pattern_{i}",
+            tuple(rng.choice(tokens) for _ in range(rng.randint(2, 4))),
+        )
+        for i in range(count)
+    ]
+
+
+def _state_sequence(rng: random.Random):
+    """States to push, without consecutive duplicates so every push matches."""
+    sequence = [rng.choice(STATES)]
+    while len(sequence) < SEQUENCE_LENGTH:
+        state = rng.choice(STATES)
+        if state != sequence[-1]:
+            sequence.append(state)
+    return sequence
+
+
+def run(runner: BenchmarkRunner) -> None:
+    """Benchmark push_state with growing numbers of patterns."""
+    for count in PATTERN_COUNTS:
+        name = f"state_machine.push_state.{count}_patterns"
+        if not runner.wants(name):
+            continue
+
+        rng = random.Random(count)
+        machine = StateMachine(max_history=MAX_HISTORY)
+        machine.add_patterns(_patterns(count, rng))
+        sequence = _state_sequence(rng)
+        position = [0]
+
+        def push(machine=machine, sequence=sequence, position=position):
+            index = position[0]
+            machine.push_state(sequence[index])
+            position[0] = (index + 1) % len(sequence)
+
+        runner.run(name, push)
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for the benchmarks.
+"""
+
+import json
+from typing import List
+
+from src.defaults import DEFAULT_GAMES
+from src.games import Game, GameFactory
+
+
+def load_default_games() -> List[Game]:
+    """Build every game defined in defaults.DEFAULT_GAMES."""
+    games_data = json.loads(DEFAULT_GAMES)
+    return [GameFactory.create_game(name, data) for name, data in games_data.items()]
@@ -0,0 +1,219 @@
+"""
+Minimal timing harness with JSON results and baseline comparison.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Each round runs the benchmark for at least this long
+MIN_ROUND_TIME = 0.05
+ROUNDS = 5
+MAX_LOOPS = 1 << 20
+# Slowdowns smaller than this are timer and scheduling noise, not regressions
+MIN_REGRESSION_US = 1.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of a single benchmark, per operation."""
+
+    name: str
+    loops: int
+    median_us: float
+    min_us: float
+    extra: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Convert the result to plain data."""
+        data = {
+            "loops": self.loops,
+            "median_us": round(self.median_us, 3),
+            "min_us": round(self.min_us, 3),
+        }
+        data.update(self.extra)
+        return data
+
+
+class BenchmarkRunner:
+    """Runs benchmarks and collects their results."""
+
+    def __init__(
+        self,
+        rounds: int = ROUNDS,
+        min_round_time: float = MIN_ROUND_TIME,
+        name_filter: Optional[str] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            rounds: Number of timed rounds per benchmark
+            min_round_time: Minimum duration of a round in seconds
+            name_filter: Only run benchmarks whose name contains this string
+        """
+        self.rounds = rounds
+        self.min_round_time = min_round_time
+        self.name_filter = name_filter
+        self.results: List[BenchmarkResult] = []
+
+    def wants(self, name: str) -> bool:
+        """Check if a benchmark passes the name filter."""
+        return not self.name_filter or self.name_filter in name
+
+    def run(
+        self,
+        name: str,
+        func: Callable[[], object],
+        bytes_per_op: Optional[int] = None,
+    ) -> Optional[BenchmarkResult]:
+        """
+        Time a function.
+
+        The loop count is calibrated so a round lasts at least min_round_time,
+        then the median and minimum of several rounds are reported.
+
+        Args:
+            name: Benchmark name, dotted by area
+            func: Operation to time
+            bytes_per_op: Bytes processed per call, to report throughput
+
+        Returns:
+            BenchmarkResult, or None if filtered out
+        """
+        if not self.wants(name):
+            return None
+
+        loops = 1
+        while True:
+            elapsed = self._time_loops(func, loops)
+            if elapsed >= self.min_round_time or loops >= MAX_LOOPS:
+                break
+            estimate = int(loops * self.min_round_time * 1.2 / max(elapsed, 1e-9))
+            loops = min(MAX_LOOPS, max(loops * 2, estimate))
+
+        timings = [self._time_loops(func, loops) / loops for _ in range(self.rounds)]
+        result = BenchmarkResult(
+            name=name,
+            loops=loops,
+            median_us=statistics.median(timings) * 1e6,
+            min_us=min(timings) * 1e6,
+        )
+        if bytes_per_op:
+            result.extra["mb_per_s"] = round(
+                bytes_per_op / (result.median_us / 1e6) / 1e6, 1
+            )
+
+        self.results.append(result)
+        print(f"{name:<60} {result.median_us:>12.2f} µs  ({loops} loops)")
+        return result
+
+    def record(
+        self, name: str, seconds: float, bytes_processed: Optional[int] = None
+    ) -> Optional[BenchmarkResult]:
+        """
+        Record a single measured operation that is too slow to repeat.
+
+        Args:
+            name: Benchmark name
+            seconds: Measured duration
+            bytes_processed: Bytes processed by the operation
+
+        Returns:
+            BenchmarkResult, or None if filtered out
+        """
+        if not self.wants(name):
+            return None
+
+        result = BenchmarkResult(
+            name=name, loops=1, median_us=seconds * 1e6, min_us=seconds * 1e6
+        )
+        if bytes_processed:
+            result.extra["mb_per_s"] = round(bytes_processed / seconds / 1e6, 1)
+
+        self.results.append(result)
+        print(f"{name:<60} {result.median_us:>12.2f} µs  (single run)")
+        return result
+
+    @staticmethod
+    def _time_loops(func: Callable[[], object], loops: int) -> float:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+
+    def to_dict(self) -> Dict:
+        """Convert all results to the JSON report format."""
+        return {
+            "meta": {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "numpy": np.__version__,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": {result.name: result.to_dict() for result in self.results},
+        }
+
+
+def save_results(data: Dict, path: Path) -> None:
+    """Write a JSON report."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def compare_to_baseline(
+    current: Dict, baseline: Dict, threshold: float
+) -> List[str]:
+    """
+    Compare results against a baseline report.
+
+    The fastest round is compared, since it is the least affected by other
+    load on the machine, falling back to the median for reports without it.
+
+    Args:
+        current: Report of this run
+        baseline: Stored baseline report
+        threshold: Allowed slowdown as a fraction (0.2 = 20% slower)
+
+    Returns:
+        Descriptions of every benchmark that regressed beyond the threshold
+    """
+    regressions = []
+    baseline_results = baseline.get("results", {})
+
+    print(f"\n{'benchmark':<60} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current.get("results", {}).items():
+        reference = baseline_results.get(name)
+        if not reference:
+            continue
+        key = "median_us"
+        if reference.get("min_us") and "min_us" in result:
+            key = "min_us"
+        if not reference.get(key):
+            continue
+
+        before, after = reference[key], result[key]
+        ratio = after / before
+        marker = ""
+        if ratio > 1 + threshold and after - before >= MIN_REGRESSION_US:
+            marker = "  REGRESSION"
+            regressions.append(
+                f"{name}: {before:.2f} µs → {after:.2f} µs "
+                f"({(ratio - 1) * 100:+.0f}%)"
+            )
+
+        print(
+            f"{name:<60} {before:>12.2f} {after:>12.2f} "
+            f"{(ratio - 1) * 100:>+7.0f}%{marker}"
+        )
+
+    return regressions
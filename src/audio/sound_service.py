@@ -6,21 +6,25 @@ import logging
 import os
 import winsound
 from pathlib import Path
+from typing import Optional
 
 from src.config.settings import AppSettings
+from src.core.workers import SOUND, WorkerPool
 
 
 class SoundService:
     """Service for playing audio feedback sounds using winsound."""
 
-    def __init__(self, settings: AppSettings):
+    def __init__(self, settings: AppSettings, workers: Optional[WorkerPool] = None):
         """
         Initialize the sound service.
 
         Args:
             settings: Application settings containing sound file paths
+            workers: Worker pool to play sounds on, played inline if not given
         """
         self.settings = settings
+        self.workers = workers
         self._sound_paths = {}
         self._load_sound_paths()
 
@@ -71,12 +75,25 @@ class SoundService:
             logging.warning("[SoundService] Sound file not found: %s", full_path)
 
     def play_sound(self, sound_name: str):
-        """Play a sound by name (start, ready, saved, failed)."""
+        """
+        Play a sound by name (start, ready, saved, failed).
+
+        PlaySound blocks until the sound has finished, so sounds are played on
+        the worker pool's sound queue when available.
+        """
         if sound_name not in self._sound_paths:
             logging.debug("[SoundService] Sound %s not available", sound_name)
             return
 
         sound_path = self._sound_paths[sound_name]
+        if self.workers:
+            self.workers.submit(SOUND, self._play_file, sound_path)
+        else:
+            self._play_file(sound_path)
+
+    @staticmethod
+    def _play_file(sound_path: str) -> None:
+        """Play a sound file, blocking until it finishes."""
         winsound.PlaySound(sound_path, winsound.SND_FILENAME | winsound.SND_NODEFAULT)
 
     def play_start(self):
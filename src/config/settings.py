@@ -7,7 +7,7 @@ import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import toml
 
@@ -27,6 +27,9 @@ class ConfigValidator:
 
     VALID_GAMES = {"IIDXINF", "SDVXEAC", "IIDX31", "IIDX32", "SDVXEG", "BMS"}
     VALID_STATES = {"Select", "Playing", "Result", "Default"}
+    VALID_INTERVAL_STATES = {"Select", "Playing", "Result", "Unknown"}
+    VALID_RUNTIMES = {"threads", "asyncio"}
+    VALID_CAPTURE_MODES = {"record", "replay_buffer"}
     VALID_VIDEO_KEYS = {"Base", "Output", "FPS"}
     KEY_PATTERN = re.compile(
         r"^(?:(?:ctrl|alt|shift|cmd|win)\+)*"
@@ -155,6 +158,21 @@ class ConfigValidator:
 
         return str_val
 
+    @staticmethod
+    def validate_choice(
+        value: Any, field_name: str, choices: Set[str], default: str
+    ) -> str:
+        """Validate a string against a set of allowed values."""
+        str_val = ConfigValidator.validate_string(value, field_name, default).lower()
+
+        if str_val not in choices:
+            raise ValidationError(
+                f"Invalid value '{str_val}' for {field_name}. "
+                f"Valid values: {', '.join(sorted(choices))}"
+            )
+
+        return str_val
+
     @staticmethod
     def validate_keyboard_key(
         value: Any, field_name: str, default: str = "space"
@@ -250,6 +268,29 @@ class ConfigValidator:
 
         return validated_scenes
 
+    @staticmethod
+    def validate_state_intervals(value: Any, field_name: str) -> Dict[str, float]:
+        """Validate per-state detection intervals."""
+        if value is None:
+            return {}
+
+        if not isinstance(value, dict):
+            raise ValidationError(f"{field_name} must be a dictionary")
+
+        validated_intervals = {}
+        for state, interval in value.items():
+            if state not in ConfigValidator.VALID_INTERVAL_STATES:
+                raise ValidationError(
+                    f"Invalid state '{state}' in {field_name}. "
+                    f"Valid states: {', '.join(sorted(ConfigValidator.VALID_INTERVAL_STATES))}"
+                )
+
+            validated_intervals[state] = ConfigValidator.validate_float(
+                interval, f"{field_name}.{state}", min_val=0.01, max_val=10.0
+            )
+
+        return validated_intervals
+
     @staticmethod
     def validate_video(value: Any, field_name: str) -> Dict[str, Dict[str, str]]:
         """Validate video settings configuration structure with support for default values."""
@@ -378,11 +419,17 @@ class AppSettings:
 
     detection_interval: float = 0.25
     detections_required: int = 2
+    region_capture: bool = True
+    state_intervals: Dict[str, float] = None
+    idle_interval: float = 2.0
+    trace_dir: str = ""
+    runtime: str = "threads"
 
     result_wait: float = 1.5
     organize_by_game: bool = True
     save_thumbnails: bool = True
     scene_change_delay: float = 0.3
+    capture_mode: str = "record"
 
     scenes: Dict[str, Dict[str, str]] = None
     video: Dict[str, Dict[str, str]] = None
@@ -393,6 +440,37 @@ class AppSettings:
             self.scenes = {}
         if self.video is None:
             self.video = {}
+        if self.state_intervals is None:
+            self.state_intervals = {}
+
+    @property
+    def uses_replay_buffer(self) -> bool:
+        """Check if plays are captured by saving the OBS replay buffer."""
+        return self.capture_mode == "replay_buffer"
+
+    @property
+    def idle_mode_enabled(self) -> bool:
+        """Check if detection slows down while no configured game is running."""
+        return self.idle_interval > 0
+
+    def get_detection_interval(
+        self, state: Optional[str] = None, idle: bool = False
+    ) -> float:
+        """
+        Get the detection interval to use while in a given state.
+
+        Args:
+            state: Current game state, or None if no game is active
+            idle: Whether no configured game is running
+
+        Returns:
+            The idle heartbeat while idle, otherwise the interval from
+            [detection.state_intervals], falling back to the regular detection
+            interval
+        """
+        if idle and self.idle_mode_enabled:
+            return self.idle_interval
+        return self.state_intervals.get(state, self.detection_interval)
 
     def get_scene_name(self, state: str = "", game: str = "") -> Optional[str]:
         """
@@ -447,12 +525,18 @@ class AppSettings:
             "detection": {
                 "interval": self.detection_interval,
                 "detections_required": self.detections_required,
+                "region_capture": self.region_capture,
+                "state_intervals": self.state_intervals,
+                "idle_interval": self.idle_interval,
+                "trace_dir": self.trace_dir,
+                "runtime": self.runtime,
             },
             "recording": {
                 "result_wait": self.result_wait,
                 "organize_by_game": self.organize_by_game,
                 "save_thumbnails": self.save_thumbnails,
                 "scene_change_delay": self.scene_change_delay,
+                "capture_mode": self.capture_mode,
             },
         }
 
@@ -614,6 +698,31 @@ class ConfigManager:
                     min_val=1,
                     max_val=20,
                 ),
+                region_capture=ConfigValidator.validate_bool(
+                    detection_config.get("region_capture"),
+                    "detection.region_capture",
+                    True,
+                ),
+                state_intervals=ConfigValidator.validate_state_intervals(
+                    detection_config.get("state_intervals"),
+                    "detection.state_intervals",
+                ),
+                idle_interval=ConfigValidator.validate_float(
+                    detection_config.get("idle_interval"),
+                    "detection.idle_interval",
+                    2.0,
+                    min_val=0.0,
+                    max_val=60.0,
+                ),
+                trace_dir=ConfigValidator.validate_string(
+                    detection_config.get("trace_dir"), "detection.trace_dir", ""
+                ),
+                runtime=ConfigValidator.validate_choice(
+                    detection_config.get("runtime"),
+                    "detection.runtime",
+                    ConfigValidator.VALID_RUNTIMES,
+                    "threads",
+                ),
                 # Recording section validation
                 result_wait=ConfigValidator.validate_float(
                     recording_config.get("result_wait"),
@@ -639,6 +748,12 @@ class ConfigManager:
                     min_val=0.0,
                     max_val=5.0,
                 ),
+                capture_mode=ConfigValidator.validate_choice(
+                    recording_config.get("capture_mode"),
+                    "recording.capture_mode",
+                    ConfigValidator.VALID_CAPTURE_MODES,
+                    "record",
+                ),
                 # Scene configuration validation
                 scenes=ConfigValidator.validate_scenes(scenes, "scenes"),
                 # Video settings configuration validation
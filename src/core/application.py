@@ -12,6 +12,7 @@ from typing import Optional
 import keyboard
 from src.config import AppSettings
 from src.core.interfaces import IDetectionEngine
+from src.core.ticker import MODE_ACTIVE, MODE_IDLE, DeadlineTicker
 from src import __version__
 
 from .container import Container
@@ -68,8 +69,15 @@ class Application:
             logging.error("Detection engine not available - cannot run")
             return
 
-        detection_engine = self.container.get("IDetectionEngine")
         settings = self.container.get("AppSettings")
+        if settings.runtime == "asyncio":
+            self._run_async()
+            return
+
+        detection_engine = self.container.get("IDetectionEngine")
+        scheduler = self.container.get("Scheduler")
+        pipeline_metrics = self.container.get("PipelineMetrics")
+        ticker = DeadlineTicker()
 
         try:
             logging.info(
@@ -78,8 +86,16 @@ class Application:
 
             while not self._shutdown_requested:
                 try:
-                    detection_engine.detect_and_control()
-                    time.sleep(settings.detection_interval)
+                    scheduler.run_pending()
+                    result = detection_engine.detect_and_control()
+                    pipeline_metrics.maybe_dump()
+
+                    idle = bool(result.metadata.get("idle"))
+                    ticker.wait(
+                        settings.get_detection_interval(result.state, idle),
+                        scheduler,
+                        MODE_IDLE if idle else MODE_ACTIVE,
+                    )
 
                 except ConnectionRefusedError:
                     logging.error(
@@ -87,6 +103,30 @@ class Application:
                         settings.obs_timeout,
                     )
                     time.sleep(settings.obs_timeout)
+                    ticker.reset()
+
+        except KeyboardInterrupt:
+            logging.info("Shutdown requested by user")
+        except Exception as e:
+            logging.error("Unexpected error in main loop: %s", e)
+        finally:
+            self.shutdown()
+
+    def _run_async(self) -> None:
+        """Run the main loop on the asyncio runtime."""
+        from src.core.async_runtime import AsyncRuntime
+
+        runtime = AsyncRuntime(
+            self.container,
+            on_save_hotkey=self.save_lastplay,
+            should_stop=lambda: self._shutdown_requested,
+        )
+
+        try:
+            logging.info(
+                "SIGMArec is running... Press Ctrl+C with the window focused to exit at any time"
+            )
+            runtime.run()
 
         except KeyboardInterrupt:
             logging.info("Shutdown requested by user")
@@ -177,6 +217,10 @@ class Application:
             logging.warning("[Application] Settings not available for hotkeys")
             return
 
+        # The asyncio runtime listens for hotkeys through keyboard hooks
+        if self.container.get("AppSettings").runtime == "asyncio":
+            return
+
         self.hotkey_running = True
         self.hotkey_thread = threading.Thread(
             target=self._hotkey_loop, daemon=True, name="HotkeyMonitor"
@@ -0,0 +1,327 @@
+"""
+Optional asyncio runtime for the main loop.
+
+Runs the detection tick, scheduled timers, the OBS keep-alive, OBS events
+and hotkeys as tasks on a single event loop instead of a blocking loop plus
+helper threads. Blocking Win32, mss, psutil and websocket calls are sent to a
+bounded thread pool, while file operations, encoding and sounds stay on the
+shared worker pool.
+
+Everything that touches application state (detection ticks, timers, OBS
+event handlers and hotkey actions) runs one at a time, in the order it was
+queued, on a single dedicated thread, like it would on the threaded runtime's
+main loop. That thread also keeps thread-bound resources such as the WMI
+connection and mss handles in one place. OBS events and hotkey presses
+share one queue, so a save never runs ahead of the recording stop that came
+before it. OBS events are never dropped, since losing a recording stop would
+lose the play, while queued hotkey presses are capped so a burst of them can
+not pile up without bound.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import keyboard
+
+from src.core.ticker import MODE_ACTIVE, MODE_IDLE, DeadlineTicker
+
+from .container import Container
+
+T = TypeVar("T")
+
+MAX_BLOCKING_WORKERS = 4
+MAX_PENDING_HOTKEYS = 32
+# Queued OBS events at which a warning about slow handlers is logged
+EVENT_BACKLOG_WARNING = 256
+
+# Kinds of calls handed over from other threads
+OBS_EVENT = "obs-event"
+HOTKEY = "hotkey"
+
+
+def _init_state_thread() -> None:
+    """Initialize COM on the state thread, which WMI lookups need."""
+    try:
+        import pythoncom
+    except ImportError:
+        return
+    pythoncom.CoInitialize()
+
+
+class AsyncRuntime:
+    """Runs the application's periodic and event-driven work on one event loop."""
+
+    def __init__(
+        self,
+        container: Container,
+        on_save_hotkey: Callable[[], None],
+        should_stop: Callable[[], bool],
+        max_workers: int = MAX_BLOCKING_WORKERS,
+    ):
+        """
+        Initialize the runtime.
+
+        Args:
+            container: Configured service container
+            on_save_hotkey: Called when the save hotkey is pressed
+            should_stop: Checked after each tick to end the loop
+            max_workers: Size of the thread pool for blocking calls
+        """
+        self.settings = container.get("AppSettings")
+        self.engine = container.get("IDetectionEngine")
+        self.scheduler = container.get("Scheduler")
+        self.obs = container.get("IOBSController")
+        self.metrics = container.get("PipelineMetrics")
+        self.on_save_hotkey = on_save_hotkey
+        self.should_stop = should_stop
+
+        self.ticker = DeadlineTicker()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="SIGMArec-Blocking"
+        )
+        self._state_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="SIGMArec-State",
+            initializer=_init_state_thread,
+        )
+        self._max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._timers_changed: Optional[asyncio.Event] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._handoffs: Optional[asyncio.Queue] = None
+        self._queued_hotkeys = 0
+        self._hotkeys: list = []
+        self._hotkey_held = False
+
+    def run(self) -> None:
+        """Run the event loop until shutdown is requested."""
+        asyncio.run(self._main())
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking call on the thread pool.
+
+        Callers wait for a free worker, so at most max_workers blocking calls
+        run at once.
+
+        Args:
+            func: Blocking function
+            *args: Arguments for the function
+
+        Returns:
+            The function's result
+        """
+        async with self._slots:
+            return await self._loop.run_in_executor(self._executor, func, *args)
+
+    async def run_serialized(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking call that touches application state.
+
+        Such calls run one at a time, in order, on the state thread. Timers
+        are re-armed afterwards since the call may have scheduled or
+        cancelled some.
+
+        Args:
+            func: Blocking function
+            *args: Arguments for the function
+
+        Returns:
+            The function's result
+        """
+        try:
+            return await self._loop.run_in_executor(
+                self._state_executor, func, *args
+            )
+        finally:
+            self._timers_changed.set()
+
+    async def _main(self) -> None:
+        """Start every task and wait for shutdown."""
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self._max_workers)
+        self._timers_changed = asyncio.Event()
+        self._stopped = asyncio.Event()
+        self._handoffs = asyncio.Queue()
+
+        self.obs.set_event_dispatcher(self._dispatch_event)
+        self._install_hotkeys()
+
+        tasks = [
+            asyncio.create_task(self._detection_loop(), name="detection"),
+            asyncio.create_task(self._timer_loop(), name="timers"),
+            asyncio.create_task(self._obs_keep_alive(), name="obs-keep-alive"),
+            asyncio.create_task(self._handoff_loop(), name="handoffs"),
+        ]
+        stopped = asyncio.create_task(self._stopped.wait(), name="stop")
+
+        try:
+            done, _ = await asyncio.wait(
+                tasks + [stopped], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task is not stopped and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            self._remove_hotkeys()
+            self.obs.set_event_dispatcher(None)
+
+            for task in tasks + [stopped]:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._drain_handoffs()
+
+            self._state_executor.shutdown(wait=True)
+            self._executor.shutdown(wait=True)
+            logging.debug("[AsyncRuntime] Stopped")
+
+    async def _detection_loop(self) -> None:
+        """Run detection ticks on deadlines, like Application.run does."""
+        while not self.should_stop():
+            try:
+                result = await self.run_serialized(self.engine.detect_and_control)
+            except ConnectionRefusedError:
+                logging.error(
+                    "[OBS] Connection lost - retrying in %s seconds...",
+                    self.settings.obs_timeout,
+                )
+                await asyncio.sleep(self.settings.obs_timeout)
+                self.ticker.reset()
+                continue
+
+            self.metrics.maybe_dump()
+
+            idle = bool(result.metadata.get("idle"))
+            mode = MODE_IDLE if idle else MODE_ACTIVE
+            deadline = self.ticker.advance(
+                self.settings.get_detection_interval(result.state, idle), mode
+            )
+
+            remaining = deadline - self.ticker.clock()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                self.ticker.record_wakeup(mode)
+            self.ticker.maybe_report()
+
+        self._stopped.set()
+
+    async def _timer_loop(self) -> None:
+        """Run scheduled tasks when they fall due."""
+        while True:
+            delay = self.scheduler.time_until_next()
+            self._timers_changed.clear()
+
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._timers_changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            next_task = self.scheduler.time_until_next()
+            if next_task is not None and next_task <= 0:
+                await self.run_serialized(self.scheduler.run_pending)
+
+    async def _obs_keep_alive(self) -> None:
+        """Connect to OBS and keep the connection alive."""
+        connected = await self.run_blocking(self.obs.connect_once)
+        delay = self.settings.obs_timeout if connected else 1.0
+
+        while True:
+            await asyncio.sleep(delay)
+            delay = await self.run_blocking(self.obs.check_connection)
+
+    async def _handoff_loop(self) -> None:
+        """Run OBS event handlers and hotkey actions in the order they arrived."""
+        while True:
+            kind, queued_at, func = await self._handoffs.get()
+            if kind == OBS_EVENT:
+                self.metrics.record_ns(
+                    "obs.event.wait", time.perf_counter_ns() - queued_at
+                )
+            await self._run_handoff(kind, func)
+
+    async def _drain_handoffs(self) -> None:
+        """Run the calls still queued at shutdown."""
+        # Let hand-overs already scheduled from other threads arrive first
+        await asyncio.sleep(0)
+        while not self._handoffs.empty():
+            kind, _, func = self._handoffs.get_nowait()
+            await self._run_handoff(kind, func)
+
+    async def _run_handoff(self, kind: str, func: Callable[[], None]) -> None:
+        """Run a handed over call on the state thread, logging failures."""
+        try:
+            await self.run_serialized(func)
+        except Exception as e:
+            logging.error("[AsyncRuntime] %s handler failed: %s", kind, e)
+        finally:
+            if kind == HOTKEY:
+                self._queued_hotkeys -= 1
+
+    def _queue_handoff(
+        self, kind: str, func: Callable[[], None], queued_at: int
+    ) -> None:
+        """Queue a call handed over from another thread, on the loop."""
+        if kind == HOTKEY:
+            if self._queued_hotkeys >= MAX_PENDING_HOTKEYS:
+                logging.warning("[AsyncRuntime] Too many pending hotkeys, dropped one")
+                return
+            self._queued_hotkeys += 1
+
+        self._handoffs.put_nowait((kind, queued_at, func))
+        if kind == OBS_EVENT and self._handoffs.qsize() == EVENT_BACKLOG_WARNING:
+            logging.warning(
+                "[AsyncRuntime] %d OBS events waiting for their handlers",
+                EVENT_BACKLOG_WARNING,
+            )
+
+    def _call_from_thread(self, kind: str, func: Callable[[], None]) -> None:
+        """Hand a call over to the loop, or run it here if the loop is gone."""
+        try:
+            self._loop.call_soon_threadsafe(
+                self._queue_handoff, kind, func, time.perf_counter_ns()
+            )
+        except RuntimeError:
+            func()
+
+    def _dispatch_event(self, handler: Callable[[], None]) -> None:
+        """Queue an OBS event handler from the websocket thread."""
+        self._call_from_thread(OBS_EVENT, handler)
+
+    def _install_hotkeys(self) -> None:
+        """Listen for the save hotkey through keyboard hooks instead of polling."""
+        try:
+            self._hotkeys = [
+                keyboard.add_hotkey(self.settings.save_key, self._on_hotkey_pressed),
+                keyboard.add_hotkey(
+                    self.settings.save_key,
+                    self._on_hotkey_released,
+                    trigger_on_release=True,
+                ),
+            ]
+        except Exception as e:
+            logging.warning("[AsyncRuntime] Failed to register save hotkey: %s", e)
+
+    def _remove_hotkeys(self) -> None:
+        """Remove the hotkey hooks."""
+        for hotkey in self._hotkeys:
+            try:
+                keyboard.remove_hotkey(hotkey)
+            except (KeyError, ValueError):
+                pass
+        self._hotkeys = []
+
+    def _on_hotkey_pressed(self) -> None:
+        """Trigger a save once per key press, ignoring key repeat."""
+        if self._hotkey_held:
+            return
+        self._hotkey_held = True
+        self._call_from_thread(HOTKEY, self.on_save_hotkey)
+
+    def _on_hotkey_released(self) -> None:
+        """Allow the next press to trigger a save."""
+        self._hotkey_held = False
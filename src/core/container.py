@@ -2,6 +2,7 @@
 Dependency injection container for SIGMArec components.
 """
 
+import functools
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict
@@ -93,8 +94,15 @@ class Container:
         self.register_singleton("Games", games)
         logging.debug("[Container] Loaded %d games", len(games))
 
-        # Step 3: Initialize audio service
-        sound_service = SoundService(settings)
+        # Step 3: Initialize metrics, worker pool and audio service
+        from src.core.metrics import PipelineMetrics
+        from src.core.workers import WorkerPool
+
+        pipeline_metrics = PipelineMetrics()
+        self.register_singleton("PipelineMetrics", pipeline_metrics)
+        worker_pool = WorkerPool(pipeline_metrics=pipeline_metrics)
+        self.register_singleton("WorkerPool", worker_pool)
+        sound_service = SoundService(settings, workers=worker_pool)
         self.register_singleton("SoundService", sound_service)
 
         # Step 4: Initialize screen capture service
@@ -103,16 +111,41 @@ class Container:
         screen_capture_service = ScreenCaptureService()
         self.register_singleton("ScreenCaptureService", screen_capture_service)
 
-        # Step 5: Initialize game detector
+        # Step 5: Initialize process cache, focus tracker, log service, context provider and game detector
+        from src.detection.context import DetectionContextProvider
         from src.detection.detectors.game_detector import GameDetector
-
-        game_detector = GameDetector(games, screen_capture_service)
+        from src.detection.focus import create_focus_tracker
+        from src.detection.log_service import LogService
+        from src.detection.process_metadata import ProcessMetadataCache
+
+        process_cache = ProcessMetadataCache()
+        self.register_singleton("ProcessMetadataCache", process_cache)
+        focus_tracker = create_focus_tracker(process_cache)
+        self.register_singleton("IFocusTracker", focus_tracker)
+        log_service = LogService(process_cache, pipeline_metrics=pipeline_metrics)
+        self.register_singleton("LogService", log_service)
+        context_provider = DetectionContextProvider(focus_tracker, log_service)
+        self.register_singleton("DetectionContextProvider", context_provider)
+
+        game_detector = GameDetector(games, screen_capture_service, context_provider)
         self.register_singleton("GameDetector", game_detector)
 
         # Step 6: Initialize OBS controller
+        from src.core.workers import OBS_EVENTS
         from src.obs import OBSController
 
-        obs_controller = OBSController.connect(settings)
+        # Handle OBS events in order on their own worker so slow handlers never
+        # hold up the websocket thread. The asyncio runtime dispatches them
+        # onto its event loop instead.
+        event_dispatcher = None
+        if settings.runtime != "asyncio":
+            event_dispatcher = functools.partial(worker_pool.submit, OBS_EVENTS)
+
+        obs_controller = OBSController.connect(
+            settings,
+            background=settings.runtime != "asyncio",
+            event_dispatcher=event_dispatcher,
+        )
         self.register_singleton("IOBSController", obs_controller)
 
         # Step 7: Initialize recording manager
@@ -122,22 +155,50 @@ class Container:
             settings=settings,
             sound_service=sound_service,
             screen=screen_capture_service,
+            workers=worker_pool,
         )
         self.register_singleton("IRecordingManager", recording_manager)
 
-        # Step 8: Initialize processors
+        # Step 8: Initialize scheduler, latency tracking and processors
+        from src.core.scheduler import Scheduler
+        from src.detection.latency import StartLatencyTracker
         from src.detection.processors.video_processor import VideoProcessor
 
+        scheduler = Scheduler()
+        self.register_singleton("Scheduler", scheduler)
+        latency_tracker = StartLatencyTracker()
+        obs_controller.register_event_handler(latency_tracker)
+        self.register_singleton("StartLatencyTracker", latency_tracker)
+
         video_processor = VideoProcessor(obs_controller, settings)
         self.register_singleton("VideoProcessor", video_processor)
         scene_processor = SceneProcessor(obs_controller, settings)
         self.register_singleton("SceneProcessor", scene_processor)
         recording_processor = RecordingProcessor(
-            obs_controller, settings, scene_processor, sound_service
+            obs_controller,
+            settings,
+            scene_processor,
+            sound_service,
+            scheduler,
+            latency_tracker,
+            workers=worker_pool,
+            video_processor=video_processor,
         )
         self.register_singleton("RecordingProcessor", recording_processor)
 
-        # Step 9: Initialize detection engine
+        # Step 9: Initialize process monitor, optional trace recording and detection engine
+        from src.detection.process_monitor import ProcessMonitor
+
+        process_monitor = ProcessMonitor(games)
+        self.register_singleton("ProcessMonitor", process_monitor)
+
+        trace_recorder = None
+        if settings.trace_dir:
+            from src.replay.trace import TraceRecorder
+
+            trace_recorder = TraceRecorder(settings.trace_dir, screen_capture_service)
+            self.register_singleton("TraceRecorder", trace_recorder)
+
         detection_engine = DetectionCoordinator(
             obs_controller=obs_controller,
             recording_manager=recording_manager,
@@ -147,6 +208,11 @@ class Container:
             video_processor=video_processor,
             scene_processor=scene_processor,
             recording_processor=recording_processor,
+            context_provider=context_provider,
+            latency_tracker=latency_tracker,
+            trace_recorder=trace_recorder,
+            process_monitor=process_monitor,
+            pipeline_metrics=pipeline_metrics,
         )
         self.register_singleton("IDetectionEngine", detection_engine)
 
@@ -157,6 +223,11 @@ class Container:
         """Clean up all registered services."""
         logging.info("Cleaning up services")
 
+        # Drain queued renames, thumbnails and OBS event handlers first, while
+        # the services they use are still up
+        if self.has("WorkerPool"):
+            self.get("WorkerPool").cleanup()
+
         # Run cleanup or shutdown in reverse order from singleton registration
         for service_name in reversed(list(self._singletons.keys())):
             service = self._singletons[service_name]
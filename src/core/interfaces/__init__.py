@@ -3,6 +3,7 @@ Core interfaces for SIGMArec components.
 """
 
 from .detection import (
+    DetectionContext,
     DetectionResult,
     StateTransition,
     IDetectionEngine,
@@ -13,6 +14,7 @@ from .obs import IOBSController, IOBSEventHandler
 from .recording import IRecordingManager, IRecordingStorage
 
 __all__ = [
+    "DetectionContext",
     "DetectionResult",
     "StateTransition",
     "IDetectionEngine",
@@ -2,9 +2,10 @@
 Detection interfaces for game state detection and management.
 """
 
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.games import Game
 
@@ -21,13 +22,66 @@ class DetectionResult:
 
 @dataclass
 class StateTransition:
-    """Represents a state transition with context."""
+    """
+    Represents a state transition with context.
+
+    Besides the wall clock timestamp, transitions carry monotonic stamps of
+    when they were confirmed and when the new state was first seen, so
+    latency to later events can be measured.
+    """
 
     from_state: Optional[str]
     to_state: str
     game: Game
     timestamp: float
     triggered_patterns: List[str]
+    monotonic: float = field(default_factory=time.monotonic)
+    detected_at: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class DetectionContext:
+    """
+    Snapshot of the foreground window shared by every consumer of one tick.
+
+    Foreground lookups and log reads are resolved once per tick and reused
+    by the game detector, state detectors and state manager.
+    """
+
+    window_title: str
+    timestamp: float
+    pid: Optional[int] = None
+    process_name: Optional[str] = None
+    jar_path: Optional[str] = None
+    log_loader: Optional[Callable[[int, str], List[Dict[str, str]]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _log_entries: Dict[str, Tuple[Dict[str, str], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def is_java(self) -> bool:
+        """Check if the foreground process is Java with a known JAR path."""
+        return self.jar_path is not None
+
+    def get_log_entries(self, log_filename: str) -> Tuple[Dict[str, str], ...]:
+        """
+        Get the log entries of a Java game's log file, read at most once per tick.
+
+        Args:
+            log_filename: Name of the log file next to the JAR
+
+        Returns:
+            Tuple of structured log entries, empty if not available
+        """
+        if log_filename not in self._log_entries:
+            entries: Tuple[Dict[str, str], ...] = ()
+            if self.pid is not None and self.jar_path and self.log_loader:
+                entries = tuple(self.log_loader(self.pid, log_filename))
+            self._log_entries[log_filename] = entries
+
+        return self._log_entries[log_filename]
 
 
 class IDetectionEngine(ABC):
@@ -54,7 +108,9 @@ class IGameDetector(ABC):
     """Interface for detecting which game is currently active."""
 
     @abstractmethod
-    def get_active_game(self) -> Optional[Game]:
+    def get_active_game(
+        self, context: Optional[DetectionContext] = None
+    ) -> Optional[Game]:
         """Get the currently active game."""
 
     @abstractmethod
@@ -66,7 +122,9 @@ class IStateDetector(ABC):
     """Interface for detecting game states."""
 
     @abstractmethod
-    def detect_state(self, game: Game) -> Optional[str]:
+    def detect_state(
+        self, game: Game, context: Optional[DetectionContext] = None
+    ) -> Optional[str]:
         """Detect the current state for a given game."""
 
     @abstractmethod
@@ -3,7 +3,7 @@ OBS integration interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, ContextManager, List, Optional
 
 if TYPE_CHECKING:
     from src.obs.videosettings import OBSVideoSettings
@@ -42,6 +42,27 @@ class IOBSController(ABC):
     def stop_recording(self) -> None:
         """Stop recording."""
 
+    @property
+    @abstractmethod
+    def replay_buffer_active(self) -> bool:
+        """Check if the replay buffer is running."""
+
+    @abstractmethod
+    def start_replay_buffer(self) -> None:
+        """Start the replay buffer."""
+
+    @abstractmethod
+    def stop_replay_buffer(self) -> None:
+        """Stop the replay buffer."""
+
+    @abstractmethod
+    def save_replay_buffer(self) -> None:
+        """Save the contents of the replay buffer."""
+
+    @abstractmethod
+    def get_replay_buffer_length(self) -> Optional[float]:
+        """Get the replay buffer length in seconds."""
+
     @abstractmethod
     def get_video_settings(self) -> Optional["OBSVideoSettings"]:
         """Get current video settings."""
@@ -69,6 +90,10 @@ class IOBSController(ABC):
     ) -> None:
         """Set video settings."""
 
+    @abstractmethod
+    def batched(self) -> ContextManager[None]:
+        """Send the scene and video settings changes of a block as one batch."""
+
     @abstractmethod
     def register_event_handler(self, handler: IOBSEventHandler) -> None:
         """Register an event handler."""
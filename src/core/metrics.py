@@ -0,0 +1,255 @@
+"""
+Lightweight latency instrumentation for the detection pipeline.
+
+Stages of a detection tick are wrapped in named spans. Each span name feeds a
+rolling log-bucketed histogram (in the spirit of HdrHistogram) so p50, p95,
+p99 and max can be reported with bounded memory and a handful of integer
+operations per sample, cheap enough to leave on in production.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Each power of two is split into this many buckets, giving ~3% relative error
+SUB_BUCKETS = 32
+# Values are recorded in microseconds, up to 2^MAX_EXPONENT µs (~1.2 hours)
+MAX_EXPONENT = 32
+BUCKET_COUNT = (MAX_EXPONENT + 1) * SUB_BUCKETS
+
+ROLLING_WINDOW = 60.0
+DUMP_INTERVAL = 60.0
+PERCENTILES = (50.0, 95.0, 99.0)
+
+
+def _bucket_index(micros: int) -> int:
+    """Map a value in microseconds to its histogram bucket."""
+    if micros < 1:
+        return 0
+
+    mantissa, exponent = math.frexp(micros)
+    index = exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+    return min(index, BUCKET_COUNT - 1)
+
+
+def _bucket_value(index: int) -> float:
+    """Get the upper bound of a bucket in microseconds."""
+    exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub_bucket + 1) / (2 * SUB_BUCKETS), exponent)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with a fixed number of buckets."""
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.count = 0
+        self.max_micros = 0
+
+    def record(self, micros: int) -> None:
+        """Record one sample in microseconds."""
+        self.counts[_bucket_index(micros)] += 1
+        self.count += 1
+        if micros > self.max_micros:
+            self.max_micros = micros
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples to this one."""
+        if not other.count:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.max_micros = max(self.max_micros, other.max_micros)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a percentile of the recorded samples.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Value in microseconds, 0 if the histogram is empty
+        """
+        if not self.count:
+            return 0.0
+
+        target = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(_bucket_value(index), float(self.max_micros))
+        return float(self.max_micros)
+
+
+class _RollingHistogram:
+    """Pair of histograms covering the current and the previous time window."""
+
+    def __init__(self, window: float, now: float):
+        self.window = window
+        self.current = LatencyHistogram()
+        self.previous = LatencyHistogram()
+        self.window_start = now
+
+    def record(self, micros: int, now: float) -> None:
+        self._rotate(now)
+        self.current.record(micros)
+
+    def combined(self, now: float) -> LatencyHistogram:
+        self._rotate(now)
+        histogram = LatencyHistogram()
+        histogram.merge(self.previous)
+        histogram.merge(self.current)
+        return histogram
+
+    def _rotate(self, now: float) -> None:
+        elapsed = now - self.window_start
+        if elapsed < self.window:
+            return
+
+        if elapsed < 2 * self.window:
+            self.previous = self.current
+        else:
+            self.previous = LatencyHistogram()
+        self.current = LatencyHistogram()
+        self.window_start = now
+
+
+class PipelineMetrics:
+    """
+    Registry of named latency spans.
+
+    Samples cover the last one to two rolling windows, so reports follow the
+    recent behaviour of the pipeline instead of the whole session.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        window: float = ROLLING_WINDOW,
+        dump_interval: float = DUMP_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled: Whether spans record anything
+            window: Length of a rolling window in seconds
+            dump_interval: Seconds between debug log dumps
+            clock: Monotonic time source for window rotation
+        """
+        self.enabled = enabled
+        self.window = window
+        self.dump_interval = dump_interval
+        self.clock = clock
+        self._histograms: Dict[str, _RollingHistogram] = {}
+        self._lock = threading.Lock()
+        self._last_dump = clock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block under a span name.
+
+        Args:
+            name: Span name, dotted by stage (e.g. 'capture.grab')
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record_ns(name, time.perf_counter_ns() - start)
+
+    def record_ns(self, name: str, duration_ns: int) -> None:
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            name: Span name
+            duration_ns: Duration in nanoseconds
+        """
+        if not self.enabled:
+            return
+
+        now = self.clock()
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _RollingHistogram(
+                    self.window, now
+                )
+            histogram.record(duration_ns // 1000, now)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize every span.
+
+        Returns:
+            Mapping of span name to count, p50, p95, p99 and max in milliseconds
+        """
+        now = self.clock()
+        with self._lock:
+            combined = {
+                name: histogram.combined(now)
+                for name, histogram in self._histograms.items()
+            }
+
+        summary = {}
+        for name in sorted(combined):
+            histogram = combined[name]
+            if not histogram.count:
+                continue
+            stats = {"count": histogram.count}
+            for percent in PERCENTILES:
+                stats[f"p{percent:g}"] = round(histogram.percentile(percent) / 1000, 3)
+            stats["max"] = round(histogram.max_micros / 1000, 3)
+            summary[name] = stats
+        return summary
+
+    def maybe_dump(self) -> None:
+        """Log a summary of every span once per dump interval."""
+        if not self.enabled:
+            return
+
+        now = self.clock()
+        if now - self._last_dump < self.dump_interval:
+            return
+        self._last_dump = now
+
+        for name, stats in self.snapshot().items():
+            logging.debug(
+                "[Metrics] %s: n=%d p50=%.2fms p95=%.2fms p99=%.2fms max=%.2fms",
+                name,
+                stats["count"],
+                stats["p50"],
+                stats["p95"],
+                stats["p99"],
+                stats["max"],
+            )
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        Drop recorded samples.
+
+        Args:
+            name: Span to reset, or None to reset every span
+        """
+        with self._lock:
+            if name is None:
+                self._histograms.clear()
+            else:
+                self._histograms.pop(name, None)
+
+
+# The application gets its registry from the Container. This default is only a
+# fallback for components built without one, such as in benchmarks and replays
+metrics = PipelineMetrics()
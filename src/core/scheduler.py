@@ -0,0 +1,158 @@
+"""
+Deferred action scheduling for the detection loop.
+
+Actions such as the delayed stop after a result screen used to sleep on the
+detection thread. They are now queued here with a due time and run by the main
+loop once they are due, so detection keeps ticking in the meantime and pending
+actions can be cancelled when a later transition makes them obsolete.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+
+@dataclass(order=True)
+class ScheduledTask:
+    """A deferred action, ordered by due time then scheduling order."""
+
+    due: float
+    sequence: int
+    name: str = field(compare=False)
+    callback: Callable[[], None] = field(compare=False, repr=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        """Prevent the task from running."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Heap-based scheduler for deferred actions.
+
+    Tasks can be scheduled from any thread. They run on whichever thread calls
+    run_pending, which is the main detection loop.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the scheduler.
+
+        Args:
+            clock: Monotonic time source, replaceable for tests and replays
+        """
+        self.clock = clock
+        self._heap: List[ScheduledTask] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def schedule(
+        self, delay: float, callback: Callable[[], None], name: str = ""
+    ) -> ScheduledTask:
+        """
+        Schedule a callback to run after a delay.
+
+        Args:
+            delay: Seconds from now until the callback is due
+            callback: Action to run
+            name: Name used for logging and for cancelling by name
+
+        Returns:
+            Handle that can be used to cancel the task
+        """
+        task = ScheduledTask(
+            due=self.clock() + max(0.0, delay),
+            sequence=next(self._sequence),
+            name=name,
+            callback=callback,
+        )
+        with self._lock:
+            heapq.heappush(self._heap, task)
+
+        logging.debug("[Scheduler] Scheduled '%s' in %.2fs", name, delay)
+        return task
+
+    def cancel(self, name: str) -> int:
+        """
+        Cancel every pending task with a given name.
+
+        Args:
+            name: Name of the tasks to cancel
+
+        Returns:
+            Number of tasks cancelled
+        """
+        cancelled = 0
+        with self._lock:
+            for task in self._heap:
+                if task.name == name and not task.cancelled:
+                    task.cancel()
+                    cancelled += 1
+
+        if cancelled:
+            logging.debug("[Scheduler] Cancelled %d '%s' task(s)", cancelled, name)
+        return cancelled
+
+    def has_pending(self, name: str) -> bool:
+        """Check if a task with a given name is waiting to run."""
+        with self._lock:
+            return any(
+                task.name == name and not task.cancelled for task in self._heap
+            )
+
+    def time_until_next(self) -> Optional[float]:
+        """
+        Get the time until the next pending task is due.
+
+        Returns:
+            Seconds until the next task (0 if overdue), or None if idle
+        """
+        with self._lock:
+            self._drop_cancelled()
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0].due - self.clock())
+
+    def run_pending(self) -> int:
+        """
+        Run every task that is due.
+
+        Errors raised by a task are logged and do not affect other tasks.
+
+        Returns:
+            Number of tasks that ran
+        """
+        ran = 0
+        now = self.clock()
+
+        while True:
+            with self._lock:
+                self._drop_cancelled()
+                if not self._heap or self._heap[0].due > now:
+                    break
+                task = heapq.heappop(self._heap)
+
+            try:
+                task.callback()
+            except Exception as e:
+                logging.error("[Scheduler] Task '%s' failed: %s", task.name, e)
+            ran += 1
+
+        return ran
+
+    def cleanup(self) -> None:
+        """Drop every pending task."""
+        with self._lock:
+            for task in self._heap:
+                task.cancel()
+            self._heap.clear()
+
+    def _drop_cancelled(self) -> None:
+        """Pop cancelled tasks off the top of the heap. Caller holds the lock."""
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
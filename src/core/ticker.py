@@ -0,0 +1,221 @@
+"""
+Deadline-based pacing for the main detection loop.
+
+Sleeping a fixed interval after each tick makes the real period interval plus
+processing time, so detection latency drifts with capture and log parsing
+cost. The ticker instead targets absolute deadlines on the monotonic clock and
+keeps statistics about ticks that ran late or had to be skipped, as well as
+CPU time and wakeups per loop mode (active detection or idle heartbeat).
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from src.core.scheduler import Scheduler
+
+REPORT_INTERVAL = 60.0
+
+MODE_ACTIVE = "active"
+MODE_IDLE = "idle"
+
+
+@dataclass
+class ModeStats:
+    """Resource usage of the loop while in one mode."""
+
+    ticks: int = 0
+    wakeups: int = 0
+    cpu_time: float = 0.0
+    wall_time: float = 0.0
+
+    @property
+    def cpu_percent(self) -> float:
+        """Process CPU time as a percentage of elapsed time."""
+        return self.cpu_time / self.wall_time * 100 if self.wall_time > 0 else 0.0
+
+    @property
+    def wakeups_per_second(self) -> float:
+        """Average number of times the loop woke up per second."""
+        return self.wakeups / self.wall_time if self.wall_time > 0 else 0.0
+
+
+@dataclass
+class TickStats:
+    """Loop timing statistics since the last report."""
+
+    ticks: int = 0
+    overruns: int = 0
+    skipped: int = 0
+    total_lateness: float = 0.0
+    max_lateness: float = 0.0
+    modes: Dict[str, ModeStats] = field(default_factory=dict)
+
+    def mode(self, name: str) -> ModeStats:
+        """Get the statistics of a loop mode, creating them on first use."""
+        stats = self.modes.get(name)
+        if stats is None:
+            stats = self.modes[name] = ModeStats()
+        return stats
+
+    @property
+    def average_lateness(self) -> float:
+        """Average lateness of overrun ticks, in seconds."""
+        return self.total_lateness / self.overruns if self.overruns else 0.0
+
+
+class DeadlineTicker:
+    """
+    Paces a loop on a fixed grid of monotonic deadlines.
+
+    Each deadline is the previous one plus the interval for the next tick, so
+    processing time does not accumulate. When a tick finishes after its next
+    deadline it counts as an overrun. Deadlines that have passed entirely are
+    skipped rather than run back to back.
+
+    The time between two waits, processing and sleeping included, is charged
+    to the mode passed to the second wait along with the process CPU time
+    spent meanwhile and the number of sleeps.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        report_interval: float = REPORT_INTERVAL,
+        cpu_clock: Callable[[], float] = time.process_time,
+    ):
+        """
+        Initialize the ticker.
+
+        Args:
+            clock: Monotonic time source
+            sleep: Sleep function, replaceable for tests and replays
+            report_interval: Seconds between timing reports in the debug log
+            cpu_clock: Process CPU time source
+        """
+        self.clock = clock
+        self.sleep = sleep
+        self.report_interval = report_interval
+        self.cpu_clock = cpu_clock
+        self.stats = TickStats()
+        self._deadline: Optional[float] = None
+        self._last_report = clock()
+        self._usage_mark = (self._last_report, cpu_clock())
+
+    def reset(self) -> None:
+        """Restart the deadline grid from the current time."""
+        self._deadline = None
+
+    def wait(
+        self,
+        interval: float,
+        scheduler: Optional[Scheduler] = None,
+        mode: str = MODE_ACTIVE,
+    ) -> None:
+        """
+        Sleep until the next deadline.
+
+        Scheduled tasks falling due before the deadline are run on time while
+        waiting.
+
+        Args:
+            interval: Seconds from the previous deadline to the next one
+            scheduler: Scheduler whose due tasks should run while waiting
+            mode: Loop mode the finished tick ran in, for usage statistics
+        """
+        deadline = self.advance(interval, mode)
+        usage = self.stats.mode(mode)
+
+        while True:
+            remaining = deadline - self.clock()
+            if scheduler is not None:
+                next_task = scheduler.time_until_next()
+                if next_task is not None and next_task < remaining:
+                    self.sleep(next_task)
+                    usage.wakeups += 1
+                    scheduler.run_pending()
+                    continue
+
+            if remaining > 0:
+                self.sleep(remaining)
+                usage.wakeups += 1
+            break
+
+        self.maybe_report()
+
+    def advance(self, interval: float, mode: str = MODE_ACTIVE) -> float:
+        """
+        Account for a finished tick and compute the next deadline.
+
+        Used directly by loops that sleep on their own, such as the asyncio
+        runtime. Such loops report their wakeups through record_wakeup.
+
+        Args:
+            interval: Seconds from the previous deadline to the next one
+            mode: Loop mode the finished tick ran in, for usage statistics
+
+        Returns:
+            Next deadline on the ticker's clock
+        """
+        now = self.clock()
+        deadline = (self._deadline if self._deadline is not None else now) + interval
+        self.stats.ticks += 1
+
+        usage = self.stats.mode(mode)
+        usage.ticks += 1
+        self._charge_usage(usage, now)
+
+        if now > deadline:
+            lateness = now - deadline
+            skipped = int(lateness // interval)
+            self.stats.overruns += 1
+            self.stats.skipped += skipped
+            self.stats.total_lateness += lateness
+            self.stats.max_lateness = max(self.stats.max_lateness, lateness)
+            deadline += skipped * interval
+
+        self._deadline = deadline
+        return deadline
+
+    def record_wakeup(self, mode: str = MODE_ACTIVE) -> None:
+        """Count a wakeup of a loop that sleeps on its own."""
+        self.stats.mode(mode).wakeups += 1
+
+    def _charge_usage(self, usage: ModeStats, now: float) -> None:
+        """Charge the time and CPU used since the previous wait to a mode."""
+        cpu_now = self.cpu_clock()
+        last_wall, last_cpu = self._usage_mark
+        usage.wall_time += now - last_wall
+        usage.cpu_time += cpu_now - last_cpu
+        self._usage_mark = (now, cpu_now)
+
+    def maybe_report(self) -> None:
+        """Log timing statistics once per report interval."""
+        now = self.clock()
+        if now - self._last_report < self.report_interval:
+            return
+
+        stats = self.stats
+        logging.debug(
+            "[Loop] %d ticks, %d overruns (avg %.1fms, max %.1fms late), %d skipped",
+            stats.ticks,
+            stats.overruns,
+            stats.average_lateness * 1000,
+            stats.max_lateness * 1000,
+            stats.skipped,
+        )
+        for name, usage in sorted(stats.modes.items()):
+            logging.debug(
+                "[Loop] %s: %d ticks over %.0fs, %.1f wakeups/s, cpu %.2fs (%.1f%%)",
+                name,
+                usage.ticks,
+                usage.wall_time,
+                usage.wakeups_per_second,
+                usage.cpu_time,
+                usage.cpu_percent,
+            )
+
+        self.stats = TickStats()
+        self._last_report = now
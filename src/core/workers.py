@@ -0,0 +1,300 @@
+"""
+Bounded worker pool for blocking side effects.
+
+Moving and deleting recordings, encoding thumbnails and playing sounds can
+take a while on a slow disk or a busy system. Running them inline would stall
+whichever thread triggered them, often the OBS websocket event thread or the
+detection loop. Instead they are submitted to named queues, each served by its
+own worker threads. OBS events are handled the same way, on a queue of their
+own with a single worker so they are handled in the order they arrived.
+
+Queues are bounded. When a queue is full, work that must not be lost runs
+inline on the submitting thread, disposable work such as sounds is dropped,
+and work whose order matters waits for space. Queue wait and run times are
+recorded as pipeline metrics.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.metrics import PipelineMetrics, metrics
+
+FILE_OPS = "file_ops"
+ENCODING = "encoding"
+SOUND = "sound"
+OBS_EVENTS = "obs_events"
+
+DRAIN_TIMEOUT = 5.0
+
+
+@dataclass(frozen=True)
+class QueueSpec:
+    """Configuration of a named work queue."""
+
+    workers: int = 1
+    max_depth: int = 64
+    drop_when_full: bool = False
+    block_when_full: bool = False
+
+
+DEFAULT_QUEUES: Dict[str, QueueSpec] = {
+    FILE_OPS: QueueSpec(workers=1, max_depth=64),
+    ENCODING: QueueSpec(workers=1, max_depth=8),
+    SOUND: QueueSpec(workers=1, max_depth=4, drop_when_full=True),
+    OBS_EVENTS: QueueSpec(workers=1, max_depth=256, block_when_full=True),
+}
+
+
+@dataclass
+class QueueStats:
+    """Counters of a work queue."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    inline: int = 0
+    blocked: int = 0
+    max_depth: int = 0
+
+
+_Job = Tuple[int, Callable[..., Any], Tuple[Any, ...]]
+
+
+class _WorkQueue:
+    """A bounded queue and the threads serving it."""
+
+    def __init__(
+        self, name: str, spec: QueueSpec, pipeline_metrics: PipelineMetrics
+    ):
+        self.name = name
+        self.spec = spec
+        self.metrics = pipeline_metrics
+        self.stats = QueueStats()
+        self._jobs: "queue.Queue[Optional[_Job]]" = queue.Queue(
+            maxsize=spec.max_depth
+        )
+        self._unfinished = 0
+        self._idle = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+        for index in range(spec.workers):
+            thread = threading.Thread(
+                target=self._work,
+                name=f"Worker-{name}-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._jobs.qsize()
+
+    def submit(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> bool:
+        """Queue a job, or handle it according to the full-queue policy."""
+        with self._idle:
+            self._unfinished += 1
+            self.stats.submitted += 1
+
+        try:
+            self._jobs.put_nowait((time.perf_counter_ns(), func, args))
+        except queue.Full:
+            if self.spec.block_when_full:
+                self.stats.blocked += 1
+                logging.warning(
+                    "[Workers] Queue %s full, waiting for space", self.name
+                )
+                self._jobs.put((time.perf_counter_ns(), func, args))
+                self.stats.max_depth = max(self.stats.max_depth, self.depth)
+                return True
+
+            self._finish()
+            if self.spec.drop_when_full:
+                self.stats.dropped += 1
+                logging.debug("[Workers] Queue %s full, dropped job", self.name)
+                return False
+
+            self.stats.inline += 1
+            logging.warning("[Workers] Queue %s full, running job inline", self.name)
+            self.run_inline(func, args)
+            return True
+
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+        return True
+
+    def run_inline(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        """Run a job on the calling thread."""
+        start = time.perf_counter_ns()
+        self._run(func, args)
+        self.metrics.record_ns(
+            f"worker.{self.name}.run", time.perf_counter_ns() - start
+        )
+
+    def wait_idle(self, timeout: Optional[float]) -> bool:
+        """Wait until every submitted job has finished."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def stop(self, timeout: float) -> None:
+        """Stop the worker threads once they finish their current job."""
+        for _ in self._threads:
+            try:
+                self._jobs.put(None, timeout=timeout)
+            except queue.Full:
+                break
+
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+    def _work(self) -> None:
+        """Worker thread loop."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            queued_at, func, args = job
+            start = time.perf_counter_ns()
+            self.metrics.record_ns(f"worker.{self.name}.wait", start - queued_at)
+
+            self._run(func, args)
+            self.metrics.record_ns(
+                f"worker.{self.name}.run", time.perf_counter_ns() - start
+            )
+            self._finish()
+
+    def _run(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        """Run a job, logging rather than propagating its failure."""
+        try:
+            func(*args)
+            self.stats.completed += 1
+        except Exception as e:
+            self.stats.failed += 1
+            logging.error("[Workers] Job on %s queue failed: %s", self.name, e)
+
+    def _finish(self) -> None:
+        """Mark a job as finished."""
+        with self._idle:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._idle.notify_all()
+
+
+class WorkerPool:
+    """Named, bounded work queues shared by the application's components."""
+
+    def __init__(
+        self,
+        queues: Optional[Dict[str, QueueSpec]] = None,
+        pipeline_metrics: PipelineMetrics = metrics,
+    ):
+        """
+        Initialize the pool and start its worker threads.
+
+        Args:
+            queues: Queue configurations by name, defaults to file_ops,
+                encoding, sound and obs_events
+            pipeline_metrics: Registry for queue wait and run times
+        """
+        self._queues = {
+            name: _WorkQueue(name, spec, pipeline_metrics)
+            for name, spec in (queues or DEFAULT_QUEUES).items()
+        }
+        self._closed = False
+
+    def submit(self, queue_name: str, func: Callable[..., Any], *args: Any) -> bool:
+        """
+        Submit a job to a named queue.
+
+        After the pool has been shut down, jobs run inline so late callers
+        still get their work done.
+
+        Args:
+            queue_name: Name of the queue
+            func: Function to run
+            *args: Arguments for the function
+
+        Returns:
+            False if the job was dropped because its queue was full
+
+        Raises:
+            KeyError: If the queue does not exist
+        """
+        work_queue = self._queues[queue_name]
+        if self._closed:
+            work_queue.run_inline(func, args)
+            return True
+        return work_queue.submit(func, args)
+
+    def wait_idle(
+        self,
+        queue_names: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait until queues have finished every submitted job.
+
+        Args:
+            queue_names: Queues to wait for, defaults to all of them
+            timeout: Maximum total seconds to wait, None to wait forever
+
+        Returns:
+            True if the queues are idle, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for name in queue_names if queue_names is not None else self._queues:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            if not self._queues[name].wait_idle(remaining):
+                return False
+        return True
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Summarize every queue.
+
+        Returns:
+            Mapping of queue name to its current depth and counters
+        """
+        return {
+            name: {"depth": work_queue.depth, **asdict(work_queue.stats)}
+            for name, work_queue in self._queues.items()
+        }
+
+    def cleanup(self, timeout: float = DRAIN_TIMEOUT) -> None:
+        """
+        Drain every queue and stop the workers.
+
+        Args:
+            timeout: Maximum seconds to wait for queued jobs
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if not self.wait_idle(timeout=timeout):
+            logging.warning("[Workers] Shutting down with unfinished jobs")
+
+        for work_queue in self._queues.values():
+            work_queue.stop(timeout=1.0)
+
+        for name, stats in self.snapshot().items():
+            logging.debug(
+                "[Workers] %s: %d completed, %d failed, %d dropped, %d inline, "
+                "%d blocked, max depth %d",
+                name,
+                stats["completed"],
+                stats["failed"],
+                stats["dropped"],
+                stats["inline"],
+                stats["blocked"],
+                stats["max_depth"],
+            )
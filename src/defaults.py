@@ -471,12 +471,18 @@ failed = "./sounds/failed.wav" # Sound file played when save operation fails or
 [detection] 
 interval = 0.25 # Seconds between game state detection checks
 detections_required = 2 # Consecutive matching detections needed to confirm state change
+region_capture = true # Only capture the small areas of the window that pixel patterns check (set to false to capture the whole window)
+state_intervals = {} # Optional per-state intervals overriding the interval above (e.g. { Select = 0.1 } to poll faster before a play starts)
+idle_interval = 2.0 # Seconds between process checks while no configured game is running, detection returns to full rate when one starts (0 to always run at full rate)
+trace_dir = "" # Record frames, window titles and logs to this folder for offline replay with "python -m src.replay" (leave empty to disable, uses a lot of disk space)
+runtime = "threads" # Main loop runtime: "threads" or "asyncio" (runs detection, OBS, hotkeys and timers as tasks on a single event loop)
 
 [recording]
 result_wait = 1.5 # Seconds to display result screen before stopping
 organize_by_game = true # Create separate folders for each detected game
 save_thumbnails = true # Generate thumbnail images when recordings end
 scene_change_delay = 0.3 # Delay in seconds before recording can start after scene change (should match your OBS scene transition duration)
+capture_mode = "record" # How plays are captured: "record" starts a recording when a play is detected, "replay_buffer" keeps the OBS replay buffer running while a game is focused and saves it after each play so the start is never cut off (set the replay buffer length in OBS above your longest play)
 
 [scenes] 
 # Optional: Automatically switch OBS scenes based on detected game state
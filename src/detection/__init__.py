@@ -11,9 +11,13 @@ from .detectors import (
     LogStateDetector,
     PixelStateDetector,
 )
+from .context import DetectionContextProvider
 from .engine import DetectionCoordinator, StateManager
+from .focus import ForegroundSnapshot, IFocusTracker, create_focus_tracker
+from .latency import StartLatencyTracker
 from .log_service import LogService
-from .process_monitor import ProcessMonitor
+from .process_metadata import ProcessMetadataCache
+from .process_monitor import IGameProcessHandler, ProcessMonitor, ProcessRecord
 from .processors import RecordingProcessor, SceneProcessor
 from .screen_capture import ScreenCaptureService
 from .state_machine import StateMachine, TransitionPattern
@@ -23,10 +27,18 @@ __all__ = [
     "GameDetector",
     "LogStateDetector",
     "PixelStateDetector",
+    "DetectionContextProvider",
     "DetectionCoordinator",
     "StateManager",
+    "ForegroundSnapshot",
+    "IFocusTracker",
+    "create_focus_tracker",
+    "StartLatencyTracker",
     "LogService",
+    "ProcessMetadataCache",
+    "IGameProcessHandler",
     "ProcessMonitor",
+    "ProcessRecord",
     "RecordingProcessor",
     "SceneProcessor",
     "ScreenCaptureService",
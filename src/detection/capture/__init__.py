@@ -0,0 +1,16 @@
+"""
+Screen capture backends and session management.
+"""
+
+from .backend import CaptureArea, ICaptureBackend
+from .fake import FrameCaptureBackend
+from .session import CaptureSession
+from .win32 import Win32CaptureBackend
+
+__all__ = [
+    "CaptureArea",
+    "ICaptureBackend",
+    "FrameCaptureBackend",
+    "CaptureSession",
+    "Win32CaptureBackend",
+]
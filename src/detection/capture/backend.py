@@ -0,0 +1,52 @@
+"""
+Capture backend interface.
+
+Backends own the platform-specific parts of screen capture: finding the
+foreground window's client area and grabbing pixels from the screen.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from mss.screenshot import ScreenShot
+
+
+@dataclass(frozen=True)
+class CaptureArea:
+    """Client area of the foreground window in screen coordinates."""
+
+    hwnd: int
+    left: int
+    top: int
+    width: int
+    height: int
+
+    @property
+    def monitor(self) -> Dict[str, int]:
+        """Area as an mss monitor dictionary."""
+        return {
+            "left": self.left,
+            "top": self.top,
+            "width": self.width,
+            "height": self.height,
+        }
+
+
+class ICaptureBackend(ABC):
+    """Interface for screen capture backends."""
+
+    @abstractmethod
+    def get_foreground_area(self) -> Optional[CaptureArea]:
+        """Get the foreground window's client area, or None if nothing is focused."""
+
+    @abstractmethod
+    def get_foreground_title(self) -> str:
+        """Get the foreground window's title, or an empty string."""
+
+    @abstractmethod
+    def grab(self, monitor: Dict[str, int]) -> ScreenShot:
+        """Grab a rectangle of the screen given as an mss monitor dictionary."""
+
+    def close(self) -> None:
+        """Release any handles held by the backend."""
@@ -0,0 +1,114 @@
+"""
+In-memory capture backend for tests, benchmarks and replays.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+from mss.screenshot import ScreenShot
+
+from .backend import CaptureArea, ICaptureBackend
+
+
+class FrameCaptureBackend(ICaptureBackend):
+    """
+    Serves grabs from a frame held in memory instead of the screen.
+
+    The frame stands in for the foreground window's client area, placed at
+    the screen origin. Grabs outside of it are filled with black.
+    """
+
+    def __init__(self, title: str = "", hwnd: int = 1):
+        """
+        Initialize the backend without a frame.
+
+        Args:
+            title: Foreground window title to report
+            hwnd: Window handle to report while a frame is set
+        """
+        self.title = title
+        self.hwnd = hwnd
+        self._frame: Optional[np.ndarray] = None
+
+    def set_frame(
+        self,
+        frame: Union[np.ndarray, bytes, bytearray],
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        """
+        Set the frame served by the backend.
+
+        Args:
+            frame: BGRA pixels, either as a (height, width, 4) uint8 array or
+                as raw bytes together with width and height
+            width: Frame width, required for raw bytes
+            height: Frame height, required for raw bytes
+        """
+        if isinstance(frame, np.ndarray):
+            pixels = frame
+        else:
+            if width is None or height is None:
+                raise ValueError("width and height are required for raw frames")
+            pixels = np.frombuffer(bytes(frame), dtype=np.uint8)
+
+        if width is not None and height is not None:
+            pixels = pixels.reshape(height, width, 4)
+
+        if pixels.ndim != 3 or pixels.shape[2] != 4:
+            raise ValueError(f"Expected a BGRA frame, got shape {pixels.shape}")
+
+        self._frame = np.ascontiguousarray(pixels, dtype=np.uint8)
+
+    def load_frame(self, path: Union[str, Path], key: str = "frame") -> None:
+        """
+        Load the frame from a .npy or .npz file.
+
+        Args:
+            path: File holding a (height, width, 4) uint8 array
+            key: Array name to read from .npz archives
+        """
+        data = np.load(path)
+        if isinstance(data, np.lib.npyio.NpzFile):
+            with data:
+                self.set_frame(data[key])
+        else:
+            self.set_frame(data)
+
+    def clear_frame(self) -> None:
+        """Remove the frame, as if no window were focused."""
+        self._frame = None
+
+    def get_foreground_area(self) -> Optional[CaptureArea]:
+        """Get the frame's area, or None when no frame is set."""
+        if self._frame is None:
+            return None
+
+        height, width = self._frame.shape[:2]
+        return CaptureArea(hwnd=self.hwnd, left=0, top=0, width=width, height=height)
+
+    def get_foreground_title(self) -> str:
+        """Get the configured window title."""
+        return self.title if self._frame is not None else ""
+
+    def grab(self, monitor: Dict[str, int]) -> ScreenShot:
+        """Crop the requested rectangle out of the frame."""
+        left, top = monitor["left"], monitor["top"]
+        width, height = monitor["width"], monitor["height"]
+
+        pixels = np.zeros((height, width, 4), dtype=np.uint8)
+
+        if self._frame is not None:
+            frame_height, frame_width = self._frame.shape[:2]
+            src_left, src_top = max(left, 0), max(top, 0)
+            src_right = min(left + width, frame_width)
+            src_bottom = min(top + height, frame_height)
+
+            if src_right > src_left and src_bottom > src_top:
+                pixels[
+                    src_top - top : src_bottom - top,
+                    src_left - left : src_right - left,
+                ] = self._frame[src_top:src_bottom, src_left:src_right]
+
+        return ScreenShot(bytearray(pixels.tobytes()), dict(monitor))
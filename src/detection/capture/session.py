@@ -0,0 +1,164 @@
+"""
+Long-lived capture session shared by every grab of ScreenCaptureService.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from mss.screenshot import ScreenShot
+
+from src.games import RegionFrame, RegionLayout
+
+from .backend import CaptureArea, ICaptureBackend
+
+
+@dataclass
+class _RegionPlan:
+    """Absolute grab rectangles and reusable buffers for one layout."""
+
+    layout: RegionLayout
+    monitors: List[Dict[str, int]]
+    buffers: List[bytearray]
+    next_index: int = 0
+
+    def next_buffer(self) -> bytearray:
+        """Get the next buffer of the pool, rotating through all of them."""
+        buffer = self.buffers[self.next_index]
+        self.next_index = (self.next_index + 1) % len(self.buffers)
+        return buffer
+
+
+@dataclass
+class _SessionState:
+    """Geometry-dependent state, rebuilt when the client area changes."""
+
+    area: Optional[CaptureArea] = None
+    plans: Dict[int, _RegionPlan] = field(default_factory=dict)
+
+
+class CaptureSession:
+    """
+    Keeps capture resources alive between ticks.
+
+    The backend handle stays open for the whole session. Region grabs write
+    into a small pool of preallocated buffers per layout, and the absolute
+    grab rectangles are only recomputed when the foreground window's client
+    area moves or resizes.
+
+    Region frames returned by the session share these pooled buffers, so a
+    frame is only valid until the pool wraps around; copy its raw bytes to
+    keep it longer.
+    """
+
+    def __init__(self, backend: ICaptureBackend, pool_size: int = 2):
+        """
+        Initialize the capture session.
+
+        Args:
+            backend: Backend used for geometry and grabs
+            pool_size: Number of buffers rotated per region layout
+        """
+        self.backend = backend
+        self.pool_size = max(1, pool_size)
+        self._state = _SessionState()
+        self._lock = threading.Lock()
+
+    def refresh_area(self) -> Optional[CaptureArea]:
+        """
+        Query the foreground client area and rebuild state if it changed.
+
+        Returns:
+            Current client area, or None if nothing capturable is focused
+        """
+        area = self.backend.get_foreground_area()
+        if area is not None and (area.width <= 0 or area.height <= 0):
+            area = None
+
+        with self._lock:
+            if area != self._state.area:
+                logging.debug("[ScreenCapture] Client area changed: %s", area)
+                self._state = _SessionState(area=area)
+
+        return area
+
+    def grab_window(self) -> Optional[ScreenShot]:
+        """
+        Grab the whole client area of the foreground window.
+
+        Returns:
+            Screenshot of the client area, or None if nothing is focused
+        """
+        area = self.refresh_area()
+        if area is None:
+            return None
+
+        return self.backend.grab(area.monitor)
+
+    def grab_regions(
+        self, get_layout: Callable[[int, int], Optional[RegionLayout]]
+    ) -> Optional[RegionFrame]:
+        """
+        Grab the regions of a layout into a pooled buffer.
+
+        Args:
+            get_layout: Returns the layout for a client width and height
+
+        Returns:
+            RegionFrame backed by a pooled buffer, or None if nothing is
+            focused or there is no layout for the current client size
+        """
+        area = self.refresh_area()
+        if area is None:
+            return None
+
+        layout = get_layout(area.width, area.height)
+        if layout is None:
+            return None
+
+        plan = self._get_plan(area, layout)
+        buffer = plan.next_buffer()
+
+        for monitor, region, base in zip(
+            plan.monitors, layout.regions, layout.base_offsets
+        ):
+            buffer[base : base + region.size] = self.backend.grab(monitor).raw
+
+        return RegionFrame(
+            width=area.width, height=area.height, layout=layout, raw=buffer
+        )
+
+    def close(self) -> None:
+        """Drop cached state and release the backend."""
+        with self._lock:
+            self._state = _SessionState()
+        self.backend.close()
+
+    def _get_plan(self, area: CaptureArea, layout: RegionLayout) -> _RegionPlan:
+        """Get or build the region plan for a layout at the given area."""
+        with self._lock:
+            state = self._state
+            if state.area != area:
+                state = self._state = _SessionState(area=area)
+
+            plan = state.plans.get(id(layout))
+            if plan is None or plan.layout is not layout:
+                plan = _RegionPlan(
+                    layout=layout,
+                    monitors=[
+                        {
+                            "left": area.left + region.left,
+                            "top": area.top + region.top,
+                            "width": region.width,
+                            "height": region.height,
+                        }
+                        for region in layout.regions
+                    ],
+                    buffers=[
+                        bytearray(layout.buffer_size) for _ in range(self.pool_size)
+                    ],
+                )
+                state.plans[id(layout)] = plan
+
+            return plan
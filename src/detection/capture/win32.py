@@ -0,0 +1,81 @@
+"""
+Win32 capture backend using mss.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import mss
+import win32gui
+from mss.base import MSSBase
+from mss.screenshot import ScreenShot
+
+from .backend import CaptureArea, ICaptureBackend
+
+
+class Win32CaptureBackend(ICaptureBackend):
+    """
+    Captures the foreground window through win32gui and mss.
+
+    The mss handle is kept open for the lifetime of the backend instead of
+    being created per grab. mss keeps its device contexts and bitmap buffer
+    for as long as the grabbed size does not change, so consecutive grabs of
+    the same geometry reuse them. Handles are kept per thread since the
+    detection loop and the OBS event thread both capture.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._handles: List[MSSBase] = []
+        self._lock = threading.Lock()
+
+    def get_foreground_area(self) -> Optional[CaptureArea]:
+        """Get the foreground window's client area in screen coordinates."""
+        hwnd = win32gui.GetForegroundWindow()
+
+        if not hwnd:
+            return None
+
+        client_rect = win32gui.GetClientRect(hwnd)
+
+        top_left = win32gui.ClientToScreen(hwnd, (client_rect[0], client_rect[1]))
+        bottom_right = win32gui.ClientToScreen(hwnd, (client_rect[2], client_rect[3]))
+
+        return CaptureArea(
+            hwnd=hwnd,
+            left=top_left[0],
+            top=top_left[1],
+            width=bottom_right[0] - top_left[0],
+            height=bottom_right[1] - top_left[1],
+        )
+
+    def get_foreground_title(self) -> str:
+        """Get the title of the foreground window."""
+        hwnd = win32gui.GetForegroundWindow()
+        if hwnd:
+            return win32gui.GetWindowText(hwnd)
+        return ""
+
+    def grab(self, monitor: Dict[str, int]) -> ScreenShot:
+        """Grab a rectangle of the screen with this thread's mss handle."""
+        return self._get_handle().grab(monitor)
+
+    def close(self) -> None:
+        """Close every mss handle opened by this backend."""
+        with self._lock:
+            handles, self._handles = self._handles, []
+
+        for handle in handles:
+            handle.close()
+
+        self._local = threading.local()
+
+    def _get_handle(self) -> MSSBase:
+        """Get or open the mss handle for the calling thread."""
+        handle = getattr(self._local, "handle", None)
+        if handle is None:
+            handle = mss.mss()
+            self._local.handle = handle
+            with self._lock:
+                self._handles.append(handle)
+        return handle
@@ -0,0 +1,53 @@
+"""
+Builds the per-tick detection context.
+
+Refreshes the focus tracker once per tick and turns its snapshot of the
+foreground window, its process and, for Java games, the JAR path into an
+immutable context so every detection component works from the same data.
+"""
+
+import time
+
+from src.core.interfaces import DetectionContext
+from src.detection.focus import IFocusTracker
+from src.detection.log_service import LogService
+
+
+class DetectionContextProvider:
+    """Captures immutable foreground snapshots for detection ticks."""
+
+    def __init__(self, focus: IFocusTracker, logs: LogService):
+        """
+        Initialize the context provider.
+
+        Args:
+            focus: Focus tracker holding the foreground window and process
+            logs: Log service used for JAR lookups and log reads
+        """
+        self.focus = focus
+        self.logs = logs
+
+    def capture(self) -> DetectionContext:
+        """
+        Capture the current foreground state.
+
+        Returns:
+            DetectionContext for the current tick
+        """
+        timestamp = time.time()
+
+        snapshot = self.focus.refresh()
+        if not snapshot.has_window:
+            return DetectionContext(window_title="", timestamp=timestamp)
+
+        metadata = snapshot.metadata
+        jar_path = metadata.jar_path if metadata and metadata.is_java else None
+
+        return DetectionContext(
+            window_title=snapshot.title,
+            timestamp=timestamp,
+            pid=snapshot.pid,
+            process_name=snapshot.exe_name,
+            jar_path=jar_path,
+            log_loader=self.logs.read_game_log,
+        )
@@ -2,10 +2,11 @@
 Base state detector implementation.
 """
 
+import time
 from abc import abstractmethod
 from typing import Optional
 
-from src.core.interfaces import IStateDetector
+from src.core.interfaces import DetectionContext, IStateDetector
 from src.games import Game
 
 
@@ -22,21 +23,31 @@ class BaseStateDetector(IStateDetector):
         self.detection_threshold = detection_threshold
         self._consecutive_detections = 0
         self._last_detected_state: Optional[str] = None
+        self._first_detected_at: Optional[float] = None
 
-    def detect_state(self, game: Game) -> Optional[str]:
+    @property
+    def first_detected_at(self) -> Optional[float]:
+        """Monotonic time the last detected raw state was first seen."""
+        return self._first_detected_at
+
+    def detect_state(
+        self, game: Game, context: Optional[DetectionContext] = None
+    ) -> Optional[str]:
         """
         Detect state with confirmation threshold.
 
         Args:
             game: Game to detect state for
+            context: Snapshot of the current tick, if available
 
         Returns:
             Confirmed state or None if not enough confirmations
         """
-        raw_state = self._detect_raw_state(game)
+        raw_state = self._detect_raw_state(game, context)
 
         if raw_state != self._last_detected_state:
             self._last_detected_state = raw_state
+            self._first_detected_at = time.monotonic()
             self._consecutive_detections = 1
         else:
             self._consecutive_detections += 1
@@ -47,10 +58,13 @@ class BaseStateDetector(IStateDetector):
         return None
 
     @abstractmethod
-    def _detect_raw_state(self, game: Game) -> Optional[str]:
+    def _detect_raw_state(
+        self, game: Game, context: Optional[DetectionContext] = None
+    ) -> Optional[str]:
         """Detect state without confirmation threshold."""
 
     def reset_detection_state(self) -> None:
         """Reset detection counters."""
         self._consecutive_detections = 0
         self._last_detected_state = None
+        self._first_detected_at = None
@@ -4,14 +4,10 @@ Game detection - determines which game is currently focused.
 
 from typing import List, Optional
 
-import psutil
-import win32gui
-import win32process
-
-from src.core.interfaces import IGameDetector
-from src.detection.log_service import LogService
+from src.core.interfaces import DetectionContext, IGameDetector
+from src.detection.context import DetectionContextProvider
 from src.detection.screen_capture import ScreenCaptureService
-from src.games import Game, LogGame, PixelGame, ProcessInfo
+from src.games import Game, GameIndex, LogGame, PixelGame
 
 
 class GameDetector(IGameDetector):
@@ -21,39 +17,48 @@ class GameDetector(IGameDetector):
         self,
         games: List[Game],
         screen_capture_service: ScreenCaptureService,
+        context_provider: DetectionContextProvider,
     ):
         """
         Initialize game detector.
 
         Args:
             games: List of games to detect
+            screen_capture_service: Screen capture service
+            context_provider: Provider for foreground snapshots
         """
         self.games = games
         self.screen = screen_capture_service
-        self.logs = LogService()
+        self.contexts = context_provider
+        self.index = GameIndex(games)
 
-    def get_active_game(self) -> Optional[Game]:
+    def get_active_game(
+        self, context: Optional[DetectionContext] = None
+    ) -> Optional[Game]:
         """
         Get the currently active/focused game.
 
+        Args:
+            context: Snapshot of the current tick, captured if not given
+
         Returns:
             Active game or None if no game is focused
         """
-        window_title = self.screen.get_focused_window_title()
-        if not window_title:
+        if context is None:
+            context = self.contexts.capture()
+
+        if not context.window_title:
             return None
 
-        if self._foreground_is_java():
-            for game in self.games:
-                if isinstance(game, LogGame) and self._matches_focused(
-                    game, window_title
-                ):
+        matches = self._focused_matches(context)
+
+        if context.is_java:
+            for game in matches:
+                if isinstance(game, LogGame):
                     return game
 
-        for game in self.games:
-            if isinstance(game, PixelGame) and self._matches_focused(
-                game, window_title
-            ):
+        for game in matches:
+            if isinstance(game, PixelGame):
                 return game
 
         return None
@@ -68,46 +73,36 @@ class GameDetector(IGameDetector):
         Returns:
             True if the game is focused
         """
-        window_title = self.screen.get_focused_window_title()
-        if not window_title:
+        context = self.contexts.capture()
+        if not context.window_title:
             return False
 
-        return self._matches_focused(game, window_title)
-
-    def _foreground_is_java(self) -> bool:
-        """Check if foreground process is Java."""
-        return self.logs.get_foreground_java_process_info() is not None
+        return self._matches_focused(game, context)
 
-    def _matches_focused(self, game: Game, window_title: str) -> bool:
+    def _matches_focused(self, game: Game, context: DetectionContext) -> bool:
         """
         Check if game matches the focused window.
 
         Args:
             game: Game to check
-            window_title: Current window title
+            context: Snapshot of the current tick
 
         Returns:
             True if game matches focused window
         """
-        process_name = self._focused_process_name()
-        if not process_name:
-            return False
+        return game in self._focused_matches(context)
 
-        for process_info in game.processes:
-            if isinstance(process_info, ProcessInfo):
-                if process_info.matches_process(process_name, window_title):
-                    return True
+    def _focused_matches(self, context: DetectionContext) -> List[Game]:
+        """
+        Get every game matching the focused window through the game index.
 
-        return False
+        Args:
+            context: Snapshot of the current tick
 
-    def _focused_process_name(self) -> Optional[str]:
-        """Get the name of the focused process."""
-        try:
-            hwnd = win32gui.GetForegroundWindow()
-            if not hwnd:
-                return None
+        Returns:
+            Matching games in definition order
+        """
+        if not context.process_name:
+            return []
 
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            return psutil.Process(pid).name()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return None
+        return self.index.match(context.process_name, context.window_title)
@@ -5,6 +5,7 @@ Log-based state detection for Java games that write to log files.
 import logging
 from typing import Optional
 
+from src.core.interfaces import DetectionContext
 from src.detection.detectors.base import BaseStateDetector
 from src.detection.log_service import LogService
 from src.games import Game, LogGame
@@ -13,20 +14,25 @@ from src.games import Game, LogGame
 class LogStateDetector(BaseStateDetector):
     """Detector for log-based game state detection."""
 
-    def __init__(self, detection_threshold: int = 2):
+    def __init__(
+        self, detection_threshold: int = 2, log_service: Optional[LogService] = None
+    ):
         super().__init__(detection_threshold)
-        self.logs = LogService()
+        self.logs = log_service or LogService()
 
     def can_handle_game(self, game: Game) -> bool:
         """Check if this detector can handle log-based games."""
         return isinstance(game, LogGame)
 
-    def _detect_raw_state(self, game: Game) -> Optional[str]:
+    def _detect_raw_state(
+        self, game: Game, context: Optional[DetectionContext] = None
+    ) -> Optional[str]:
         """
         Detect state using log analysis.
 
         Args:
             game: LogGame to analyze
+            context: Snapshot of the current tick, its log read is reused if given
 
         Returns:
             Detected state name or None
@@ -35,7 +41,10 @@ class LogStateDetector(BaseStateDetector):
             logging.warning("[LogDetector] Cannot handle non-log game: %s", game.name)
             return None
 
-        entries = self.logs.get_log_entries_for_game(game.name, game.logs)
+        if context is not None:
+            entries = context.get_log_entries(game.logs)
+        else:
+            entries = self.logs.get_log_entries_for_game(game.name, game.logs)
         if not entries:
             return None
 
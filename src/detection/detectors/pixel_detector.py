@@ -5,6 +5,8 @@ Pixel-based state detection for games that use screen analysis.
 import logging
 from typing import Optional
 
+from src.core.interfaces import DetectionContext
+from src.core.metrics import PipelineMetrics, metrics
 from src.detection.detectors.base import BaseStateDetector
 from src.detection.screen_capture import ScreenCaptureService
 from src.games import Game, PixelGame
@@ -17,20 +19,27 @@ class PixelStateDetector(BaseStateDetector):
         self,
         screen_capture_service: ScreenCaptureService,
         detection_threshold: int = 2,
+        region_capture: bool = False,
+        pipeline_metrics: PipelineMetrics = metrics,
     ):
         super().__init__(detection_threshold)
         self.screen = screen_capture_service
+        self.region_capture = region_capture
+        self.metrics = pipeline_metrics
 
     def can_handle_game(self, game: Game) -> bool:
         """Check if this detector can handle pixel-based games."""
         return isinstance(game, PixelGame)
 
-    def _detect_raw_state(self, game: Game) -> Optional[str]:
+    def _detect_raw_state(
+        self, game: Game, context: Optional[DetectionContext] = None
+    ) -> Optional[str]:
         """
         Detect state using pixel analysis.
 
         Args:
             game: PixelGame to analyze
+            context: Snapshot of the current tick (unused, pixels are captured live)
 
         Returns:
             Detected state name or None
@@ -41,9 +50,14 @@ class PixelStateDetector(BaseStateDetector):
             )
             return None
 
-        screenshot = self.screen.capture_focused_window()
+        with self.metrics.span("capture.grab"):
+            if self.region_capture:
+                screenshot = self.screen.capture_focused_regions(game)
+            else:
+                screenshot = self.screen.capture_focused_window()
         if not screenshot:
             return None
 
-        state_obj = game.get_current_state(screenshot)
+        with self.metrics.span("pixel.match"):
+            state_obj = game.get_current_state(screenshot)
         return state_obj.get_name() if state_obj else None
@@ -3,6 +3,12 @@ Detection engine coordination package.
 """
 
 from .coordinator import DetectionCoordinator
+from .pipeline import DetectionPipeline, StateDetection
 from .state_manager import StateManager
 
-__all__ = ["DetectionCoordinator", "StateManager"]
+__all__ = [
+    "DetectionCoordinator",
+    "DetectionPipeline",
+    "StateDetection",
+    "StateManager",
+]
@@ -4,20 +4,29 @@ Main detection coordination - orchestrates all detection components.
 
 import logging
 import time
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.config import AppSettings
 from src.core.interfaces import (
+    DetectionContext,
     DetectionResult,
     IDetectionEngine,
     IOBSController,
     IRecordingManager,
 )
+from src.core.metrics import PipelineMetrics, metrics
+from src.detection.context import DetectionContextProvider
 from src.detection.detectors import GameDetector, LogStateDetector, PixelStateDetector
+from src.detection.engine.pipeline import DetectionPipeline
 from src.detection.engine.state_manager import StateManager
+from src.detection.latency import StartLatencyTracker
+from src.detection.process_monitor import ProcessMonitor
 from src.detection.processors import RecordingProcessor, SceneProcessor, VideoProcessor
 from src.games import Game
 
+if TYPE_CHECKING:
+    from src.replay.trace import TraceRecorder
+
 
 class DetectionCoordinator(IDetectionEngine):
     """
@@ -37,6 +46,11 @@ class DetectionCoordinator(IDetectionEngine):
         video_processor: VideoProcessor,
         scene_processor: SceneProcessor,
         recording_processor: RecordingProcessor,
+        context_provider: DetectionContextProvider,
+        latency_tracker: Optional[StartLatencyTracker] = None,
+        trace_recorder: Optional["TraceRecorder"] = None,
+        process_monitor: Optional[ProcessMonitor] = None,
+        pipeline_metrics: PipelineMetrics = metrics,
     ):
         """
         Initialize detection coordinator.
@@ -49,20 +63,40 @@ class DetectionCoordinator(IDetectionEngine):
             game_detector: Game detector
             scene_processor: Scene processor
             recording_processor: Recording processor
+            context_provider: Provider for per-tick foreground snapshots
+            latency_tracker: Optional tracker for detection to recording latency
+            trace_recorder: Optional recorder writing every tick's input to disk
+            process_monitor: Optional monitor used to skip foreground detection
+                and enter idle mode while no configured game is running
+            pipeline_metrics: Registry for the latency of each tick stage
         """
         self.obs = obs_controller
         self.recording_manager = recording_manager
         self.settings = settings
 
-        self.state_manager = StateManager()
+        self.contexts = context_provider
+        self.metrics = pipeline_metrics
+        self.state_manager = StateManager(context_provider.logs)
         self.game_detector = game_detector
         self.pixel_detector = PixelStateDetector(
-            game_detector.screen, settings.detections_required
+            game_detector.screen,
+            settings.detections_required,
+            region_capture=settings.region_capture,
+            pipeline_metrics=pipeline_metrics,
+        )
+        self.log_detector = LogStateDetector(
+            settings.detections_required, context_provider.logs
+        )
+        self.pipeline = DetectionPipeline(
+            game_detector, self.pixel_detector, self.log_detector, self.state_manager
         )
-        self.log_detector = LogStateDetector(settings.detections_required)
         self.video_processor = video_processor
         self.recording_processor = recording_processor
         self.scene_processor = scene_processor
+        self.latency = latency_tracker
+        self.trace = trace_recorder
+        self.processes = process_monitor
+        self.idle = False
 
         self.obs.register_event_handler(self)
 
@@ -75,54 +109,80 @@ class DetectionCoordinator(IDetectionEngine):
         Returns:
             DetectionResult with current detection status
         """
-        current_time = time.time()
-
-        active_game = self.game_detector.get_active_game()
-
-        previous_game = self.state_manager.get_current_game()
-        self.state_manager.update_game(active_game)
+        with self.metrics.span("tick"):
+            return self._detect_and_control()
+
+    def _detect_and_control(self) -> DetectionResult:
+        """Run one detection tick."""
+        games_running = True
+        if self.processes is not None:
+            # Every idle tick is a heartbeat, so scan on each one
+            if self.idle:
+                self.processes.refresh(force=True)
+            games_running = self.processes.any_game_running()
+        with self.metrics.span("foreground"):
+            if games_running:
+                context = self.contexts.capture()
+            else:
+                context = DetectionContext(window_title="", timestamp=time.time())
+        current_time = context.timestamp
+
+        with self.metrics.span("game_detection"):
+            active_game = self.pipeline.detect_game(context)
+
+        if self.trace:
+            self.trace.record(context, active_game)
+
+        previous_game = self.pipeline.change_game(active_game)
         if active_game != previous_game:
-            if previous_game and not active_game and self.obs.recording_active:
-                logging.debug("Game exited while recording, stopping and deleting")
-                self.recording_processor.mark_for_deletion()
-                self.recording_processor.stop_recording_immediate(play_failed=True)
-
-            self.video_processor.process_game_change(active_game)
-            self.scene_processor.process_game_change(active_game)
-
-            self.pixel_detector.reset_detection_state()
-            self.log_detector.reset_detection_state()
+            # Also on a direct switch to another game, so a replay waiting out
+            # the result screen is saved before new video settings restart
+            # the replay buffer
+            if previous_game:
+                self.recording_processor.handle_game_exit()
+
+            # Video settings and scene changes go out as one request batch
+            with self.metrics.span("obs.reconfigure"), self.obs.batched():
+                with self.metrics.span("obs.video"):
+                    self.video_processor.process_game_change(active_game)
+                with self.metrics.span("obs.scene"):
+                    self.scene_processor.process_game_change(active_game)
+            with self.metrics.span("obs.recording"):
+                self.recording_processor.process_game_change(active_game)
+
+        self._update_idle(not games_running and self.settings.idle_mode_enabled)
 
         if not active_game:
             return DetectionResult(
                 game=None,
                 state=None,
                 confidence=0.0,
-                metadata={"action": "no_game", "timestamp": current_time},
+                metadata={
+                    "action": "idle" if self.idle else "no_game",
+                    "idle": self.idle,
+                    "timestamp": current_time,
+                },
             )
 
-        detected_state = None
-        confidence = 0.0
-
-        if self.pixel_detector.can_handle_game(active_game):
-            detected_state = self.pixel_detector.detect_state(active_game)
-            confidence = 0.8 if detected_state else 0.0
-        elif self.log_detector.can_handle_game(active_game):
-            detected_state = self.log_detector.detect_state(active_game)
-            confidence = 0.9 if detected_state else 0.0
+        with self.metrics.span("state_detection"):
+            detection = self.pipeline.detect_state(active_game, context)
 
         # Process state changes
-        state_transition = self.state_manager.update_state(detected_state)
+        state_transition = detection.transition
         if state_transition:
-            self.scene_processor.process_transition(state_transition)
-            self.recording_processor.process_transition(state_transition)
+            if self.latency:
+                self.latency.on_transition(state_transition)
+            with self.metrics.span("obs.scene"):
+                self.scene_processor.process_transition(state_transition)
+            with self.metrics.span("obs.recording"):
+                self.recording_processor.process_transition(state_transition)
 
         return DetectionResult(
             game=active_game,
             state=self.state_manager.get_current_state(),
-            confidence=confidence,
+            confidence=detection.confidence,
             metadata={
-                "detected_state": detected_state,
+                "detected_state": detection.state,
                 "recording_active": self.obs.recording_active,
                 "timestamp": current_time,
                 "patterns_triggered": state_transition.triggered_patterns
@@ -131,6 +191,25 @@ class DetectionCoordinator(IDetectionEngine):
             },
         )
 
+    def _update_idle(self, idle: bool) -> None:
+        """
+        Enter or leave idle mode.
+
+        Args:
+            idle: Whether no configured game is running
+        """
+        if idle == self.idle:
+            return
+
+        self.idle = idle
+        if idle:
+            logging.info(
+                "No game running, checking for games every %ss",
+                self.settings.idle_interval,
+            )
+        else:
+            logging.info("Game process detected, resuming detection")
+
     def can_save_lastplay(self) -> bool:
         """
         Check if lastplay can be saved.
@@ -176,7 +255,10 @@ class DetectionCoordinator(IDetectionEngine):
             "recording_active": self.obs.recording_active,
             "can_save_lastplay": self.can_save_lastplay(),
             "obs_connected": self.obs.is_connected,
-            "focused_window": self.game_detector.screen.get_focused_window_title(),
+            "idle": self.idle,
+            "focused_window": self.contexts.focus.snapshot.title,
+            "latency": self.metrics.snapshot(),
+            "start_latency": self.latency.summary() if self.latency else {},
             "timestamp": time.time(),
         }
 
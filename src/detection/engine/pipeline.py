@@ -0,0 +1,108 @@
+"""
+Game and state detection shared by the live engine and trace replays.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.interfaces import DetectionContext, StateTransition
+from src.detection.detectors import GameDetector, LogStateDetector, PixelStateDetector
+from src.detection.engine.state_manager import StateManager
+from src.games import Game
+
+
+@dataclass
+class StateDetection:
+    """Outcome of detecting the state of the focused game for one tick."""
+
+    state: Optional[str] = None
+    confidence: float = 0.0
+    transition: Optional[StateTransition] = None
+
+
+class DetectionPipeline:
+    """
+    Runs the detection steps of a tick, without touching OBS.
+
+    DetectionCoordinator reacts to game changes and transitions in between
+    these steps, while replays only collect the transitions. Both go through
+    this class so they detect exactly the same way.
+    """
+
+    def __init__(
+        self,
+        game_detector: GameDetector,
+        pixel_detector: PixelStateDetector,
+        log_detector: LogStateDetector,
+        state_manager: StateManager,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            game_detector: Detector for the focused game
+            pixel_detector: State detector for pixel games
+            log_detector: State detector for log games
+            state_manager: State manager turning states into transitions
+        """
+        self.game_detector = game_detector
+        self.pixel_detector = pixel_detector
+        self.log_detector = log_detector
+        self.state_manager = state_manager
+
+    def detect_game(self, context: DetectionContext) -> Optional[Game]:
+        """
+        Detect the focused game.
+
+        Args:
+            context: Snapshot of the current tick
+
+        Returns:
+            Focused game or None if no game is focused
+        """
+        return self.game_detector.get_active_game(context)
+
+    def change_game(self, game: Optional[Game]) -> Optional[Game]:
+        """
+        Track the focused game, starting state detection over if it changed.
+
+        Args:
+            game: Focused game or None if no game is focused
+
+        Returns:
+            The game focused before
+        """
+        previous_game = self.state_manager.get_current_game()
+        if game != previous_game:
+            self.state_manager.update_game(game)
+            self.pixel_detector.reset_detection_state()
+            self.log_detector.reset_detection_state()
+        return previous_game
+
+    def detect_state(self, game: Game, context: DetectionContext) -> StateDetection:
+        """
+        Detect the state of the focused game and check for a transition.
+
+        Args:
+            game: Focused game
+            context: Snapshot of the current tick
+
+        Returns:
+            StateDetection with the detected state and transition, if any
+        """
+        detection = StateDetection()
+        detected_at = None
+
+        if self.pixel_detector.can_handle_game(game):
+            detection.state = self.pixel_detector.detect_state(game, context)
+            detected_at = self.pixel_detector.first_detected_at
+            detection.confidence = 0.8 if detection.state else 0.0
+        elif self.log_detector.can_handle_game(game):
+            detection.state = self.log_detector.detect_state(game, context)
+            detected_at = self.log_detector.first_detected_at
+            detection.confidence = 0.9 if detection.state else 0.0
+
+        detection.transition = self.state_manager.update_state(
+            detection.state, context, detected_at
+        )
+        return detection
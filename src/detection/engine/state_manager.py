@@ -5,9 +5,9 @@ Manages game state transitions and pattern matching.
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
-from src.core.interfaces import StateTransition
+from src.core.interfaces import DetectionContext, StateTransition
 from src.detection.log_service import LogService
 from src.detection.state_machine import StateMachine, TransitionPattern
 from src.games import Game, LogGame
@@ -27,10 +27,15 @@ class StateContext:
 class StateManager:
     """Manages state transitions and pattern matching for games."""
 
-    def __init__(self):
-        """Initialize state manager."""
+    def __init__(self, log_service: Optional[LogService] = None):
+        """
+        Initialize state manager.
+
+        Args:
+            log_service: Log service used when no tick context is provided
+        """
         self.context = StateContext()
-        self.logs = LogService()
+        self.logs = log_service or LogService()
 
         self._setup_transition_patterns()
 
@@ -65,12 +70,19 @@ class StateManager:
 
         return None
 
-    def update_state(self, new_state: Optional[str]) -> Optional[StateTransition]:
+    def update_state(
+        self,
+        new_state: Optional[str],
+        detection_context: Optional[DetectionContext] = None,
+        detected_at: Optional[float] = None,
+    ) -> Optional[StateTransition]:
         """
         Update the current state and check for transitions.
 
         Args:
             new_state: New detected state
+            detection_context: Snapshot of the current tick, its log read is reused if given
+            detected_at: Monotonic time the new state was first seen, before confirmation
 
         Returns:
             StateTransition if valid transition occurred, None otherwise
@@ -84,7 +96,7 @@ class StateManager:
             and new_state == "Playing"
             and isinstance(self.context.current_game, LogGame)
         ):
-            if self._should_restart_for_timestamp_change():
+            if self._should_restart_for_timestamp_change(detection_context):
                 logging.debug(
                     "[StateManager] Timestamp change detected, triggering restart"
                 )
@@ -98,19 +110,22 @@ class StateManager:
                     game=self.context.current_game,
                     timestamp=time.time(),
                     triggered_patterns=["restart"],
+                    # The detector has seen Playing since the previous play
+                    # began, so the restart is stamped when it is noticed
+                    detected_at=None,
                 )
                 self.context.previous_state = self.context.current_state
                 self.context.current_state = new_state
 
                 # Update the playing timestamp to prevent detecting the same change again
-                self._update_playing_timestamp()
+                self._update_playing_timestamp(detection_context)
 
                 return transition
 
         # Normal state transition handling
         if new_state and new_state != self.context.current_state:
             self.context.machine.push_state(new_state)
-            return self._create_transition(new_state)
+            return self._create_transition(new_state, detection_context, detected_at)
 
         return None
 
@@ -127,18 +142,25 @@ class StateManager:
         self.context = StateContext()
         self._setup_transition_patterns()
 
-    def _create_transition(self, new_state: str) -> StateTransition:
+    def _create_transition(
+        self,
+        new_state: str,
+        detection_context: Optional[DetectionContext] = None,
+        detected_at: Optional[float] = None,
+    ) -> StateTransition:
         """
         Create a state transition object.
 
         Args:
             new_state: The new state being transitioned to
+            detection_context: Snapshot of the current tick, if available
+            detected_at: Monotonic time the new state was first seen
 
         Returns:
             StateTransition object
         """
         if new_state == "Playing" and isinstance(self.context.current_game, LogGame):
-            self._update_playing_timestamp()
+            self._update_playing_timestamp(detection_context)
 
         patterns = self.context.machine.get_last_matches()
 
@@ -148,6 +170,7 @@ class StateManager:
             game=self.context.current_game,
             timestamp=time.time(),
             triggered_patterns=patterns,
+            detected_at=detected_at,
         )
 
         self.context.previous_state = self.context.current_state
@@ -171,7 +194,9 @@ class StateManager:
 
         self.context.machine.add_patterns(patterns)
 
-    def _should_restart_for_timestamp_change(self) -> bool:
+    def _should_restart_for_timestamp_change(
+        self, detection_context: Optional[DetectionContext] = None
+    ) -> bool:
         """
         Check if Playing → Playing transition should trigger restart.
         Only applicable for LogGame types.
@@ -179,9 +204,7 @@ class StateManager:
         if not isinstance(self.context.current_game, LogGame):
             return False
 
-        entries = self.logs.get_log_entries_for_game(
-            self.context.current_game.name, self.context.current_game.logs
-        )
+        entries = self._get_log_entries(detection_context)
 
         if not entries:
             return False
@@ -205,14 +228,14 @@ class StateManager:
 
         return should_restart
 
-    def _update_playing_timestamp(self) -> None:
+    def _update_playing_timestamp(
+        self, detection_context: Optional[DetectionContext] = None
+    ) -> None:
         """Update stored Playing timestamp for LogGame."""
         if not isinstance(self.context.current_game, LogGame):
             return
 
-        entries = self.logs.get_log_entries_for_game(
-            self.context.current_game.name, self.context.current_game.logs
-        )
+        entries = self._get_log_entries(detection_context)
 
         if not entries:
             return
@@ -222,3 +245,14 @@ class StateManager:
         )
         if current_timestamp:
             self.context.last_playing_timestamp = current_timestamp
+
+    def _get_log_entries(
+        self, detection_context: Optional[DetectionContext] = None
+    ) -> Sequence[Dict[str, str]]:
+        """Get the current LogGame's entries, reusing the tick's read if possible."""
+        game = self.context.current_game
+
+        if detection_context is not None:
+            return detection_context.get_log_entries(game.logs)
+
+        return self.logs.get_log_entries_for_game(game.name, game.logs)
@@ -0,0 +1,45 @@
+"""
+Foreground focus tracking.
+"""
+
+import logging
+from typing import Optional
+
+from src.detection.process_metadata import ProcessMetadataCache
+
+from .base import EMPTY_SNAPSHOT, ForegroundSnapshot, IFocusTracker
+from .fake import StaticFocusTracker
+from .polling import PollingFocusTracker
+from .winevent import WinEventFocusTracker
+
+
+def create_focus_tracker(
+    processes: Optional[ProcessMetadataCache] = None, use_hooks: bool = True
+) -> IFocusTracker:
+    """
+    Create the best focus tracker available on this system.
+
+    Args:
+        processes: Cache used to resolve the foreground process's metadata
+        use_hooks: Whether to try window event hooks before polling
+
+    Returns:
+        WinEventFocusTracker, or PollingFocusTracker if hooks are unavailable
+    """
+    if use_hooks:
+        try:
+            return WinEventFocusTracker(processes)
+        except OSError as e:
+            logging.debug("[FocusTracker] Falling back to polling: %s", e)
+    return PollingFocusTracker(processes)
+
+
+__all__ = [
+    "EMPTY_SNAPSHOT",
+    "ForegroundSnapshot",
+    "IFocusTracker",
+    "StaticFocusTracker",
+    "PollingFocusTracker",
+    "WinEventFocusTracker",
+    "create_focus_tracker",
+]
@@ -0,0 +1,92 @@
+"""
+Foreground focus tracker interface.
+
+A focus tracker keeps a snapshot of the foreground window (handle, owning
+process and title) so detection components can read it instead of asking
+win32 for it on every call.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+from src.detection.process_metadata import ProcessMetadata, ProcessMetadataCache
+
+
+@dataclass(frozen=True)
+class ForegroundSnapshot:
+    """Foreground window and its process at a point in time."""
+
+    hwnd: int = 0
+    pid: Optional[int] = None
+    title: str = ""
+    metadata: Optional[ProcessMetadata] = None
+    timestamp: float = field(default_factory=time.monotonic)
+
+    @property
+    def exe_name(self) -> Optional[str]:
+        """Executable name of the foreground process, if known."""
+        return self.metadata.exe_name if self.metadata else None
+
+    @property
+    def has_window(self) -> bool:
+        """Check if a titled window is focused."""
+        return bool(self.hwnd and self.title)
+
+
+EMPTY_SNAPSHOT = ForegroundSnapshot(timestamp=0.0)
+
+
+class IFocusTracker(ABC):
+    """Interface for foreground focus trackers."""
+
+    def __init__(self, processes: Optional[ProcessMetadataCache] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            processes: Cache used to resolve the foreground process's metadata
+        """
+        self.processes = processes
+        self._snapshot = EMPTY_SNAPSHOT
+
+    @property
+    def snapshot(self) -> ForegroundSnapshot:
+        """Last snapshot, without touching the system."""
+        return self._snapshot
+
+    @abstractmethod
+    def refresh(self) -> ForegroundSnapshot:
+        """
+        Bring the snapshot up to date, meant to be called once per tick.
+
+        Returns:
+            Current ForegroundSnapshot
+        """
+
+    def cleanup(self) -> None:
+        """Release any hooks or threads held by the tracker."""
+
+    def _with_metadata(self, snapshot: ForegroundSnapshot) -> ForegroundSnapshot:
+        """
+        Attach process metadata to a snapshot.
+
+        Complete metadata is carried over while the foreground process stays
+        the same, so the full lookup only runs when focus moves to another
+        process. Incomplete metadata is looked up again on every refresh
+        until the missing details can be read.
+        """
+        if snapshot.metadata is not None or not snapshot.pid or self.processes is None:
+            return snapshot
+
+        previous = self._snapshot.metadata
+        if (
+            self._snapshot.pid == snapshot.pid
+            and previous is not None
+            and previous.complete
+            and self.processes.is_current(previous)
+        ):
+            return replace(snapshot, metadata=previous)
+
+        return replace(snapshot, metadata=self.processes.get(snapshot.pid))
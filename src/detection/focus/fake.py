@@ -0,0 +1,52 @@
+"""
+In-memory focus tracker for tests and replays.
+"""
+
+from typing import Optional
+
+from src.detection.process_metadata import ProcessMetadata, ProcessMetadataCache
+
+from .base import EMPTY_SNAPSHOT, ForegroundSnapshot, IFocusTracker
+
+
+class StaticFocusTracker(IFocusTracker):
+    """Serves a foreground set by the caller instead of the desktop."""
+
+    def __init__(self, processes: Optional[ProcessMetadataCache] = None):
+        """
+        Initialize the tracker with nothing focused.
+
+        Args:
+            processes: Cache used to resolve metadata of PIDs without any
+        """
+        super().__init__(processes)
+        self.refresh_count = 0
+
+    def set_foreground(
+        self,
+        title: str,
+        pid: Optional[int] = None,
+        hwnd: int = 1,
+        metadata: Optional[ProcessMetadata] = None,
+    ) -> None:
+        """
+        Focus a window.
+
+        Args:
+            title: Window title
+            pid: PID owning the window
+            hwnd: Window handle
+            metadata: Process metadata, looked up from the cache if omitted
+        """
+        self._snapshot = self._with_metadata(
+            ForegroundSnapshot(hwnd=hwnd, pid=pid, title=title, metadata=metadata)
+        )
+
+    def clear(self) -> None:
+        """Unfocus everything."""
+        self._snapshot = EMPTY_SNAPSHOT
+
+    def refresh(self) -> ForegroundSnapshot:
+        """Return the snapshot set by the caller."""
+        self.refresh_count += 1
+        return self._snapshot
@@ -0,0 +1,50 @@
+"""
+Polling focus tracker using win32gui.
+"""
+
+import win32gui
+import win32process
+
+from .base import EMPTY_SNAPSHOT, ForegroundSnapshot, IFocusTracker
+
+
+def read_foreground(hwnd: int, previous: ForegroundSnapshot) -> ForegroundSnapshot:
+    """
+    Read the title and owning PID of a window.
+
+    The PID is only looked up when the handle changed since the previous
+    snapshot, since a window never changes owner.
+
+    Args:
+        hwnd: Window handle, 0 if nothing is focused
+        previous: Snapshot to reuse the PID from
+
+    Returns:
+        ForegroundSnapshot without process metadata
+    """
+    if not hwnd:
+        return EMPTY_SNAPSHOT
+
+    title = win32gui.GetWindowText(hwnd)
+    if hwnd == previous.hwnd:
+        pid = previous.pid
+    else:
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+
+    return ForegroundSnapshot(hwnd=hwnd, pid=pid or None, title=title)
+
+
+class PollingFocusTracker(IFocusTracker):
+    """
+    Reads the foreground window on every refresh.
+
+    Used where no window event hook can be installed. Since refresh runs once
+    per tick, this costs two win32 calls per tick while focus stays on the
+    same window.
+    """
+
+    def refresh(self) -> ForegroundSnapshot:
+        """Poll the foreground window."""
+        snapshot = read_foreground(win32gui.GetForegroundWindow(), self._snapshot)
+        self._snapshot = self._with_metadata(snapshot)
+        return self._snapshot
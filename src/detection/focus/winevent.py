@@ -0,0 +1,195 @@
+"""
+Event-driven focus tracker using a win32 window event hook.
+
+A dedicated thread installs SetWinEventHook callbacks for foreground changes
+and window title changes, then pumps messages so Windows can deliver them.
+The detection loop only reads the snapshot the callbacks leave behind.
+"""
+
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+from typing import List, Optional
+
+import win32gui
+
+from src.detection.process_metadata import ProcessMetadataCache
+
+from .base import ForegroundSnapshot, IFocusTracker
+from .polling import read_foreground
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WM_QUIT = 0x0012
+
+# WINFUNCTYPE only exists on Windows; CFUNCTYPE keeps the module importable
+WinEventProc = getattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE)(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+
+class WinEventFocusTracker(IFocusTracker):
+    """
+    Tracks the foreground through EVENT_SYSTEM_FOREGROUND and title changes.
+
+    Callbacks only read the window title and owning PID. Process metadata is
+    resolved on the caller's thread during refresh, since WMI lookups are
+    bound to the thread that created the connection. If the hook thread dies,
+    refresh falls back to polling like PollingFocusTracker.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[ProcessMetadataCache] = None,
+        start_timeout: float = 2.0,
+    ):
+        """
+        Start the hook thread and wait for the hooks to be installed.
+
+        Args:
+            processes: Cache used to resolve the foreground process's metadata
+            start_timeout: Seconds to wait for the hook thread
+
+        Raises:
+            OSError: If the hooks could not be installed
+        """
+        super().__init__(processes)
+        self._latest = self._snapshot
+        self._seen = self._snapshot
+        self._hooked = False
+        self._thread_id: Optional[int] = None
+        self._ready = threading.Event()
+        # Keep a reference so the callback is not garbage collected
+        self._callback = WinEventProc(self._on_event)
+
+        self._thread = threading.Thread(
+            target=self._run, name="FocusTracker", daemon=True
+        )
+        self._thread.start()
+
+        if not self._ready.wait(start_timeout) or not self._hooked:
+            self.cleanup()
+            raise OSError("Failed to install foreground window event hooks")
+
+        logging.debug("[FocusTracker] Window event hooks installed")
+
+    @property
+    def active(self) -> bool:
+        """Check if the hooks are installed and delivering events."""
+        return self._hooked and self._thread.is_alive()
+
+    def refresh(self) -> ForegroundSnapshot:
+        """
+        Pick up the latest snapshot delivered by the hooks.
+
+        Returns:
+            Current ForegroundSnapshot
+        """
+        if not self.active:
+            snapshot = read_foreground(win32gui.GetForegroundWindow(), self._snapshot)
+            self._snapshot = self._with_metadata(snapshot)
+            return self._snapshot
+
+        latest = self._latest
+        if latest is not self._seen:
+            self._seen = latest
+            self._snapshot = self._with_metadata(latest)
+        return self._snapshot
+
+    def cleanup(self) -> None:
+        """Stop the message loop and remove the hooks."""
+        if self._thread_id is not None and self._thread.is_alive():
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+            self._thread.join(timeout=1.0)
+        self._hooked = False
+
+    def _run(self) -> None:
+        """Install the hooks and pump messages until WM_QUIT."""
+        hooks: List[int] = []
+        try:
+            user32 = self._install(hooks)
+        except Exception as e:
+            logging.debug("[FocusTracker] Failed to install hooks: %s", e)
+            user32 = None
+        finally:
+            self._ready.set()
+
+        try:
+            if self._hooked:
+                msg = wintypes.MSG()
+                while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                if hook:
+                    ctypes.windll.user32.UnhookWinEvent(hook)
+            self._hooked = False
+            logging.debug("[FocusTracker] Window event hooks removed")
+
+    def _install(self, hooks: List[int]) -> ctypes.CDLL:
+        """Install the hooks on the current thread, appending their handles."""
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.HMODULE,
+            WinEventProc,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        ]
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        for event in (EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_NAMECHANGE):
+            hooks.append(
+                user32.SetWinEventHook(event, event, None, self._callback, 0, 0, flags)
+            )
+
+        self._update(win32gui.GetForegroundWindow())
+        self._hooked = all(hooks)
+        return user32
+
+    def _on_event(
+        self,
+        hook: int,
+        event: int,
+        hwnd: int,
+        id_object: int,
+        id_child: int,
+        event_thread: int,
+        event_time: int,
+    ) -> None:
+        """Handle a window event on the hook thread."""
+        try:
+            if event == EVENT_SYSTEM_FOREGROUND:
+                self._update(hwnd or 0)
+            elif (
+                event == EVENT_OBJECT_NAMECHANGE
+                and id_object == OBJID_WINDOW
+                and id_child == CHILDID_SELF
+                and hwnd == self._latest.hwnd
+            ):
+                self._update(hwnd)
+        except Exception as e:
+            # Exceptions must not propagate into the ctypes callback
+            logging.debug("[FocusTracker] Failed to handle window event: %s", e)
+
+    def _update(self, hwnd: int) -> None:
+        """Publish a new snapshot for the main thread to pick up."""
+        self._latest = read_foreground(hwnd, self._latest)
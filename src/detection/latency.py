@@ -0,0 +1,159 @@
+"""
+End-to-end latency from a play being detected to OBS recording it.
+
+Every play that starts a recording goes through three delays before OBS
+reports the output as started:
+
+- confirmation: the new state is first seen until detections_required
+  consecutive ticks confirm it
+- start delay: the confirmed transition until the StartRecord request is sent,
+  which includes the scene change delay
+- obs: the request until OBS emits OBS_WEBSOCKET_OUTPUT_STARTED
+
+The tracker correlates these stamps and keeps a histogram per game and stage.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from src.core.interfaces import IOBSEventHandler, StateTransition
+from src.core.metrics import LatencyHistogram
+
+START_PATTERNS = ("start_play", "restart")
+STAGES = ("confirmation", "start_delay", "obs", "total")
+# OBS events arriving later than this after the request belong to something else
+MAX_START_WAIT = 30.0
+
+
+@dataclass
+class _PendingStart:
+    """Stamps of a play waiting for its recording to start."""
+
+    game: str
+    detected_at: float
+    confirmed_at: float
+    requested_at: Optional[float] = None
+
+
+class StartLatencyTracker(IOBSEventHandler):
+    """Measures how long it takes for a detected play to be recorded."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the tracker.
+
+        Args:
+            clock: Monotonic time source, must match the transition stamps
+        """
+        self.clock = clock
+        self._pending: Optional[_PendingStart] = None
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def on_transition(self, transition: StateTransition) -> None:
+        """
+        Start tracking a transition that begins a play.
+
+        Args:
+            transition: Confirmed state transition
+        """
+        if not any(p in transition.triggered_patterns for p in START_PATTERNS):
+            return
+
+        detected_at = transition.detected_at
+        if detected_at is None or detected_at > transition.monotonic:
+            detected_at = transition.monotonic
+
+        with self._lock:
+            self._pending = _PendingStart(
+                game=transition.game.shortname,
+                detected_at=detected_at,
+                confirmed_at=transition.monotonic,
+            )
+
+    def on_start_requested(self) -> None:
+        """Stamp the StartRecord request of the pending play."""
+        with self._lock:
+            if self._pending is not None and self._pending.requested_at is None:
+                self._pending.requested_at = self.clock()
+
+    def cancel(self) -> None:
+        """Stop tracking the pending play, e.g. when it was discarded."""
+        with self._lock:
+            self._pending = None
+
+    def on_recording_started(self) -> None:
+        """Complete the pending play when OBS reports the recording started."""
+        now = self.clock()
+
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+            if pending is None or pending.requested_at is None:
+                return
+            if now - pending.requested_at > MAX_START_WAIT:
+                return
+
+            durations = {
+                "confirmation": pending.confirmed_at - pending.detected_at,
+                "start_delay": pending.requested_at - pending.confirmed_at,
+                "obs": now - pending.requested_at,
+                "total": now - pending.detected_at,
+            }
+            histograms = self._histograms.setdefault(
+                pending.game, {stage: LatencyHistogram() for stage in STAGES}
+            )
+            for stage, seconds in durations.items():
+                histograms[stage].record(int(seconds * 1_000_000))
+
+        logging.debug(
+            "[Latency] %s recording started %.0fms after detection "
+            "(confirmation %.0fms, start delay %.0fms, OBS %.0fms)",
+            pending.game,
+            durations["total"] * 1000,
+            durations["confirmation"] * 1000,
+            durations["start_delay"] * 1000,
+            durations["obs"] * 1000,
+        )
+
+    def on_recording_stopped(self, output_path: str) -> None:
+        """Recording stops are not part of start latency."""
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summarize the measured latencies.
+
+        Returns:
+            Mapping of game shortname to stage to count, p50, p95 and max in
+            milliseconds
+        """
+        with self._lock:
+            result = {}
+            for game, histograms in sorted(self._histograms.items()):
+                result[game] = {
+                    stage: {
+                        "count": histogram.count,
+                        "p50": round(histogram.percentile(50) / 1000, 1),
+                        "p95": round(histogram.percentile(95) / 1000, 1),
+                        "max": round(histogram.max_micros / 1000, 1),
+                    }
+                    for stage, histogram in histograms.items()
+                }
+            return result
+
+    def cleanup(self) -> None:
+        """Log the session's latency summary."""
+        for game, stages in self.summary().items():
+            total = stages["total"]
+            logging.info(
+                "[Latency] %s: %d recordings, detection to recording p50 %.0fms, "
+                "p95 %.0fms, max %.0fms",
+                game,
+                total["count"],
+                total["p50"],
+                total["p95"],
+                total["max"],
+            )
@@ -0,0 +1,209 @@
+"""
+Incremental reader for Java XML log files.
+
+Java's XMLFormatter appends one <record> element per log call and only closes
+the <log> root when the logger shuts down. Instead of re-reading and
+re-parsing the whole file on every detection tick, this reader remembers how
+far it got in each file and only parses records appended since then.
+"""
+
+import codecs
+import logging
+import os
+import xml.etree.ElementTree as ET
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+RECORD_START = "<record>"
+RECORD_END = "</record>"
+ENTRY_FIELDS = ("class", "method", "message", "date")
+
+
+def _new_decoder() -> codecs.IncrementalDecoder:
+    """Create a UTF-8 decoder that tolerates split multi-byte sequences."""
+    return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+@dataclass
+class _LogCursor:
+    """Read position and parsed tail of a single log file."""
+
+    identity: Tuple[int, int]
+    entries: Deque[Dict[str, str]]
+    offset: int = 0
+    pending: str = ""
+    decoder: codecs.IncrementalDecoder = field(default_factory=_new_decoder)
+    parser: Optional[ET.XMLPullParser] = None
+    root: Optional[ET.Element] = None
+
+
+class IncrementalLogReader:
+    """
+    Tail-based reader keeping the most recent entries of each log file.
+
+    Each file is tracked by path together with its identity (device and inode
+    or file index), so a rotated file is detected and read from scratch. A
+    file that shrinks below the last read position is treated as truncated
+    and reset as well.
+
+    When a file is first seen only its last initial_tail_bytes are read, which
+    is plenty to fill the entry ring without paying for the whole session.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        initial_tail_bytes: int = 256 * 1024,
+        max_pending_chars: int = 1024 * 1024,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            capacity: Number of recent entries kept per file
+            initial_tail_bytes: Bytes read from the end of a newly seen file
+            max_pending_chars: Upper bound for an unterminated record before
+                it is discarded
+        """
+        self.capacity = capacity
+        self.initial_tail_bytes = initial_tail_bytes
+        self.max_pending_chars = max_pending_chars
+        self._cursors: Dict[str, _LogCursor] = {}
+
+    def read(self, log_path: str, max_entries: int = 100) -> List[Dict[str, str]]:
+        """
+        Read new records from a log file and return the most recent entries.
+
+        Args:
+            log_path: Path to the XML log file
+            max_entries: Maximum number of recent entries to return
+
+        Returns:
+            List of dictionaries with 'class', 'method', 'message' and 'date'
+            keys, oldest first
+        """
+        try:
+            stat = os.stat(log_path)
+        except OSError:
+            self._cursors.pop(log_path, None)
+            return []
+
+        cursor = self._get_cursor(log_path, stat, max_entries)
+
+        if stat.st_size > cursor.offset:
+            try:
+                with open(log_path, "rb") as f:
+                    f.seek(cursor.offset)
+                    data = f.read(stat.st_size - cursor.offset)
+            except (PermissionError, OSError) as e:
+                logging.debug("[LogService] File access error for %s: %s", log_path, e)
+                data = b""
+
+            if data:
+                cursor.offset += len(data)
+                self._consume(log_path, cursor, cursor.decoder.decode(data))
+
+        if max_entries >= len(cursor.entries):
+            return list(cursor.entries)
+        return list(cursor.entries)[-max_entries:]
+
+    def reset(self, log_path: Optional[str] = None) -> None:
+        """
+        Forget the read position of one file, or of all files.
+
+        Args:
+            log_path: File to reset, or None to reset everything
+        """
+        if log_path is None:
+            self._cursors.clear()
+        else:
+            self._cursors.pop(log_path, None)
+
+    def _get_cursor(
+        self, log_path: str, stat: os.stat_result, max_entries: int
+    ) -> _LogCursor:
+        """Get the cursor for a file, resetting it on rotation or truncation."""
+        identity = (stat.st_dev, stat.st_ino)
+        cursor = self._cursors.get(log_path)
+
+        if cursor is not None:
+            if cursor.identity != identity:
+                logging.debug("[LogService] Log file replaced: %s", log_path)
+                cursor = None
+            elif stat.st_size < cursor.offset:
+                logging.debug("[LogService] Log file truncated: %s", log_path)
+                cursor = None
+
+        if cursor is None:
+            cursor = _LogCursor(
+                identity=identity,
+                entries=deque(maxlen=max(self.capacity, max_entries)),
+                offset=max(0, stat.st_size - self.initial_tail_bytes),
+            )
+            self._cursors[log_path] = cursor
+        elif max_entries > cursor.entries.maxlen:
+            cursor.entries = deque(cursor.entries, maxlen=max_entries)
+
+        return cursor
+
+    def _consume(self, log_path: str, cursor: _LogCursor, text: str) -> None:
+        """Parse every complete record in the pending text."""
+        pending = cursor.pending + text
+        position = 0
+
+        while True:
+            start = pending.find(RECORD_START, position)
+            if start < 0:
+                # Keep just enough to complete a record tag split across reads
+                position = max(position, len(pending) - len(RECORD_START) + 1)
+                break
+
+            end = pending.find(RECORD_END, start)
+            if end < 0:
+                position = start
+                break
+
+            end += len(RECORD_END)
+            self._parse_record(log_path, cursor, pending[start:end])
+            position = end
+
+        cursor.pending = pending[position:]
+
+        if len(cursor.pending) > self.max_pending_chars:
+            logging.debug(
+                "[LogService] Dropping oversized incomplete record in %s", log_path
+            )
+            cursor.pending = ""
+
+    def _parse_record(self, log_path: str, cursor: _LogCursor, chunk: str) -> None:
+        """Feed one <record> element to the pull parser and store its entry."""
+        if cursor.parser is None:
+            cursor.parser = ET.XMLPullParser(events=("start", "end"))
+            cursor.parser.feed("<log>")
+            for _, element in cursor.parser.read_events():
+                cursor.root = element
+
+        try:
+            cursor.parser.feed(chunk)
+            events = list(cursor.parser.read_events())
+        except ET.ParseError as e:
+            logging.debug(
+                "[LogService] XML error in %s: %s (skipping record)", log_path, e
+            )
+            cursor.parser = None
+            cursor.root = None
+            return
+
+        for event, element in events:
+            if event != "end" or element.tag != "record":
+                continue
+
+            entry = {
+                name: (element.findtext(name) or "").strip() for name in ENTRY_FIELDS
+            }
+            if entry["class"] and entry["method"]:
+                cursor.entries.append(entry)
+
+            if cursor.root is not None:
+                cursor.root.remove(element)
@@ -8,20 +8,33 @@ for log-based game state detection.
 import ctypes
 import logging
 import os
-import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional, Tuple
 
-import psutil
-import wmi
+from src.core.metrics import PipelineMetrics, metrics
+from src.detection.log_reader import IncrementalLogReader
+from src.detection.process_metadata import ProcessMetadataCache
 
 
 class LogService:
     """Service for Java process detection and log file reading."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        process_cache: Optional[ProcessMetadataCache] = None,
+        pipeline_metrics: PipelineMetrics = metrics,
+    ):
+        """
+        Initialize the log service.
+
+        Args:
+            process_cache: Process metadata cache used for JAR lookups
+            pipeline_metrics: Registry for log parse times
+        """
         self.user32 = ctypes.windll.user32
-        self._wmi_conn = None
+        self.processes = process_cache or ProcessMetadataCache()
+        self.metrics = pipeline_metrics
         self._log_cache: Dict[str, List[Dict[str, str]]] = {}
+        self._reader = IncrementalLogReader()
 
     def get_foreground_java_process_info(self) -> Optional[Tuple[int, str]]:
         """
@@ -38,18 +51,45 @@ class LogService:
         self.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
         pid_value = pid.value
 
-        try:
-            process = psutil.Process(pid_value)
-            if process.name().lower() != "java.exe":
-                return None
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return None
-
-        jar_path = self._get_jar_path_from_java_process(pid_value)
+        jar_path = self.get_java_jar_path(pid_value)
         if jar_path:
             return (pid_value, jar_path)
         return None
 
+    def get_java_jar_path(self, pid: int) -> Optional[str]:
+        """
+        Get the JAR path of a process if it is Java.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            Absolute JAR path, or None if the process is not Java or has no JAR
+        """
+        metadata = self.processes.get(pid)
+        if metadata is None or not metadata.is_java:
+            return None
+
+        return metadata.jar_path
+
+    def read_game_log(self, pid: int, log_filename: str) -> List[Dict[str, str]]:
+        """
+        Read the log entries of the log file next to a Java process's JAR.
+
+        Args:
+            pid: Process ID of the Java game
+            log_filename: Name of the log file to look for
+
+        Returns:
+            List of structured log entry dictionaries or empty list if not found
+        """
+        log_path = self.processes.get_log_path(pid, log_filename)
+        if not log_path:
+            logging.debug("[LogService] Log file '%s' not found", log_filename)
+            return []
+
+        return self.read_log_entries(log_path)
+
     def find_log_file(self, jar_path: str, log_filename: str) -> Optional[str]:
         """
         Find a log file in the same directory as the JAR file.
@@ -74,6 +114,9 @@ class LogService:
         """
         Read recent log entries from an XML log file.
 
+        Only records appended since the previous call are parsed; see
+        IncrementalLogReader for how truncation and rotation are handled.
+
         Args:
             log_path: Path to the XML log file
             max_entries: Maximum number of recent entries to return
@@ -81,67 +124,8 @@ class LogService:
         Returns:
             List of dictionaries with 'class', 'method', 'message' keys from recent log entries
         """
-        try:
-            if not os.path.exists(log_path):
-                return []
-
-            try:
-                with open(log_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except (PermissionError, OSError) as e:
-                logging.debug("[LogService] File access error for %s: %s", log_path, e)
-                return []
-
-            content = self._clean_xml_content(content)
-
-            if not content.strip():
-                logging.debug("[LogService] Empty log file: %s", log_path)
-                return []
-
-            records = ET.fromstring(content).findall(".//record")
-
-            entries = []
-            for record in (
-                records[-max_entries:] if len(records) > max_entries else records
-            ):
-                entry = {
-                    "class": (
-                        record.find("class").text.strip()
-                        if record.find("class") is not None
-                        and record.find("class").text
-                        else ""
-                    ),
-                    "method": (
-                        record.find("method").text.strip()
-                        if record.find("method") is not None
-                        and record.find("method").text
-                        else ""
-                    ),
-                    "message": (
-                        record.find("message").text.strip()
-                        if record.find("message") is not None
-                        and record.find("message").text
-                        else ""
-                    ),
-                    "date": (
-                        record.find("date").text.strip()
-                        if record.find("date") is not None and record.find("date").text
-                        else ""
-                    ),
-                }
-
-                if entry["class"] and entry["method"]:
-                    entries.append(entry)
-
-            return entries
-
-        except ET.ParseError as e:
-            logging.debug(
-                "[LogService] XML error in %s: %s (file may be incomplete/actively being written)",
-                log_path,
-                e,
-            )
-            return []
+        with self.metrics.span("log.parse"):
+            return self._reader.read(log_path, max_entries)
 
     def get_log_entries_for_game(
         self, game_name: str, log_filename: str
@@ -261,74 +245,3 @@ class LogService:
                 return True
 
         return False
-
-    def _clean_xml_content(self, content: str) -> str:
-        """
-        Clean XML content to handle common issues like empty lines and incomplete records.
-
-        Args:
-            content: Raw XML content from the log file
-
-        Returns:
-            Cleaned XML content that can be safely parsed
-        """
-        lines = content.splitlines()
-        cleaned_lines = []
-        in_record = False
-        record_depth = 0
-
-        for line in lines:
-            stripped = line.strip()
-
-            if not stripped:
-                continue
-
-            if "<record>" in stripped:
-                in_record = True
-                record_depth += stripped.count("<record>") - stripped.count("</record>")
-            elif "</record>" in stripped:
-                record_depth -= stripped.count("</record>") - stripped.count("<record>")
-                if record_depth <= 0:
-                    in_record = False
-                    record_depth = 0
-
-            if (
-                stripped.startswith("<?xml")
-                or stripped.startswith("<!DOCTYPE")
-                or stripped.startswith("<log>")
-                or stripped.startswith("</log>")
-                or (in_record and record_depth > 0)
-                or stripped == "</record>"
-            ):
-                cleaned_lines.append(line)
-
-        cleaned_content = "\n".join(cleaned_lines)
-
-        if "</log>" not in cleaned_content and "<log>" in cleaned_content:
-            cleaned_content += "\n</log>"
-
-        return cleaned_content
-
-    def _get_jar_path_from_java_process(self, pid: int) -> Optional[str]:
-        if not self._wmi_conn:
-            self._wmi_conn = wmi.WMI()
-
-        processes = self._wmi_conn.Win32_Process(ProcessId=pid)
-        if not processes:
-            return None
-
-        cmdline = processes[0].CommandLine
-        if not cmdline or "-cp" not in cmdline:
-            return None
-
-        cwd = psutil.Process(pid).cwd()
-
-        cp_part = cmdline.split("-cp", 1)[1].strip()
-        cp_entries = cp_part.split(" ", 1)[0]
-
-        for entry in cp_entries.split(";"):
-            if entry.lower().endswith(".jar"):
-                if not os.path.isabs(entry):
-                    entry = os.path.join(cwd, entry)
-                return os.path.abspath(entry)
-        return None
@@ -0,0 +1,328 @@
+"""
+Process metadata lookup and caching.
+
+Finding the JAR of a Java game needs a WMI query for the command line plus a
+working directory lookup, which is by far the slowest call of log detection.
+The result never changes for the lifetime of a process, so it is cached per
+(pid, create time) and evicted once the process exits.
+"""
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+import psutil
+import wmi
+
+JAVA_EXE = "java.exe"
+
+ProcessKey = Tuple[int, float]
+
+
+@dataclass(frozen=True)
+class ProcessMetadata:
+    """Static information about a running process."""
+
+    pid: int
+    create_time: float
+    exe_name: str
+    cmdline: str = ""
+    cwd: str = ""
+    jar_path: Optional[str] = None
+    # False if the JAR could not be resolved yet and the lookup should be
+    # retried, e.g. because the working directory was not readable
+    complete: bool = True
+
+    @property
+    def key(self) -> ProcessKey:
+        """Identity of the process, stable against PID reuse."""
+        return (self.pid, self.create_time)
+
+    @property
+    def is_java(self) -> bool:
+        """Check if the process is a Java runtime."""
+        return self.exe_name.lower() == JAVA_EXE
+
+
+def find_jar_entry(cmdline: str) -> Optional[str]:
+    """
+    Find the first JAR of a Java command line's classpath.
+
+    Args:
+        cmdline: Full command line of the Java process
+
+    Returns:
+        The classpath entry as written, or None if the classpath has no JAR
+    """
+    if not cmdline or "-cp" not in cmdline:
+        return None
+
+    cp_part = cmdline.split("-cp", 1)[1].strip()
+    cp_entries = cp_part.split(" ", 1)[0]
+
+    for entry in cp_entries.split(";"):
+        if entry.lower().endswith(".jar"):
+            return entry
+    return None
+
+
+def parse_jar_path(cmdline: str, cwd: Optional[str]) -> Optional[str]:
+    """
+    Extract the first JAR of a Java command line's classpath.
+
+    Args:
+        cmdline: Full command line of the Java process
+        cwd: Working directory of the process, used for relative entries
+
+    Returns:
+        Absolute JAR path, or None if the classpath has no JAR or the JAR is
+        relative and the working directory is unknown
+    """
+    entry = find_jar_entry(cmdline)
+    if entry is None:
+        return None
+
+    if not os.path.isabs(entry):
+        if not cwd:
+            return None
+        entry = os.path.join(cwd, entry)
+    return os.path.abspath(entry)
+
+
+class IProcessMetadataProvider(ABC):
+    """Interface for looking up process metadata from the system."""
+
+    @abstractmethod
+    def get_create_time(self, pid: int) -> Optional[float]:
+        """Get a process's create time, or None if it does not exist."""
+
+    @abstractmethod
+    def fetch(self, pid: int) -> Optional[ProcessMetadata]:
+        """Look up the full metadata of a process."""
+
+
+class Win32ProcessMetadataProvider(IProcessMetadataProvider):
+    """Looks up process metadata through psutil and WMI."""
+
+    def __init__(self):
+        self._wmi_conn = None
+
+    def get_create_time(self, pid: int) -> Optional[float]:
+        """Get a process's create time through psutil."""
+        try:
+            return psutil.Process(pid).create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    def fetch(self, pid: int) -> Optional[ProcessMetadata]:
+        """
+        Look up a process's metadata.
+
+        The command line is only queried for Java processes, and the working
+        directory only if their JAR is given relative to it. If it cannot be
+        read, the metadata is marked incomplete so the lookup is retried.
+        """
+        try:
+            process = psutil.Process(pid)
+            exe_name = process.name()
+            create_time = process.create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+        if exe_name.lower() != JAVA_EXE:
+            return ProcessMetadata(pid=pid, create_time=create_time, exe_name=exe_name)
+
+        cmdline = self._get_cmdline(pid) or ""
+        jar_entry = find_jar_entry(cmdline)
+        cwd = ""
+        if jar_entry and not os.path.isabs(jar_entry):
+            try:
+                cwd = process.cwd()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        jar_path = parse_jar_path(cmdline, cwd)
+        return ProcessMetadata(
+            pid=pid,
+            create_time=create_time,
+            exe_name=exe_name,
+            cmdline=cmdline,
+            cwd=cwd,
+            jar_path=jar_path,
+            complete=jar_entry is None or jar_path is not None,
+        )
+
+    def _get_cmdline(self, pid: int) -> Optional[str]:
+        """Get a process's command line through WMI."""
+        if not self._wmi_conn:
+            self._wmi_conn = wmi.WMI()
+
+        processes = self._wmi_conn.Win32_Process(ProcessId=pid)
+        if not processes:
+            return None
+
+        return processes[0].CommandLine
+
+
+class StaticProcessMetadataProvider(IProcessMetadataProvider):
+    """In-memory provider for tests, benchmarks and replays."""
+
+    def __init__(self, processes: Iterable[ProcessMetadata] = ()):
+        """
+        Initialize the provider.
+
+        Args:
+            processes: Processes that exist initially
+        """
+        self.processes: Dict[int, ProcessMetadata] = {p.pid: p for p in processes}
+        self.fetch_count = 0
+
+    def add(self, metadata: ProcessMetadata) -> None:
+        """Add or replace a process."""
+        self.processes[metadata.pid] = metadata
+
+    def remove(self, pid: int) -> None:
+        """Remove a process, as if it exited."""
+        self.processes.pop(pid, None)
+
+    def get_create_time(self, pid: int) -> Optional[float]:
+        """Get a process's create time."""
+        metadata = self.processes.get(pid)
+        return metadata.create_time if metadata else None
+
+    def fetch(self, pid: int) -> Optional[ProcessMetadata]:
+        """Get a process's metadata and count the lookup."""
+        self.fetch_count += 1
+        return self.processes.get(pid)
+
+
+@dataclass
+class _CacheEntry:
+    """Cached metadata plus log files resolved next to the process's JAR."""
+
+    metadata: ProcessMetadata
+    log_paths: Dict[str, str] = field(default_factory=dict)
+
+
+class ProcessMetadataCache:
+    """
+    Caches process metadata keyed by (pid, create time).
+
+    A cheap create time lookup is enough to validate an entry, so the full
+    lookup only runs once per process, or until it is complete. Entries of exited processes are pruned
+    periodically.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[IProcessMetadataProvider] = None,
+        prune_interval: float = 10.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            provider: Metadata provider, defaults to psutil and WMI
+            prune_interval: Seconds between sweeps for exited processes
+        """
+        self.provider = provider or Win32ProcessMetadataProvider()
+        self.prune_interval = prune_interval
+        self._entries: Dict[ProcessKey, _CacheEntry] = {}
+        self._last_prune: float = time.monotonic()
+
+    def get(self, pid: int) -> Optional[ProcessMetadata]:
+        """
+        Get a process's metadata, looking it up only on first sight.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            ProcessMetadata or None if the process does not exist
+        """
+        entry = self._get_entry(pid)
+        return entry.metadata if entry else None
+
+    def get_log_path(self, pid: int, log_filename: str) -> Optional[str]:
+        """
+        Find a log file next to a Java process's JAR.
+
+        Found paths are cached with the process. Missing files are looked up
+        again on the next call since games create their logs lazily.
+
+        Args:
+            pid: Process ID of the Java game
+            log_filename: Name of the log file
+
+        Returns:
+            Absolute path to the log file or None if not found
+        """
+        entry = self._get_entry(pid)
+        if entry is None or not entry.metadata.jar_path:
+            return None
+
+        log_path = entry.log_paths.get(log_filename)
+        if log_path is not None:
+            return log_path
+
+        candidate = os.path.join(os.path.dirname(entry.metadata.jar_path), log_filename)
+        if not os.path.exists(candidate):
+            return None
+
+        log_path = os.path.abspath(candidate)
+        entry.log_paths[log_filename] = log_path
+        return log_path
+
+    def is_current(self, metadata: ProcessMetadata) -> bool:
+        """
+        Check that metadata still belongs to the process holding its PID.
+
+        Args:
+            metadata: Metadata looked up earlier
+
+        Returns:
+            False if the process exited or its PID was reused
+        """
+        return self.provider.get_create_time(metadata.pid) == metadata.create_time
+
+    def prune(self) -> None:
+        """Drop entries of processes that have exited."""
+        self._last_prune = time.monotonic()
+
+        for key in list(self._entries):
+            pid, create_time = key
+            if self.provider.get_create_time(pid) != create_time:
+                del self._entries[key]
+                logging.debug("[ProcessMetadata] Evicted exited process %d", pid)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, pid: int) -> Optional[_CacheEntry]:
+        """Get or create the cache entry for a live process."""
+        if time.monotonic() - self._last_prune >= self.prune_interval:
+            self.prune()
+
+        create_time = self.provider.get_create_time(pid)
+        if create_time is None:
+            return None
+
+        entry = self._entries.get((pid, create_time))
+        if entry is not None:
+            return entry
+
+        metadata = self.provider.fetch(pid)
+        if metadata is None:
+            return None
+
+        entry = _CacheEntry(metadata=metadata)
+        if metadata.complete:
+            self._entries[metadata.key] = entry
+        return entry
@@ -1,64 +1,224 @@
 """
 Process monitoring service for detecting running games.
 
-This module handles process detection to identify which games are currently running.
+This module keeps an incremental table of running processes, keyed by
+(pid, create time), to identify which games are currently running. Each scan
+lists the running PIDs and only inspects the ones it has not seen before, so
+a steady system costs a single PID enumeration per scan. Since a PID can be
+reused between two scans, every known PID is checked again now and then.
 """
 
 import logging
 import time
-from typing import List, Tuple
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import psutil
 
+from src.games import Game, GameIndex
+
+ProcessKey = Tuple[int, float]
+
+
+@dataclass(frozen=True)
+class ProcessRecord:
+    """A running process seen by the monitor."""
+
+    pid: int
+    create_time: float
+    name: str
+    name_lower: str = field(init=False)
+    games: Tuple[Game, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "name_lower", self.name.lower())
+
+    @property
+    def key(self) -> ProcessKey:
+        """Identity of the process, stable against PID reuse."""
+        return (self.pid, self.create_time)
+
+
+class IGameProcessHandler(ABC):
+    """Interface for handling game processes starting and exiting."""
+
+    @abstractmethod
+    def on_game_process_started(self, record: ProcessRecord) -> None:
+        """Handle a process of one or more configured games starting."""
+
+    @abstractmethod
+    def on_game_process_exited(self, record: ProcessRecord) -> None:
+        """Handle a process of one or more configured games exiting."""
+
+
+def _inspect_process(pid: int) -> Optional[Tuple[str, float]]:
+    """Get the name and create time of a process through psutil."""
+    try:
+        process = psutil.Process(pid)
+        return process.name(), process.create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
 
 class ProcessMonitor:
     """Service for monitoring running processes to detect active games."""
 
-    def __init__(self, cache_duration: float = 1.0):
+    def __init__(
+        self,
+        games: Iterable[Game] = (),
+        cache_duration: float = 1.0,
+        revalidate_interval: float = 10.0,
+        list_pids: Callable[[], List[int]] = psutil.pids,
+        inspect: Callable[[int], Optional[Tuple[str, float]]] = _inspect_process,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            games: Configured games whose processes are tracked
+            cache_duration: Minimum seconds between two scans
+            revalidate_interval: Seconds between checks of every known PID
+                for reuse, which also retry uninspectable PIDs
+            list_pids: Lists the PIDs of running processes
+            inspect: Gets a process's name and create time, None if unavailable
+        """
         self.cache_duration = cache_duration
-        self._cached_processes: List[Tuple[str, str]] = []
+        self.revalidate_interval = revalidate_interval
+        self.index = GameIndex(list(games))
+        self._list_pids = list_pids
+        self._inspect = inspect
+
+        self._records: Dict[ProcessKey, ProcessRecord] = {}
+        # Key of the process currently holding each known PID
+        self._keys: Dict[int, ProcessKey] = {}
+        self._game_keys: Set[ProcessKey] = set()
+        # PIDs that could not be inspected are retried at the next revalidation
+        self._uninspectable: Set[int] = set()
+        self._pattern_cache: Dict[str, List[ProcessRecord]] = {}
+        self._handlers: List[IGameProcessHandler] = []
         self._cache_time: float = 0.0
+        self._validated_at: float = 0.0
+        self._scanned = False
 
-    def get_running_processes(self, use_cache: bool = True) -> List[Tuple[str, str]]:
+    def register_event_handler(self, handler: IGameProcessHandler) -> None:
         """
-        Get a list of currently running processes.
+        Register a handler for game process events.
 
         Args:
-            use_cache: Whether to use cached results if available
+            handler: Handler notified when game processes start or exit
+        """
+        if handler not in self._handlers:
+            self._handlers.append(handler)
 
-        Returns:
-            List of tuples (process_name, window_title)
+    def refresh(self, force: bool = False) -> bool:
         """
-        current_time = time.time()
+        Scan for started and exited processes.
 
+        Only PIDs that were not running at the previous scan are inspected.
+        Game processes are also checked for PID reuse on every scan, since a
+        reused PID would otherwise keep a game marked as running. All other
+        PIDs are checked every revalidate_interval, so a game that took over
+        a PID between two scans is still noticed.
+
+        Args:
+            force: Scan even if the previous scan is recent
+
+        Returns:
+            True if a scan ran
+        """
+        current_time = time.monotonic()
         if (
-            use_cache
-            and self._cached_processes
+            not force
+            and self._scanned
             and current_time - self._cache_time < self.cache_duration
         ):
-            return self._cached_processes
+            return False
+
+        self._cache_time = current_time
+        self._scanned = True
+
+        try:
+            running = set(self._list_pids())
+        except OSError as e:
+            logging.debug("[ProcessMonitor] Failed to list processes: %s", e)
+            return False
+
+        revalidate = current_time - self._validated_at >= self.revalidate_interval
+        if revalidate:
+            self._validated_at = current_time
+            self._uninspectable.clear()
+            suspects = [key for pid, key in self._keys.items() if pid in running]
+        else:
+            self._uninspectable &= running
+            suspects = [key for key in self._game_keys if key[0] in running]
+
+        exited = [key for pid, key in self._keys.items() if pid not in running]
+        inspected: Dict[int, Optional[Tuple[str, float]]] = {}
+        for key in suspects:
+            pid, create_time = key
+            details = inspected[pid] = self._inspect(pid)
+            if details is None or details[1] != create_time:
+                exited.append(key)
+
+        changed = bool(exited)
+        for key in exited:
+            self._remove(key)
+
+        for pid in running:
+            if pid in self._keys or pid in self._uninspectable:
+                continue
+            details = inspected[pid] if pid in inspected else self._inspect(pid)
+            if details is None:
+                self._uninspectable.add(pid)
+                continue
+            self._add(pid, *details)
+            changed = True
 
-        processes = []
+        if changed:
+            self._pattern_cache.clear()
+        return True
 
-        for proc in psutil.process_iter(["pid", "name"]):
-            try:
-                process_name = proc.info["name"]
+    def get_running_games(self) -> List[Game]:
+        """
+        Get the configured games with a running process.
 
-                window_title = self._get_window_title(proc)
+        Games identified by window title only can not be ruled out from the
+        process table, so they are always included.
 
-                processes.append((process_name, window_title))
+        Returns:
+            Games in priority order
+        """
+        self.refresh()
 
-            except (
-                psutil.NoSuchProcess,
-                psutil.AccessDenied,
-                psutil.ZombieProcess,
-            ):
-                continue
+        running = set(self.index.title_only_games)
+        for key in self._game_keys:
+            running.update(self._records[key].games)
+        return [game for game in self.index.games if game in running]
 
-        self._cached_processes = processes
-        self._cache_time = current_time
+    def any_game_running(self) -> bool:
+        """
+        Check if any configured game could be running.
+
+        Returns:
+            False only if no process of any configured game is running
+        """
+        self.refresh()
+        return bool(self._game_keys or self.index.title_only_games)
+
+    def get_running_processes(self, use_cache: bool = True) -> List[Tuple[str, str]]:
+        """
+        Get a list of currently running processes.
 
-        return processes
+        Args:
+            use_cache: Whether to use cached results if available
+
+        Returns:
+            List of tuples (process_name, window_title). Window titles are
+            not tracked per process, so the process name stands in for it.
+        """
+        self.refresh(force=not use_cache)
+        return [(record.name, record.name) for record in self._records.values()]
 
     def is_process_running(self, process_name: str, window_title: str = "") -> bool:
         """
@@ -71,13 +231,11 @@ class ProcessMonitor:
         Returns:
             True if process is running, False otherwise
         """
-        running_processes = self.get_running_processes()
-
-        for proc_name, proc_title in running_processes:
-            if process_name.lower() in proc_name.lower():
-                if window_title and window_title.lower() not in proc_title.lower():
-                    continue
-                return True
+        title_lower = window_title.lower()
+        for record in self._find(process_name.lower()):
+            if window_title and title_lower not in record.name_lower:
+                continue
+            return True
 
         return False
 
@@ -91,16 +249,8 @@ class ProcessMonitor:
         Returns:
             List of matching (process_name, window_title) tuples
         """
-        running_processes = self.get_running_processes()
-        matching_processes = []
-
-        pattern_lower = pattern.lower().replace("*", "")
-
-        for proc_name, proc_title in running_processes:
-            if pattern_lower in proc_name.lower():
-                matching_processes.append((proc_name, proc_title))
-
-        return matching_processes
+        records = self._find(pattern.lower().replace("*", ""))
+        return [(record.name, record.name) for record in records]
 
     def get_game_processes(
         self, game_process_patterns: List[str]
@@ -114,26 +264,77 @@ class ProcessMonitor:
         Returns:
             List of matching (process_name, window_title) tuples
         """
-        all_matches = []
-
-        for pattern in game_process_patterns:
-            matches = self.find_processes_by_pattern(pattern)
-            all_matches.extend(matches)
-
         seen = set()
         unique_matches = []
-        for proc in all_matches:
-            if proc not in seen:
-                seen.add(proc)
-                unique_matches.append(proc)
+
+        for pattern in game_process_patterns:
+            for proc in self.find_processes_by_pattern(pattern):
+                if proc not in seen:
+                    seen.add(proc)
+                    unique_matches.append(proc)
 
         return unique_matches
 
     def clear_cache(self):
-        """Clear the process cache to force fresh data on next request."""
-        self._cached_processes = []
+        """Clear the process table to force a full scan on next request."""
+        self._records.clear()
+        self._keys.clear()
+        self._game_keys.clear()
+        self._uninspectable.clear()
+        self._pattern_cache.clear()
         self._cache_time = 0.0
+        self._validated_at = 0.0
+        self._scanned = False
         logging.debug("[ProcessMonitor] Cache cleared")
 
-    def _get_window_title(self, process: psutil.Process) -> str:
-        return process.info.get("name", "")
+    def _find(self, needle: str) -> List[ProcessRecord]:
+        """
+        Get the processes whose lowercase name contains a string.
+
+        Results are cached per string until the process table changes.
+        """
+        self.refresh()
+
+        records = self._pattern_cache.get(needle)
+        if records is None:
+            records = [
+                record
+                for record in self._records.values()
+                if needle in record.name_lower
+            ]
+            self._pattern_cache[needle] = records
+        return records
+
+    def _add(self, pid: int, name: str, create_time: float) -> None:
+        """Add a process to the table."""
+        record = ProcessRecord(
+            pid=pid,
+            create_time=create_time,
+            name=name,
+            games=tuple(self.index.match_exe(name)),
+        )
+        self._records[record.key] = record
+        self._keys[pid] = record.key
+
+        if record.games:
+            self._game_keys.add(record.key)
+            logging.debug(
+                "[ProcessMonitor] Game process started: %s (%d)", name, pid
+            )
+            for handler in self._handlers:
+                handler.on_game_process_started(record)
+
+    def _remove(self, key: ProcessKey) -> None:
+        """Drop an exited process from the table."""
+        record = self._records.pop(key)
+        del self._keys[record.pid]
+
+        if key in self._game_keys:
+            self._game_keys.discard(key)
+            logging.debug(
+                "[ProcessMonitor] Game process exited: %s (%d)",
+                record.name,
+                record.pid,
+            )
+            for handler in self._handlers:
+                handler.on_game_process_exited(record)
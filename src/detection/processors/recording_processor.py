@@ -1,19 +1,42 @@
 """
 Handles recording start/stop logic based on state transitions.
+
+Plays are captured in one of two ways. By default a recording is started once
+a play is confirmed and stopped after the result screen. With the replay
+buffer capture mode, the OBS replay buffer runs while a game is focused and is
+saved after the result screen, so the start of the play is never cut off by
+detection and start latency.
 """
 
 import logging
 import os
-import threading
 import time
 from pathlib import Path
+from typing import Optional, Set
 
 from src.audio import SoundService
 from src.config.settings import AppSettings
 from src.core.interfaces.detection import StateTransition
 from src.core.interfaces.obs import IOBSController
+from src.core.scheduler import Scheduler
+from src.core.workers import FILE_OPS, WorkerPool
+from src.detection.latency import StartLatencyTracker
 
 from .scene_processor import SceneProcessor
+from .video_processor import VideoProcessor
+
+
+DELAYED_START = "recording.delayed_start"
+DELAYED_STOP = "recording.delayed_stop"
+REPLAY_DISARM = "recording.replay_disarm"
+
+# Seconds the replay buffer keeps running after the game loses focus, so
+# briefly switching windows does not throw away its contents
+REPLAY_DISARM_DELAY = 10.0
+# How often and how many times to check that the replay buffer has stopped
+# before the default video settings are applied
+REPLAY_STOP_POLL = 0.5
+REPLAY_STOP_ATTEMPTS = 20
 
 
 class RecordingProcessor:
@@ -25,6 +48,10 @@ class RecordingProcessor:
         settings: AppSettings,
         scene_processor: SceneProcessor,
         sound_service: SoundService,
+        scheduler: Scheduler,
+        latency_tracker: Optional[StartLatencyTracker] = None,
+        workers: Optional[WorkerPool] = None,
+        video_processor: Optional[VideoProcessor] = None,
     ):
         """
         Initialize recording processor.
@@ -34,14 +61,82 @@ class RecordingProcessor:
             settings: Application settings
             scene_processor: Optional scene processor for checking recording delays
             sound_service: Sound service for playing sounds
+            scheduler: Scheduler for delayed starts and stops
+            latency_tracker: Optional tracker stamped when a recording is requested
+            workers: Worker pool for deleting discarded recordings, which are
+                deleted inline if not given
+            video_processor: Optional video processor, used to apply the
+                default video settings once the replay buffer has stopped
         """
         self.obs = obs_controller
         self.settings = settings
         self.sound_service = sound_service
         self.scene_processor = scene_processor
+        self.scheduler = scheduler
+        self.latency = latency_tracker
 
         self._delete_next_recording = False
         self._restart_after_stop = False
+        self.workers = workers
+        self.video_processor = video_processor
+
+        # Monotonic time the current play started, in replay buffer mode
+        self._play_started_at: Optional[float] = None
+        self._replay_buffer_length: Optional[float] = None
+
+    def process_game_change(self, game) -> None:
+        """
+        Keep the replay buffer running while a game is focused.
+
+        Does nothing unless plays are captured through the replay buffer.
+
+        Args:
+            game: New focused game or None if no game focused
+        """
+        if not self.settings.uses_replay_buffer:
+            return
+
+        if game is None:
+            self.scheduler.cancel(REPLAY_DISARM)
+            self.scheduler.schedule(
+                REPLAY_DISARM_DELAY, self._disarm_replay_buffer, REPLAY_DISARM
+            )
+            return
+
+        self.scheduler.cancel(REPLAY_DISARM)
+        self.obs.start_replay_buffer()
+        self._replay_buffer_length = self.obs.get_replay_buffer_length()
+
+    def _disarm_replay_buffer(self) -> None:
+        """Stop the replay buffer once focus has stayed away from games."""
+        self.obs.stop_replay_buffer()
+        self._restore_default_video(REPLAY_STOP_ATTEMPTS)
+
+    def _restore_default_video(self, attempts: int) -> None:
+        """
+        Apply the default video settings once OBS reports the buffer stopped.
+
+        Args:
+            attempts: Remaining checks before giving up
+        """
+        if self.video_processor is None:
+            return
+
+        if self.obs.replay_buffer_active:
+            if attempts > 1:
+                self.scheduler.schedule(
+                    REPLAY_STOP_POLL,
+                    lambda: self._restore_default_video(attempts - 1),
+                    REPLAY_DISARM,
+                )
+            else:
+                logging.warning(
+                    "[Recording] Replay buffer did not stop, "
+                    "keeping the current video settings"
+                )
+            return
+
+        self.video_processor.process_game_change(None)
 
     def process_transition(self, transition: StateTransition) -> None:
         """
@@ -59,18 +154,36 @@ class RecordingProcessor:
             transition.to_state,
         )
 
+        if "discard_play" in patterns:
+            self.scheduler.cancel(DELAYED_START)
+            if self.latency:
+                self.latency.cancel()
+
+        if self.settings.uses_replay_buffer:
+            self._process_replay_transition(transition, patterns)
+            return
+
         if "restart" in patterns and self.obs.recording_active:
             logging.debug("Play restarted")
+            self.scheduler.cancel(DELAYED_STOP)
             self._delete_next_recording = True
             self._restart_after_stop = True
             self._stop_recording(immediate=True)
             return
 
+        if "start_play" in patterns and self.scheduler.has_pending(DELAYED_STOP):
+            logging.debug("New play during result wait, stopping now")
+            self.scheduler.cancel(DELAYED_STOP)
+            self._restart_after_stop = True
+            self._stop_recording(immediate=True)
+            return
+
         if "start_play" in patterns and not self.obs.recording_active:
             self._start_recording(play_sound=True)
             return
 
         if "discard_play" in patterns and self.obs.recording_active:
+            self.scheduler.cancel(DELAYED_STOP)
             self._delete_next_recording = True
             self._restart_after_stop = False
             self._stop_recording(immediate=True, sound="failed")
@@ -80,6 +193,75 @@ class RecordingProcessor:
             self._stop_recording(immediate=False)
             return
 
+    def _process_replay_transition(
+        self, transition: StateTransition, patterns: Set[str]
+    ) -> None:
+        """
+        Process a state transition when plays are saved from the replay buffer.
+
+        Discarded and restarted plays are simply not saved.
+
+        Args:
+            transition: State transition to process
+            patterns: Patterns triggered by the transition
+        """
+        if "restart" in patterns and self._play_started_at is not None:
+            logging.debug("Play restarted")
+            self.scheduler.cancel(DELAYED_STOP)
+            self._begin_play(transition)
+            return
+
+        if "start_play" in patterns and self.scheduler.cancel(DELAYED_STOP):
+            logging.debug("New play during result wait, saving now")
+            self._save_replay()
+
+        if "start_play" in patterns and self._play_started_at is None:
+            self._begin_play(transition)
+            return
+
+        if "discard_play" in patterns and self._play_started_at is not None:
+            self.scheduler.cancel(DELAYED_STOP)
+            self._play_started_at = None
+            self.sound_service.play_failed()
+            return
+
+        if "stop_play" in patterns and self._play_started_at is not None:
+            logging.debug(
+                "Waiting %ss before saving replay",
+                self.settings.result_wait,
+            )
+            self.scheduler.cancel(DELAYED_STOP)
+            self.scheduler.schedule(
+                self.settings.result_wait, self._save_replay, DELAYED_STOP
+            )
+
+    def _begin_play(self, transition: StateTransition) -> None:
+        """Mark the start of a play that will be saved from the replay buffer."""
+        self._play_started_at = transition.detected_at or transition.monotonic
+        self.sound_service.play_start()
+        # The replay buffer only lags behind if OBS reconnected after focus
+        self.obs.start_replay_buffer()
+        if self.latency:
+            self.latency.cancel()
+
+    def _save_replay(self) -> None:
+        """Save the replay buffer, which should reach back to the play's start."""
+        if self._play_started_at is None:
+            return
+
+        lookback = time.monotonic() - self._play_started_at
+        self._play_started_at = None
+
+        if self._replay_buffer_length and lookback > self._replay_buffer_length:
+            logging.warning(
+                "Play took %.0fs but the OBS replay buffer only keeps %.0fs, "
+                "its start is cut off",
+                lookback,
+                self._replay_buffer_length,
+            )
+
+        self.obs.save_replay_buffer()
+
     def handle_recording_completed(self, output_path: str) -> bool:
         """
         Handle recording completion.
@@ -99,12 +281,11 @@ class RecordingProcessor:
             self._start_recording(play_sound=True)
 
         if should_delete:
-
-            def _delete_recording():
+            if self.workers:
+                self.workers.submit(FILE_OPS, self._delete_recording, output_path)
+            else:
                 self._delete_recording(output_path)
 
-            threading.Thread(target=_delete_recording, daemon=True).start()
-
         return should_delete
 
     def _start_recording(self, play_sound: bool = True) -> None:
@@ -123,11 +304,11 @@ class RecordingProcessor:
                 )
 
                 def _delayed_start():
-                    time.sleep(delay_remaining)
                     if not self.obs.recording_active:
                         self._start_recording_immediate(play_sound=play_sound)
 
-                threading.Thread(target=_delayed_start, daemon=True).start()
+                self.scheduler.cancel(DELAYED_START)
+                self.scheduler.schedule(delay_remaining, _delayed_start, DELAYED_START)
                 return
 
         self._start_recording_immediate(play_sound=play_sound)
@@ -136,6 +317,8 @@ class RecordingProcessor:
         """Start recording with optional sound feedback."""
         if play_sound:
             self.sound_service.play_start()
+        if self.latency:
+            self.latency.on_start_requested()
         self.obs.start_recording()
 
     def stop_recording_immediate(self, play_failed: bool = False) -> None:
@@ -148,14 +331,56 @@ class RecordingProcessor:
         """Mark the next recording for deletion."""
         self._delete_next_recording = True
 
+    def handle_game_exit(self) -> None:
+        """
+        Handle the current game closing or losing focus.
+
+        A recording waiting out the result screen is a finished play and is
+        stopped and kept. Any other active recording is stopped and deleted.
+        Plays captured through the replay buffer are saved or dropped alike.
+        """
+        self.scheduler.cancel(DELAYED_START)
+        self._restart_after_stop = False
+        if self.latency:
+            self.latency.cancel()
+
+        if self.settings.uses_replay_buffer:
+            if self.scheduler.cancel(DELAYED_STOP):
+                logging.debug("Game exited during result wait, saving now")
+                self._save_replay()
+            elif self._play_started_at is not None:
+                logging.debug("Game exited during a play, discarding it")
+                self._play_started_at = None
+                self.sound_service.play_failed()
+            return
+
+        if self.scheduler.cancel(DELAYED_STOP):
+            logging.debug("Game exited during result wait, stopping now")
+            self._stop_recording(immediate=True)
+            return
+
+        if self.obs.recording_active:
+            logging.debug("Game exited while recording, stopping and deleting")
+            self.mark_for_deletion()
+            self.stop_recording_immediate(play_failed=True)
+
     def _stop_recording(self, immediate: bool, sound: str = None) -> None:
-        """Stop recording with optional delay and sound feedback."""
+        """Stop recording now, or once the result wait has passed."""
         if not immediate:
             logging.debug(
                 "Waiting %ss before stopping",
                 self.settings.result_wait,
             )
-            time.sleep(self.settings.result_wait)
+
+            def _delayed_stop():
+                if self.obs.recording_active:
+                    self._stop_recording(immediate=True, sound=sound)
+
+            self.scheduler.cancel(DELAYED_STOP)
+            self.scheduler.schedule(
+                self.settings.result_wait, _delayed_stop, DELAYED_STOP
+            )
+            return
 
         if sound:
             self.sound_service.play_sound(sound)
@@ -24,9 +24,17 @@ class VideoProcessor:
         """
         Handle game focus change by switching OBS video settings based on game.
 
+        While the replay buffer is kept running after focus left a game, the
+        default settings are left for RecordingProcessor to apply once it has
+        stopped, since changing them would restart the buffer and empty it.
+
         Args:
             game: New focused game or None if no game focused
         """
+        if game is None and self.settings.uses_replay_buffer:
+            if self.obs.replay_buffer_active:
+                return None
+
         current_video_settings = self.obs.get_video_settings()
         if current_video_settings is None:
             return None
@@ -7,47 +7,55 @@ This module captures only the focused window's client area for pattern matching.
 import logging
 from typing import Optional
 
-import mss
-import win32gui
 from mss.screenshot import ScreenShot
 
+from src.detection.capture import CaptureSession, ICaptureBackend, Win32CaptureBackend
+from src.games import PixelGame, RegionFrame
+
 
 class ScreenCaptureService:
     """Service for capturing the focused window's client area for pixel-based detection."""
 
-    def __init__(self):
+    def __init__(self, backend: Optional[ICaptureBackend] = None):
+        """
+        Initialize the screen capture service.
+
+        Args:
+            backend: Capture backend to use, defaults to the Win32/mss backend
+        """
+        self.session = CaptureSession(backend or Win32CaptureBackend())
         logging.debug("[ScreenCapture] Service initialized")
 
+    @property
+    def backend(self) -> ICaptureBackend:
+        """Get the capture backend in use."""
+        return self.session.backend
+
     def capture_focused_window(self) -> Optional[ScreenShot]:
         """
         Capture a screenshot of the focused window's client area (excluding window decorations).
 
         Returns:
-            mss.ScreenShot: Screenshot object from mss with the focused window's content
-
-        Raises:
-            Exception: If no focused window found or capture fails
+            mss.ScreenShot: Screenshot object from mss with the focused window's content,
+            or None if no window is focused
         """
-        hwnd = win32gui.GetForegroundWindow()
+        return self.session.grab_window()
 
-        if not hwnd:
-            return None
-
-        client_rect = win32gui.GetClientRect(hwnd)
+    def capture_focused_regions(self, game: PixelGame) -> Optional[RegionFrame]:
+        """
+        Capture only the parts of the focused window that the game's patterns read.
 
-        top_left = win32gui.ClientToScreen(hwnd, (client_rect[0], client_rect[1]))
-        bottom_right = win32gui.ClientToScreen(hwnd, (client_rect[2], client_rect[3]))
+        The regions are chosen from the game's compiled patterns for the current
+        client size and packed into a single reusable buffer.
 
-        monitor = {
-            "left": top_left[0],
-            "top": top_left[1],
-            "width": bottom_right[0] - top_left[0],
-            "height": bottom_right[1] - top_left[1],
-        }
+        Args:
+            game: Pixel game whose patterns decide which regions to grab
 
-        with mss.mss() as sct:
-            screenshot = sct.grab(monitor)
-        return screenshot
+        Returns:
+            RegionFrame with the packed regions, or None if no window is focused
+            or the game has no patterns for the current client size
+        """
+        return self.session.grab_regions(game.matcher.get_layout)
 
     def get_focused_window_title(self) -> str:
         """
@@ -56,7 +64,9 @@ class ScreenCaptureService:
         Returns:
             Window title or empty string if no window focused
         """
-        hwnd = win32gui.GetForegroundWindow()
-        if hwnd:
-            return win32gui.GetWindowText(hwnd)
-        return ""
+        return self.session.backend.get_foreground_title()
+
+    def cleanup(self) -> None:
+        """Release the capture session."""
+        self.session.close()
+        logging.debug("[ScreenCapture] Session closed")
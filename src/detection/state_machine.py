@@ -4,12 +4,17 @@ Lightweight state machine with history and transition pattern matching.
 This module provides a small, focused state machine that tracks a bounded
 history of confirmed states and detects when certain transition sequences
 occur (e.g., ["Playing", "Unknown", "Playing"], ["*", "Unknown"]).
+
+Patterns are compiled into a trie of their reversed sequences, so matching a
+push walks back through the history only as deep as the longest pattern,
+regardless of how many patterns are registered.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
 WILDCARD = "*"
 
@@ -28,6 +33,27 @@ class TransitionPattern:
     sequence: Tuple[str, ...]
 
 
+@dataclass
+class _SuffixNode:
+    """Trie node for one position of reversed pattern sequences."""
+
+    children: Dict[str, "_SuffixNode"] = field(default_factory=dict)
+    wildcard: Optional["_SuffixNode"] = None
+    terminals: List[int] = field(default_factory=list)
+
+    def child(self, token: str) -> "_SuffixNode":
+        """Get or create the child for a token."""
+        if token == WILDCARD:
+            if self.wildcard is None:
+                self.wildcard = _SuffixNode()
+            return self.wildcard
+
+        node = self.children.get(token)
+        if node is None:
+            node = self.children[token] = _SuffixNode()
+        return node
+
+
 class StateMachine:
     """
     Simple state machine with bounded history and pattern detection.
@@ -41,8 +67,9 @@ class StateMachine:
 
     def __init__(self, max_history: int = 10):
         self._max_history: int = max(2, max_history)
-        self._history: List[str] = []
+        self._history: Deque[str] = deque(maxlen=self._max_history)
         self._patterns: List[TransitionPattern] = []
+        self._suffix_trie = _SuffixNode()
         self._last_matches: List[str] = []
 
     @property
@@ -69,6 +96,11 @@ class StateMachine:
         """Add a single pattern."""
         if not pattern.sequence:
             return
+
+        node = self._suffix_trie
+        for token in reversed(pattern.sequence):
+            node = node.child(token)
+        node.terminals.append(len(self._patterns))
         self._patterns.append(pattern)
 
     def add_patterns(self, patterns: Sequence[TransitionPattern]) -> None:
@@ -86,9 +118,6 @@ class StateMachine:
             return
 
         self._history.append(new_state)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history :]
-
         self._last_matches = self._match_tail_patterns()
 
     def get_last_matches(self) -> List[str]:
@@ -96,19 +125,25 @@ class StateMachine:
         return list(self._last_matches)
 
     def _match_tail_patterns(self) -> List[str]:
-        matches: List[str] = []
-        for pattern in self._patterns:
-            if self._history_ends_with(pattern.sequence):
-                matches.append(pattern.name)
-        return matches
-
-    def _history_ends_with(self, sequence: Tuple[str, ...]) -> bool:
-        seq_len = len(sequence)
-        if len(self._history) < seq_len:
-            return False
-        start_index = len(self._history) - seq_len
-        for i, token in enumerate(sequence):
-            state_value = self._history[start_index + i]
-            if token != WILDCARD and token != state_value:
-                return False
-        return True
+        """Walk the history backwards through the suffix trie."""
+        matched: List[int] = []
+        nodes = [self._suffix_trie]
+
+        for state in reversed(self._history):
+            next_nodes = []
+            for node in nodes:
+                child = node.children.get(state)
+                if child is not None:
+                    next_nodes.append(child)
+                if node.wildcard is not None:
+                    next_nodes.append(node.wildcard)
+
+            if not next_nodes:
+                break
+
+            for node in next_nodes:
+                matched.extend(node.terminals)
+            nodes = next_nodes
+
+        matched.sort()
+        return [self._patterns[index].name for index in matched]
@@ -0,0 +1,12 @@
+"""
+Fake OBS for running the OBS integration without OBS.
+
+FakeOBSServer speaks obs-websocket protocol v5 over a local socket, using
+only the standard library. Unlike src.obs, nothing here imports Windows
+modules, so it also runs in CI on Linux. Run it standalone with
+`python -m src.fake_obs` to point the application at it.
+"""
+
+from .server import FakeOBSServer, FakeOBSState
+
+__all__ = ["FakeOBSServer", "FakeOBSState"]
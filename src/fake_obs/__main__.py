@@ -0,0 +1,68 @@
+"""
+Run the fake OBS server standalone.
+
+Usage:
+    python -m src.fake_obs [--port 4455] [--password PASSWORD]
+                           [--record-dir DIR] [--request-delay SECONDS]
+                           [--output-delay SECONDS]
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from .server import FakeOBSServer
+
+
+def main() -> int:
+    """Entry point for the standalone fake OBS server."""
+    parser = argparse.ArgumentParser(description="Fake OBS WebSocket v5 server")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=4455, help="Port to listen on")
+    parser.add_argument("--password", default="", help="Password clients must use")
+    parser.add_argument(
+        "--record-dir", help="Create recordings and replays in this directory"
+    )
+    parser.add_argument(
+        "--request-delay",
+        type=float,
+        default=0.0,
+        help="Seconds before each request is answered",
+    )
+    parser.add_argument(
+        "--output-delay",
+        type=float,
+        default=0.0,
+        help="Seconds recordings and the replay buffer take to start or stop",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
+    server = FakeOBSServer(
+        host=args.host,
+        port=args.port,
+        password=args.password,
+        record_dir=args.record_dir,
+    )
+    server.request_delay = args.request_delay
+    server.output_delay = args.output_delay
+
+    with server:
+        print(f"Fake OBS listening on ws://{args.host}:{server.port}")
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
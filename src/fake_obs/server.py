@@ -0,0 +1,739 @@
+"""
+In-process stand-in for OBS speaking obs-websocket protocol v5.
+
+FakeOBSServer implements the requests SIGMArec sends and emits the events it
+listens to, so the OBS controller, the recording flow and their latency can
+be exercised without OBS:
+
+    with FakeOBSServer(password="secret") as server:
+        settings = AppSettings(obs_port=server.port, obs_password="secret")
+        obs = OBSController.connect(settings, background=False)
+        obs.connect_once()
+
+Every request can be delayed or made to fail, outputs can take a while to
+start and stop, and clients can be disconnected or refused to test
+reconnecting.
+"""
+
+import base64
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import secrets
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .websocket import WebSocketClosed, WebSocketConnection
+
+RPC_VERSION = 1
+OBS_VERSION = "30.2.0"
+OBS_WEBSOCKET_VERSION = "5.5.0"
+
+OP_HELLO = 0
+OP_IDENTIFY = 1
+OP_IDENTIFIED = 2
+OP_REIDENTIFY = 3
+OP_EVENT = 5
+OP_REQUEST = 6
+OP_REQUEST_RESPONSE = 7
+OP_REQUEST_BATCH = 8
+OP_REQUEST_BATCH_RESPONSE = 9
+
+# Request status codes
+SUCCESS = 100
+UNKNOWN_REQUEST_TYPE = 204
+MISSING_REQUEST_FIELD = 300
+OUTPUT_RUNNING = 500
+OUTPUT_NOT_RUNNING = 501
+RESOURCE_NOT_FOUND = 600
+INVALID_RESOURCE_STATE = 604
+
+# WebSocket close codes
+CLOSE_AUTHENTICATION_FAILED = 4009
+CLOSE_NOT_IDENTIFIED = 4007
+
+# Event subscription categories
+SUB_SCENES = 1 << 2
+SUB_OUTPUTS = 1 << 6
+
+EVENT_CATEGORIES = {
+    "CurrentProgramSceneChanged": SUB_SCENES,
+    "SceneListChanged": SUB_SCENES,
+    "SceneNameChanged": SUB_SCENES,
+    "RecordStateChanged": SUB_OUTPUTS,
+    "ReplayBufferStateChanged": SUB_OUTPUTS,
+    "ReplayBufferSaved": SUB_OUTPUTS,
+}
+
+OUTPUT_STARTING = "OBS_WEBSOCKET_OUTPUT_STARTING"
+OUTPUT_STARTED = "OBS_WEBSOCKET_OUTPUT_STARTED"
+OUTPUT_STOPPING = "OBS_WEBSOCKET_OUTPUT_STOPPING"
+OUTPUT_STOPPED = "OBS_WEBSOCKET_OUTPUT_STOPPED"
+
+REPLAY_BUFFER_OUTPUT = "Replay Buffer"
+LOG_SIZE = 10000
+
+
+class RequestFailure(Exception):
+    """Raised by a request handler to answer with an error status."""
+
+    def __init__(self, code: int, comment: str = ""):
+        super().__init__(comment)
+        self.code = code
+        self.comment = comment
+
+
+@dataclass
+class InjectedFailure:
+    """A failure answered instead of running a request."""
+
+    code: int
+    comment: str
+    remaining: Optional[int] = None
+
+
+@dataclass
+class FakeOBSState:
+    """What the fake OBS instance is currently doing."""
+
+    recording: bool = False
+    replay_buffer_enabled: bool = True
+    replay_buffer: bool = False
+    replay_buffer_length: int = 120
+    scenes: List[str] = field(default_factory=lambda: ["Scene", "Playing", "Result"])
+    current_scene: str = "Scene"
+    video: Dict[str, int] = field(
+        default_factory=lambda: {
+            "baseWidth": 1920,
+            "baseHeight": 1080,
+            "outputWidth": 1920,
+            "outputHeight": 1080,
+            "fpsNumerator": 60,
+            "fpsDenominator": 1,
+        }
+    )
+
+
+class _Client:
+    """A connected client and what it subscribed to."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, connection: WebSocketConnection):
+        self.id = next(self._ids)
+        self.connection = connection
+        self.identified = False
+        self.subscriptions = 0
+
+
+class FakeOBSServer:
+    """A local obs-websocket v5 server backed by a simulated OBS state."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        password: str = "",
+        record_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            host: Address to listen on
+            port: Port to listen on, 0 to pick a free one
+            password: Password clients must authenticate with, empty for none
+            record_dir: Directory where recordings and replays are created as
+                small placeholder files, or None to only report their paths
+        """
+        self.host = host
+        self.password = password
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.state = FakeOBSState()
+
+        # Seconds before each response is sent
+        self.request_delay = 0.0
+        # Seconds outputs take to start or stop after being asked to
+        self.output_delay = 0.0
+        # Seconds every event is held back before being sent
+        self.event_delay = 0.0
+        # Close new connections right away, like a closed OBS would
+        self.refuse_connections = False
+
+        self.requests: Deque[Tuple[float, str]] = deque(maxlen=LOG_SIZE)
+        self.events: Deque[Tuple[float, str]] = deque(maxlen=LOG_SIZE)
+
+        self._failures: Dict[str, InjectedFailure] = {}
+        self._clients: Dict[int, _Client] = {}
+        self._lock = threading.RLock()
+        self._connected = threading.Condition(self._lock)
+
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._timer_ids = itertools.count()
+        self._timers_changed = threading.Condition()
+
+        self._listener = socket.create_server((host, port))
+        self.port = self._listener.getsockname()[1]
+        self._running = False
+        self._threads: List[threading.Thread] = []
+
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "GetVersion": self._get_version,
+            "GetRecordStatus": self._get_record_status,
+            "StartRecord": self._start_record,
+            "StopRecord": self._stop_record,
+            "GetReplayBufferStatus": self._get_replay_buffer_status,
+            "StartReplayBuffer": self._start_replay_buffer,
+            "StopReplayBuffer": self._stop_replay_buffer,
+            "SaveReplayBuffer": self._save_replay_buffer,
+            "GetOutputList": self._get_output_list,
+            "GetOutputSettings": self._get_output_settings,
+            "GetVideoSettings": self._get_video_settings,
+            "SetVideoSettings": self._set_video_settings,
+            "GetCurrentProgramScene": self._get_current_program_scene,
+            "SetCurrentProgramScene": self._set_current_program_scene,
+            "GetSceneList": self._get_scene_list,
+        }
+
+    def __enter__(self) -> "FakeOBSServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def client_count(self) -> int:
+        """Number of identified clients."""
+        with self._lock:
+            return sum(1 for client in self._clients.values() if client.identified)
+
+    def start(self) -> None:
+        """Start accepting connections."""
+        self._running = True
+        for target, name in (
+            (self._accept_loop, "FakeOBS-Accept"),
+            (self._timer_loop, "FakeOBS-Timers"),
+        ):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logging.debug("[FakeOBS] Listening on %s:%d", self.host, self.port)
+
+    def stop(self) -> None:
+        """Disconnect every client and stop the server."""
+        self._running = False
+        try:
+            # Shutting the listener down is what wakes a blocked accept
+            self._listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._listener.close()
+        self.disconnect_clients(clean=True)
+        with self._timers_changed:
+            self._timers_changed.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        self._threads = []
+
+    def disconnect_clients(self, clean: bool = False) -> None:
+        """
+        Drop every client connection.
+
+        Args:
+            clean: Send a close frame first instead of dropping the socket
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            if clean:
+                client.connection.close()
+            else:
+                client.connection.abort()
+
+    def wait_for_clients(self, count: int, timeout: float = 5.0) -> bool:
+        """
+        Wait until at least a number of clients are identified.
+
+        Args:
+            count: Number of clients to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if enough clients are connected
+        """
+        with self._connected:
+            return self._connected.wait_for(
+                lambda: self.client_count >= count, timeout
+            )
+
+    def fail_request(
+        self,
+        request_type: str,
+        code: int = INVALID_RESOURCE_STATE,
+        comment: str = "Injected failure",
+        times: Optional[int] = None,
+    ) -> None:
+        """
+        Make a request fail instead of running.
+
+        Args:
+            request_type: Request to fail
+            code: Status code to answer with
+            comment: Comment to answer with
+            times: Number of times to fail, None for every time
+        """
+        with self._lock:
+            self._failures[request_type] = InjectedFailure(code, comment, times)
+
+    def clear_failures(self) -> None:
+        """Let every request run normally again."""
+        with self._lock:
+            self._failures.clear()
+
+    def emit_event(self, event_type: str, event_data: Optional[Dict] = None) -> None:
+        """
+        Send an event to every subscribed client, after the event delay.
+
+        Args:
+            event_type: obs-websocket event type
+            event_data: Event data
+        """
+        self._after(self.event_delay, lambda: self._broadcast(event_type, event_data))
+
+    def switch_scene(self, scene_name: str) -> None:
+        """Switch the program scene as if done in OBS itself."""
+        with self._lock:
+            self.state.current_scene = scene_name
+        self.emit_event("CurrentProgramSceneChanged", {"sceneName": scene_name})
+
+    def set_scenes(self, scenes: List[str]) -> None:
+        """Replace the scene list as if scenes were added or removed in OBS."""
+        with self._lock:
+            self.state.scenes = list(scenes)
+            event_data = {"scenes": self._scene_entries()}
+        self.emit_event("SceneListChanged", event_data)
+
+    def rename_scene(self, old_name: str, new_name: str) -> None:
+        """Rename a scene as if done in OBS itself."""
+        with self._lock:
+            self.state.scenes = [
+                new_name if scene == old_name else scene for scene in self.state.scenes
+            ]
+            if self.state.current_scene == old_name:
+                self.state.current_scene = new_name
+        self.emit_event(
+            "SceneNameChanged", {"oldSceneName": old_name, "sceneName": new_name}
+        )
+
+    def _accept_loop(self) -> None:
+        """Accept connections, each served by its own thread."""
+        while self._running:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            if self.refuse_connections:
+                sock.close()
+                continue
+
+            thread = threading.Thread(
+                target=self._serve, args=(sock,), name="FakeOBS-Client", daemon=True
+            )
+            thread.start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        """Run one client connection from handshake to close."""
+        connection = WebSocketConnection(sock)
+        client = _Client(connection)
+        with self._lock:
+            self._clients[client.id] = client
+
+        try:
+            connection.handshake(subprotocol="obswebsocket.json")
+            challenge, salt = self._send_hello(client)
+
+            while True:
+                message = json.loads(connection.receive())
+                self._handle_message(client, message, challenge, salt)
+        except (WebSocketClosed, ValueError, KeyError, TypeError) as e:
+            logging.debug("[FakeOBS] Client %d disconnected: %s", client.id, e)
+        finally:
+            with self._connected:
+                self._clients.pop(client.id, None)
+            connection.abort()
+
+    def _send_hello(self, client: _Client) -> Tuple[str, str]:
+        """Greet a new client, with an authentication challenge if needed."""
+        challenge = base64.b64encode(secrets.token_bytes(32)).decode()
+        salt = base64.b64encode(secrets.token_bytes(32)).decode()
+
+        hello: Dict[str, Any] = {
+            "obsWebSocketVersion": OBS_WEBSOCKET_VERSION,
+            "rpcVersion": RPC_VERSION,
+        }
+        if self.password:
+            hello["authentication"] = {"challenge": challenge, "salt": salt}
+        self._send(client, OP_HELLO, hello)
+        return challenge, salt
+
+    def _handle_message(
+        self, client: _Client, message: Dict[str, Any], challenge: str, salt: str
+    ) -> None:
+        """Handle one message from a client."""
+        op = message["op"]
+        data = message.get("d") or {}
+
+        if op == OP_IDENTIFY:
+            if self.password and data.get("authentication") != _auth_string(
+                self.password, challenge, salt
+            ):
+                client.connection.close(
+                    CLOSE_AUTHENTICATION_FAILED, "Authentication failed."
+                )
+                raise WebSocketClosed("Authentication failed")
+            with self._connected:
+                client.identified = True
+                client.subscriptions = data.get("eventSubscriptions", 0) or 0
+                self._connected.notify_all()
+            self._send(client, OP_IDENTIFIED, {"negotiatedRpcVersion": RPC_VERSION})
+            return
+
+        if not client.identified:
+            client.connection.close(CLOSE_NOT_IDENTIFIED, "Not identified.")
+            raise WebSocketClosed("Message before Identify")
+
+        if op == OP_REIDENTIFY:
+            client.subscriptions = data.get("eventSubscriptions", 0) or 0
+            self._send(client, OP_IDENTIFIED, {"negotiatedRpcVersion": RPC_VERSION})
+        elif op == OP_REQUEST:
+            if self.request_delay:
+                time.sleep(self.request_delay)
+            self._send(client, OP_REQUEST_RESPONSE, self._run_request(data))
+        elif op == OP_REQUEST_BATCH:
+            if self.request_delay:
+                time.sleep(self.request_delay)
+            self._send(client, OP_REQUEST_BATCH_RESPONSE, self._run_batch(data))
+
+    def _run_batch(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a request batch serially, optionally halting on a failure."""
+        results = []
+        for request in data.get("requests", []):
+            if request.get("requestType") == "Sleep":
+                result = self._sleep(request)
+            else:
+                result = self._run_request(request)
+            results.append(result)
+            if data.get("haltOnFailure") and not result["requestStatus"]["result"]:
+                break
+        return {"requestId": data.get("requestId"), "results": results}
+
+    def _run_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a request and build its response."""
+        request_type = data.get("requestType", "")
+        response: Dict[str, Any] = {"requestType": request_type}
+        if "requestId" in data:
+            response["requestId"] = data["requestId"]
+        self.requests.append((time.perf_counter(), request_type))
+
+        try:
+            self._check_failure(request_type)
+            handler = self._handlers.get(request_type)
+            if handler is None:
+                raise RequestFailure(
+                    UNKNOWN_REQUEST_TYPE, f"Unknown request type: {request_type}"
+                )
+            with self._lock:
+                response_data = handler(data.get("requestData") or {})
+        except RequestFailure as e:
+            response["requestStatus"] = {
+                "result": False,
+                "code": e.code,
+                "comment": e.comment,
+            }
+            return response
+
+        response["requestStatus"] = {"result": True, "code": SUCCESS}
+        if response_data is not None:
+            response["responseData"] = response_data
+        return response
+
+    def _check_failure(self, request_type: str) -> None:
+        """Raise an injected failure for a request, if any."""
+        with self._lock:
+            failure = self._failures.get(request_type)
+            if failure is None:
+                return
+            if failure.remaining is not None:
+                failure.remaining -= 1
+                if failure.remaining <= 0:
+                    del self._failures[request_type]
+        raise RequestFailure(failure.code, failure.comment)
+
+    def _send(self, client: _Client, op: int, data: Dict[str, Any]) -> None:
+        """Send a message to one client."""
+        client.connection.send(json.dumps({"op": op, "d": data}))
+
+    def _broadcast(self, event_type: str, event_data: Optional[Dict]) -> None:
+        """Send an event to every client subscribed to its category."""
+        category = EVENT_CATEGORIES.get(event_type, 0)
+        message = {"eventType": event_type, "eventIntent": category}
+        if event_data is not None:
+            message["eventData"] = event_data
+
+        with self._lock:
+            clients = [
+                client
+                for client in self._clients.values()
+                if client.identified and client.subscriptions & category
+            ]
+
+        self.events.append((time.perf_counter(), event_type))
+        for client in clients:
+            try:
+                self._send(client, OP_EVENT, message)
+            except WebSocketClosed:
+                pass
+
+    def _after(self, delay: float, action: Callable[[], None]) -> None:
+        """Run an action on the timer thread after a delay."""
+        with self._timers_changed:
+            heapq.heappush(
+                self._timers,
+                (time.monotonic() + delay, next(self._timer_ids), action),
+            )
+            self._timers_changed.notify()
+
+    def _timer_loop(self) -> None:
+        """Run delayed actions, such as events, in the order they fall due."""
+        while True:
+            with self._timers_changed:
+                while self._running and (
+                    not self._timers or self._timers[0][0] > time.monotonic()
+                ):
+                    timeout = None
+                    if self._timers:
+                        timeout = self._timers[0][0] - time.monotonic()
+                    self._timers_changed.wait(timeout)
+                if not self._running:
+                    return
+                _, _, action = heapq.heappop(self._timers)
+
+            try:
+                action()
+            except Exception as e:
+                logging.error("[FakeOBS] Delayed action failed: %s", e)
+
+    def _output_path(self, prefix: str) -> str:
+        """Create the file an output writes, and return its path."""
+        name = f"{prefix} {time.strftime('%Y-%m-%d %H-%M-%S')}.mkv"
+        if self.record_dir is None:
+            return str(Path("recordings") / name)
+
+        self.record_dir.mkdir(parents=True, exist_ok=True)
+        path = self.record_dir / name
+        stem = path.stem
+        for index in itertools.count(1):
+            if not path.exists():
+                break
+            path = self.record_dir / f"{stem} ({index}).mkv"
+        path.write_bytes(os.urandom(1024))
+        return str(path)
+
+    def _change_output(
+        self, event_type: str, active: bool, output_path: Optional[str] = None
+    ) -> None:
+        """Emit the transitional and final state events of an output."""
+        transitional = OUTPUT_STARTING if active else OUTPUT_STOPPING
+        final = OUTPUT_STARTED if active else OUTPUT_STOPPED
+        extra = {}
+        if event_type == "RecordStateChanged":
+            extra["outputPath"] = output_path
+
+        self.emit_event(
+            event_type,
+            {"outputActive": False, "outputState": transitional, **extra},
+        )
+        self._after(
+            self.output_delay,
+            lambda: self.emit_event(
+                event_type, {"outputActive": active, "outputState": final, **extra}
+            ),
+        )
+
+    # Request handlers, called with the server lock held
+
+    def _get_version(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "obsVersion": OBS_VERSION,
+            "obsWebSocketVersion": OBS_WEBSOCKET_VERSION,
+            "rpcVersion": RPC_VERSION,
+            "availableRequests": sorted(self._handlers),
+            "supportedImageFormats": ["png", "jpg"],
+            "platform": "fake",
+            "platformDescription": "SIGMArec fake OBS",
+        }
+
+    def _get_record_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "outputActive": self.state.recording,
+            "outputPaused": False,
+            "outputTimecode": "00:00:00.000",
+            "outputDuration": 0,
+            "outputBytes": 0,
+        }
+
+    def _start_record(self, data: Dict[str, Any]) -> None:
+        if self.state.recording:
+            raise RequestFailure(OUTPUT_RUNNING, "Recording is already active.")
+        self.state.recording = True
+        self._change_output("RecordStateChanged", True)
+
+    def _stop_record(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.state.recording:
+            raise RequestFailure(OUTPUT_NOT_RUNNING, "Recording is not active.")
+        self.state.recording = False
+        output_path = self._output_path("Recording")
+        self._change_output("RecordStateChanged", False, output_path)
+        return {"outputPath": output_path}
+
+    def _require_replay_buffer(self) -> None:
+        if not self.state.replay_buffer_enabled:
+            raise RequestFailure(
+                INVALID_RESOURCE_STATE, "Replay buffer is not available."
+            )
+
+    def _get_replay_buffer_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_replay_buffer()
+        return {"outputActive": self.state.replay_buffer}
+
+    def _start_replay_buffer(self, data: Dict[str, Any]) -> None:
+        self._require_replay_buffer()
+        if self.state.replay_buffer:
+            raise RequestFailure(OUTPUT_RUNNING, "Replay buffer is already active.")
+        self.state.replay_buffer = True
+        self._change_output("ReplayBufferStateChanged", True)
+
+    def _stop_replay_buffer(self, data: Dict[str, Any]) -> None:
+        self._require_replay_buffer()
+        if not self.state.replay_buffer:
+            raise RequestFailure(OUTPUT_NOT_RUNNING, "Replay buffer is not active.")
+        self.state.replay_buffer = False
+        self._change_output("ReplayBufferStateChanged", False)
+
+    def _save_replay_buffer(self, data: Dict[str, Any]) -> None:
+        self._require_replay_buffer()
+        if not self.state.replay_buffer:
+            raise RequestFailure(OUTPUT_NOT_RUNNING, "Replay buffer is not active.")
+        output_path = self._output_path("Replay")
+        self._after(
+            self.output_delay,
+            lambda: self.emit_event(
+                "ReplayBufferSaved", {"savedReplayPath": output_path}
+            ),
+        )
+
+    def _get_output_list(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        outputs = []
+        if self.state.replay_buffer_enabled:
+            outputs.append(
+                {
+                    "outputName": REPLAY_BUFFER_OUTPUT,
+                    "outputKind": "replay_buffer",
+                    "outputActive": self.state.replay_buffer,
+                    "outputWidth": self.state.video["outputWidth"],
+                    "outputHeight": self.state.video["outputHeight"],
+                    "outputFlags": {},
+                }
+            )
+        return {"outputs": outputs}
+
+    def _get_output_settings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        name = data.get("outputName")
+        if name is None:
+            raise RequestFailure(MISSING_REQUEST_FIELD, "Missing outputName.")
+        if name != REPLAY_BUFFER_OUTPUT or not self.state.replay_buffer_enabled:
+            raise RequestFailure(RESOURCE_NOT_FOUND, f"No output named {name}.")
+        return {
+            "outputSettings": {"max_time_sec": self.state.replay_buffer_length}
+        }
+
+    def _get_video_settings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(self.state.video)
+
+    def _set_video_settings(self, data: Dict[str, Any]) -> None:
+        if self.state.recording or self.state.replay_buffer:
+            raise RequestFailure(
+                OUTPUT_RUNNING, "Video settings cannot be changed while outputs run."
+            )
+        for key in self.state.video:
+            if data.get(key) is not None:
+                self.state.video[key] = int(data[key])
+
+    def _get_current_program_scene(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "currentProgramSceneName": self.state.current_scene,
+            "sceneName": self.state.current_scene,
+        }
+
+    def _set_current_program_scene(self, data: Dict[str, Any]) -> None:
+        scene_name = data.get("sceneName")
+        if scene_name is None:
+            raise RequestFailure(MISSING_REQUEST_FIELD, "Missing sceneName.")
+        if scene_name not in self.state.scenes:
+            raise RequestFailure(RESOURCE_NOT_FOUND, f"No scene named {scene_name}.")
+        if scene_name != self.state.current_scene:
+            self.state.current_scene = scene_name
+            self.emit_event("CurrentProgramSceneChanged", {"sceneName": scene_name})
+
+    def _get_scene_list(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "currentProgramSceneName": self.state.current_scene,
+            "currentPreviewSceneName": None,
+            "scenes": self._scene_entries(),
+        }
+
+    def _scene_entries(self) -> List[Dict[str, Any]]:
+        count = len(self.state.scenes)
+        return [
+            {"sceneIndex": count - 1 - index, "sceneName": name}
+            for index, name in enumerate(self.state.scenes)
+        ]
+
+    def _sleep(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Pause a batch, which is the only place OBS allows Sleep."""
+        response: Dict[str, Any] = {"requestType": "Sleep"}
+        if "requestId" in request:
+            response["requestId"] = request["requestId"]
+
+        sleep_millis = (request.get("requestData") or {}).get("sleepMillis")
+        if sleep_millis is None:
+            response["requestStatus"] = {
+                "result": False,
+                "code": MISSING_REQUEST_FIELD,
+                "comment": "Missing sleepMillis.",
+            }
+            return response
+
+        time.sleep(sleep_millis / 1000)
+        response["requestStatus"] = {"result": True, "code": SUCCESS}
+        return response
+
+
+def _auth_string(password: str, challenge: str, salt: str) -> str:
+    """Compute the authentication string a client must send."""
+    secret = base64.b64encode(hashlib.sha256((password + salt).encode()).digest())
+    return base64.b64encode(
+        hashlib.sha256(secret + challenge.encode()).digest()
+    ).decode()
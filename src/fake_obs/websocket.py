@@ -0,0 +1,258 @@
+"""
+Minimal server side of the WebSocket protocol (RFC 6455) on plain sockets.
+
+Only what obs-websocket clients need is supported: the opening handshake,
+text and binary messages, fragmentation, ping/pong and the closing handshake.
+Extensions such as compression are never negotiated.
+"""
+
+import base64
+import hashlib
+import socket
+import struct
+import threading
+from typing import Dict, Optional, Tuple
+
+HANDSHAKE_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_HANDSHAKE_SIZE = 16 * 1024
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+CLOSE_NORMAL = 1000
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_TOO_BIG = 1009
+
+
+class WebSocketClosed(Exception):
+    """Raised when the connection is closed, cleanly or not."""
+
+
+def accept_key(key: str) -> str:
+    """Compute the Sec-WebSocket-Accept value for a client key."""
+    digest = hashlib.sha1((key + HANDSHAKE_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+class WebSocketConnection:
+    """A server side WebSocket connection over an accepted socket."""
+
+    def __init__(self, sock: socket.socket):
+        """
+        Initialize the connection.
+
+        Args:
+            sock: Accepted client socket, before the opening handshake
+        """
+        self.sock = sock
+        self._buffer = b""
+        self._send_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Check if the connection has been closed."""
+        return self._closed
+
+    def handshake(self, subprotocol: Optional[str] = None) -> Dict[str, str]:
+        """
+        Complete the opening handshake.
+
+        Args:
+            subprotocol: Subprotocol to accept if the client offers it
+
+        Returns:
+            Request headers, with lowercase names
+
+        Raises:
+            WebSocketClosed: If the request is not a valid WebSocket upgrade
+        """
+        while b"\r\n\r\n" not in self._buffer:
+            if len(self._buffer) > MAX_HANDSHAKE_SIZE:
+                raise WebSocketClosed("Handshake too large")
+            self._receive_more()
+
+        request, self._buffer = self._buffer.split(b"\r\n\r\n", 1)
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        key = headers.get("sec-websocket-key")
+        if not lines[0].startswith("GET ") or not key:
+            self._send_raw(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            self.abort()
+            raise WebSocketClosed("Not a WebSocket upgrade request")
+
+        response = [
+            "HTTP/1.1 101 Switching Protocols",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Accept: {accept_key(key)}",
+        ]
+        offered = [
+            protocol.strip()
+            for protocol in headers.get("sec-websocket-protocol", "").split(",")
+        ]
+        if subprotocol and subprotocol in offered:
+            response.append(f"Sec-WebSocket-Protocol: {subprotocol}")
+        self._send_raw(("\r\n".join(response) + "\r\n\r\n").encode("latin-1"))
+        return headers
+
+    def receive(self) -> str:
+        """
+        Receive the next data message, answering pings on the way.
+
+        Returns:
+            The message, decoded as UTF-8
+
+        Raises:
+            WebSocketClosed: If the connection was closed
+        """
+        message_opcode = None
+        parts = []
+        size = 0
+
+        while True:
+            fin, opcode, payload = self._read_frame()
+
+            if opcode == OP_CLOSE:
+                self._answer_close(payload)
+                raise WebSocketClosed("Closed by client")
+            if opcode == OP_PING:
+                self._send_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+
+            if opcode == OP_CONTINUATION:
+                if message_opcode is None:
+                    self.close(CLOSE_PROTOCOL_ERROR)
+                    raise WebSocketClosed("Unexpected continuation frame")
+            elif opcode in (OP_TEXT, OP_BINARY):
+                if message_opcode is not None:
+                    self.close(CLOSE_PROTOCOL_ERROR)
+                    raise WebSocketClosed("Interleaved message")
+                message_opcode = opcode
+            else:
+                self.close(CLOSE_PROTOCOL_ERROR)
+                raise WebSocketClosed(f"Unknown opcode {opcode}")
+
+            size += len(payload)
+            if size > MAX_MESSAGE_SIZE:
+                self.close(CLOSE_TOO_BIG)
+                raise WebSocketClosed("Message too large")
+            parts.append(payload)
+
+            if fin:
+                return b"".join(parts).decode("utf-8")
+
+    def send(self, message: str) -> None:
+        """
+        Send a text message.
+
+        Raises:
+            WebSocketClosed: If the connection was closed
+        """
+        self._send_frame(OP_TEXT, message.encode("utf-8"))
+
+    def close(self, code: int = CLOSE_NORMAL, reason: str = "") -> None:
+        """Start the closing handshake and close the socket."""
+        if self._closed:
+            return
+        try:
+            self._send_frame(OP_CLOSE, struct.pack("!H", code) + reason.encode())
+        except WebSocketClosed:
+            pass
+        self.abort()
+
+    def abort(self) -> None:
+        """Drop the connection without a closing handshake, like a crash would."""
+        self._closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def _answer_close(self, payload: bytes) -> None:
+        """Echo the client's close frame and close the socket."""
+        code = struct.unpack("!H", payload[:2])[0] if len(payload) >= 2 else None
+        self.close(code or CLOSE_NORMAL)
+
+    def _read_frame(self) -> Tuple[bool, int, bytes]:
+        """Read one frame and unmask its payload."""
+        first, second = self._read_exact(2)
+        fin = bool(first & 0x80)
+        opcode = first & 0x0F
+        masked = bool(second & 0x80)
+        length = second & 0x7F
+
+        if length == 126:
+            (length,) = struct.unpack("!H", self._read_exact(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", self._read_exact(8))
+        if length > MAX_MESSAGE_SIZE:
+            self.close(CLOSE_TOO_BIG)
+            raise WebSocketClosed("Frame too large")
+
+        mask = self._read_exact(4) if masked else b""
+        payload = self._read_exact(length)
+        if masked:
+            payload = _unmask(payload, mask)
+        return fin, opcode, payload
+
+    def _send_frame(self, opcode: int, payload: bytes) -> None:
+        """Send a single unmasked frame."""
+        header = bytes([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            header += bytes([length])
+        elif length < 1 << 16:
+            header += bytes([126]) + struct.pack("!H", length)
+        else:
+            header += bytes([127]) + struct.pack("!Q", length)
+        self._send_raw(header + payload)
+
+    def _send_raw(self, data: bytes) -> None:
+        """Write bytes to the socket, one writer at a time."""
+        with self._send_lock:
+            if self._closed:
+                raise WebSocketClosed("Connection closed")
+            try:
+                self.sock.sendall(data)
+            except OSError as e:
+                self._closed = True
+                raise WebSocketClosed(str(e)) from e
+
+    def _read_exact(self, size: int) -> bytes:
+        """Read exactly size bytes."""
+        while len(self._buffer) < size:
+            self._receive_more()
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _receive_more(self) -> None:
+        """Read whatever the socket has available."""
+        try:
+            chunk = self.sock.recv(65536)
+        except OSError as e:
+            self._closed = True
+            raise WebSocketClosed(str(e)) from e
+        if not chunk:
+            self._closed = True
+            raise WebSocketClosed("Connection reset")
+        self._buffer += chunk
+
+
+def _unmask(payload: bytes, mask: bytes) -> bytes:
+    """Apply a client mask, XORing the payload as one big integer."""
+    repeated = (mask * (len(payload) // 4 + 1))[: len(payload)]
+    value = int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")
+    return value.to_bytes(len(payload), "big")
@@ -6,19 +6,25 @@ Contains game data loading, validation, and repository management.
 
 from .loader import GameDataError, GameDataLoader
 from .objects import (
+    CaptureRegion,
     Game,
     GameFactory,
+    GameIndex,
     GameType,
     LogGame,
     LogPattern,
     LogState,
+    LogStateMatcher,
     Pattern,
     Pixel,
     PixelGame,
     PixelPattern,
     PixelState,
+    PixelStateMatcher,
     ProcessFactory,
     ProcessInfo,
+    RegionFrame,
+    RegionLayout,
     State,
 )
 from .repository import GameRepository
@@ -28,15 +34,21 @@ __all__ = [
     "GameDataLoader",
     "Game",
     "GameFactory",
+    "GameIndex",
     "GameType",
     "LogGame",
     "LogPattern",
     "LogState",
+    "LogStateMatcher",
     "Pattern",
     "Pixel",
     "PixelGame",
     "PixelPattern",
     "PixelState",
+    "PixelStateMatcher",
+    "CaptureRegion",
+    "RegionFrame",
+    "RegionLayout",
     "ProcessFactory",
     "ProcessInfo",
     "State",
@@ -6,9 +6,17 @@ Contains the core game objects that define the structure and behavior of games.
 
 from .base import Game, Pattern, State
 from .factory import GameFactory, ProcessFactory
+from .game_index import GameIndex
 from .games import LogGame, PixelGame
 from .log import LogPattern, LogState
+from .log_matcher import LogMatch, LogStateMatcher
 from .pixel import Pixel, PixelPattern, PixelState
+from .pixel_matcher import (
+    CaptureRegion,
+    PixelStateMatcher,
+    RegionFrame,
+    RegionLayout,
+)
 from .process import ProcessInfo
 from .types import GameType
 
@@ -18,13 +26,20 @@ __all__ = [
     "State",
     "GameFactory",
     "ProcessFactory",
+    "GameIndex",
     "LogGame",
     "PixelGame",
     "LogPattern",
     "LogState",
+    "LogMatch",
+    "LogStateMatcher",
     "Pixel",
     "PixelPattern",
     "PixelState",
+    "PixelStateMatcher",
+    "CaptureRegion",
+    "RegionFrame",
+    "RegionLayout",
     "ProcessInfo",
     "GameType",
 ]
@@ -0,0 +1,220 @@
+"""
+Compiled lookup of games by process name and window title.
+
+Every ProcessInfo of every game is compiled once into:
+
+- a hash map of exact executable names
+- a trie of reversed suffixes for '*'-prefixed executable patterns
+- an Aho–Corasick automaton over the title constraints
+
+A lookup walks the process name once through the suffix trie and the window
+title once through the automaton, regardless of how many games are defined.
+The last lookup is memoized since the focused window rarely changes between
+ticks.
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from .base import Game
+from .process import ProcessInfo
+
+
+class _SuffixNode:
+    """Node of the reversed executable suffix trie."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[str, "_SuffixNode"] = {}
+        self.entries: List[int] = []
+
+
+class _TitleMatcher:
+    """Aho–Corasick automaton finding every title constraint in a window title."""
+
+    def __init__(self, titles: Sequence[str]):
+        """
+        Build the automaton.
+
+        Args:
+            titles: Distinct non-empty title substrings to look for
+        """
+        self.titles = list(titles)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[int]] = [frozenset()]
+
+        outputs: List[Set[int]] = [set()]
+        for title_id, title in enumerate(self.titles):
+            state = 0
+            for char in title:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(title_id)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fallback = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fallback if fallback != next_state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(output) for output in outputs]
+
+    def find(self, text: str) -> Set[int]:
+        """
+        Find the title constraints contained in a text.
+
+        Args:
+            text: Window title to search
+
+        Returns:
+            IDs of the contained titles
+        """
+        found: Set[int] = set()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class GameIndex:
+    """Finds the games matching a process name and window title."""
+
+    def __init__(self, games: Sequence[Game]):
+        """
+        Compile the index.
+
+        Args:
+            games: Games in priority order
+        """
+        self.games = list(games)
+
+        # Entry i is (game index, title ID or None) of one ProcessInfo
+        self._entries: List[Tuple[int, Optional[int]]] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._suffixes = _SuffixNode()
+        self._any_exe: List[int] = []
+
+        title_ids: Dict[str, int] = {}
+        for game_index, game in enumerate(self.games):
+            for process_info in game.processes:
+                if not isinstance(process_info, ProcessInfo):
+                    continue
+
+                title_id = None
+                if process_info.title:
+                    title_id = title_ids.setdefault(process_info.title, len(title_ids))
+
+                entry = len(self._entries)
+                self._entries.append((game_index, title_id))
+                self._add_exe(process_info.exe, entry)
+
+        self._titles = _TitleMatcher(list(title_ids))
+        self.title_only_games: List[Game] = self._games_of(self._any_exe)
+        self._last_key: Optional[Tuple[str, str]] = None
+        self._last_matches: List[Game] = []
+
+    def _add_exe(self, exe: str, entry: int) -> None:
+        """Register an entry under its executable pattern."""
+        if not exe:
+            self._any_exe.append(entry)
+        elif exe.startswith("*"):
+            node = self._suffixes
+            for char in reversed(exe[1:]):
+                node = node.children.setdefault(char, _SuffixNode())
+            node.entries.append(entry)
+        else:
+            self._exact.setdefault(exe, []).append(entry)
+
+    def match(self, process_name: str, window_title: str) -> List[Game]:
+        """
+        Find every game with a ProcessInfo matching the focused window.
+
+        Matches ProcessInfo.matches_process for each ProcessInfo of each game.
+
+        Args:
+            process_name: Executable name of the focused process
+            window_title: Title of the focused window
+
+        Returns:
+            Matching games in priority order
+        """
+        key = (process_name, window_title)
+        if key == self._last_key:
+            return self._last_matches
+
+        candidates = self._exe_candidates(process_name)
+        found_titles: Optional[Set[int]] = None
+
+        matched: Set[int] = set()
+        for entry in candidates:
+            game_index, title_id = self._entries[entry]
+            if game_index in matched:
+                continue
+            if title_id is not None:
+                if found_titles is None:
+                    found_titles = self._titles.find(window_title)
+                if title_id not in found_titles:
+                    continue
+            matched.add(game_index)
+
+        self._last_key = key
+        self._last_matches = [self.games[index] for index in sorted(matched)]
+        return self._last_matches
+
+    def match_exe(self, process_name: str) -> List[Game]:
+        """
+        Find every game with an executable pattern matching a process name.
+
+        Title constraints are ignored and ProcessInfo entries without an
+        executable are skipped, so this answers which games a process could
+        belong to before any of its windows are known.
+
+        Args:
+            process_name: Executable name of the process
+
+        Returns:
+            Matching games in priority order
+        """
+        entries = self._exe_candidates(process_name)[len(self._any_exe) :]
+        return self._games_of(entries)
+
+    def _games_of(self, entries: List[int]) -> List[Game]:
+        """Get the distinct games of some entries in priority order."""
+        indexes = {self._entries[entry][0] for entry in entries}
+        return [self.games[index] for index in sorted(indexes)]
+
+    def _exe_candidates(self, process_name: str) -> List[int]:
+        """Get the entries whose executable pattern matches a process name."""
+        candidates = list(self._any_exe)
+        candidates.extend(self._exact.get(process_name, ()))
+
+        node = self._suffixes
+        candidates.extend(node.entries)
+        for char in reversed(process_name):
+            node = node.children.get(char)
+            if node is None:
+                break
+            candidates.extend(node.entries)
+        return candidates
@@ -2,13 +2,15 @@
 Game classes for different detection types.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from mss.screenshot import ScreenShot
 
 from .base import Game
 from .log import LogState
+from .log_matcher import LogStateMatcher
 from .pixel import PixelState
+from .pixel_matcher import PixelStateMatcher
 from .process import ProcessInfo
 from .types import GameType
 
@@ -27,13 +29,14 @@ class LogGame(Game):
         super().__init__(name, shortname, processes)
         self.logs = logs
         self.states = states
+        self.matcher = LogStateMatcher(states)
 
     @property
     def game_type(self) -> GameType:
         """Get the type of this game."""
         return GameType.LOG
 
-    def get_current_state(self, context: List[Dict]) -> Optional[LogState]:
+    def get_current_state(self, context: Sequence[Dict]) -> Optional[LogState]:
         """
         Detect the current game state from log entries.
         The last pattern found in the log entries dictates the current state.
@@ -44,18 +47,9 @@ class LogGame(Game):
         if not context:
             return None
 
-        latest_state = None
-        latest_position = -1
+        return self.matcher.match(context).state
 
-        for state in self.states.values():
-            last_match_pos = state.get_last_match_position(context)
-            if last_match_pos > latest_position:
-                latest_position = last_match_pos
-                latest_state = state
-
-        return latest_state
-
-    def get_playing_state_timestamp(self, context: List[Dict]) -> Optional[str]:
+    def get_playing_state_timestamp(self, context: Sequence[Dict]) -> Optional[str]:
         """
         Get the timestamp of the last Playing state detection.
 
@@ -68,12 +62,7 @@ class LogGame(Game):
         if not context:
             return None
 
-        playing_state = self.states.get("Playing")
-        if not playing_state:
-            return None
-
-        timestamp = playing_state.get_last_match_timestamp(context)
-        return timestamp if timestamp else None
+        return self.matcher.last_timestamp(context, "Playing")
 
     def get_state_names(self) -> List[str]:
         """Get all available state names for this game."""
@@ -112,6 +101,7 @@ class PixelGame(Game):
     ):
         super().__init__(name, shortname, processes)
         self.states = states
+        self.matcher = PixelStateMatcher(states)
 
     @property
     def game_type(self) -> GameType:
@@ -120,10 +110,7 @@ class PixelGame(Game):
 
     def get_current_state(self, context: ScreenShot) -> Optional[PixelState]:
         """Detect the current game state from a screenshot."""
-        for state in self.states.values():
-            if state.matches(context):
-                return state
-        return None
+        return self.matcher.match(context)
 
     def get_state_names(self) -> List[str]:
         """Get all available state names for this game."""
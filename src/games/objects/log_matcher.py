@@ -0,0 +1,163 @@
+"""
+Single-pass log state resolution.
+
+The current state of a log game is decided by the newest log entry matching
+any state's patterns. Rather than scanning every entry once per state and
+pattern, the matcher walks the entries from newest to oldest and stops at the
+first hit. Which states an entry matches only depends on its class and method,
+so that answer is memoized per (class, method) pair.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .log import LogState
+
+MAX_MEMO_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class LogMatch:
+    """Result of resolving the current state from log entries."""
+
+    state: Optional[LogState]
+    timestamp: Optional[str] = None
+
+
+@dataclass
+class _Scan:
+    """Progress of a reverse walk over one entries sequence."""
+
+    entries: Sequence[Dict[str, str]]
+    length: int
+    position: int
+    first_index: Optional[int] = None
+    timestamps: Dict[int, str] = field(default_factory=dict)
+
+
+class LogStateMatcher:
+    """
+    Resolves log game states with one reverse walk per entries sequence.
+
+    The walk is resumable: it runs only as far as the current question needs,
+    and later questions about the same entries (such as the Playing timestamp
+    after the current state) continue from where it stopped.
+    """
+
+    def __init__(self, states: Dict[str, LogState]):
+        """
+        Compile the states of a log game.
+
+        Args:
+            states: States of the game, in priority order for ties
+        """
+        self.states: List[LogState] = list(states.values())
+        self._index_by_name = {name: i for i, name in enumerate(states)}
+        self._patterns: List[Tuple[int, str, str]] = [
+            (index, pattern.class_name, pattern.method_name)
+            for index, state in enumerate(self.states)
+            for pattern in state.patterns
+        ]
+        self._memo: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+        self._scan: Optional[_Scan] = None
+
+    def match(self, entries: Sequence[Dict[str, str]]) -> LogMatch:
+        """
+        Find the state of the newest entry matching any state.
+
+        When one entry matches several states, the first in priority order wins.
+
+        Args:
+            entries: Log entries in chronological order
+
+        Returns:
+            LogMatch with the state and the date of the deciding entry
+        """
+        scan = self._get_scan(entries)
+
+        while scan.first_index is None and self._step(scan):
+            pass
+
+        if scan.first_index is None:
+            return LogMatch(state=None)
+        return LogMatch(
+            state=self.states[scan.first_index],
+            timestamp=scan.timestamps[scan.first_index],
+        )
+
+    def last_timestamp(
+        self, entries: Sequence[Dict[str, str]], state_name: str
+    ) -> Optional[str]:
+        """
+        Get the date of the newest entry matching a given state.
+
+        Args:
+            entries: Log entries in chronological order
+            state_name: Name of the state to look for
+
+        Returns:
+            Date string of the newest match, or None if there is none
+        """
+        index = self._index_by_name.get(state_name)
+        if index is None:
+            return None
+
+        scan = self._get_scan(entries)
+
+        while index not in scan.timestamps and self._step(scan):
+            pass
+
+        return scan.timestamps.get(index) or None
+
+    def _get_scan(self, entries: Sequence[Dict[str, str]]) -> _Scan:
+        """Get the walk for these entries, starting a new one if they changed."""
+        scan = self._scan
+        if scan is None or scan.entries is not entries or scan.length != len(entries):
+            scan = _Scan(entries=entries, length=len(entries), position=len(entries))
+            self._scan = scan
+        return scan
+
+    def _step(self, scan: _Scan) -> bool:
+        """
+        Process the next older entry of a walk.
+
+        Returns:
+            False once the oldest entry has been processed
+        """
+        if scan.position <= 0:
+            return False
+
+        scan.position -= 1
+        entry = scan.entries[scan.position]
+        matched = self._states_for(entry.get("class", ""), entry.get("method", ""))
+
+        if matched:
+            date = entry.get("date", "")
+            if scan.first_index is None:
+                scan.first_index = matched[0]
+            for index in matched:
+                scan.timestamps.setdefault(index, date)
+
+        return True
+
+    def _states_for(self, class_name: str, method_name: str) -> Tuple[int, ...]:
+        """Get the indices of the states matching a class and method, in order."""
+        key = (class_name, method_name)
+        matched = self._memo.get(key)
+        if matched is not None:
+            return matched
+
+        seen = set()
+        result = []
+        for index, pattern_class, pattern_method in self._patterns:
+            if index in seen:
+                continue
+            if pattern_class in class_name and pattern_method in method_name:
+                seen.add(index)
+                result.append(index)
+        matched = tuple(result)
+
+        if len(self._memo) >= MAX_MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = matched
+        return matched
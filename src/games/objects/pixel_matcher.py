@@ -0,0 +1,293 @@
+"""
+Vectorized pixel pattern evaluation.
+
+Compiles the pixel patterns of a game into NumPy arrays once, so that every
+pattern of every state can be checked against a screenshot with a single
+gather-and-compare instead of walking Pixel objects one by one.
+
+Each resolution also gets a region layout: a small set of rectangles covering
+every referenced pixel, so capture can grab only those areas instead of the
+whole client area.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from mss.screenshot import ScreenShot
+
+from .pixel import PixelState
+
+BYTES_PER_PIXEL = 4
+MAX_REGION_SIDE = 64
+_CHANNELS = np.arange(3, dtype=np.intp)
+
+
+@dataclass(frozen=True)
+class CaptureRegion:
+    """A rectangle of the client area, relative to its top-left corner."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+
+    @property
+    def size(self) -> int:
+        """Number of bytes of this region as BGRA."""
+        return self.width * self.height * BYTES_PER_PIXEL
+
+
+@dataclass
+class RegionLayout:
+    """Rectangles to capture and where each one lives in the packed buffer."""
+
+    regions: List[CaptureRegion]
+    base_offsets: List[int]
+    buffer_size: int
+
+    @classmethod
+    def covering(
+        cls, points: Iterable[Tuple[int, int]], max_side: int = MAX_REGION_SIDE
+    ) -> "RegionLayout":
+        """
+        Build a layout whose rectangles cover all given points.
+
+        Points are greedily merged into rectangles no larger than max_side in
+        either direction, which keeps the number of grabs low without pulling
+        in large unused areas.
+
+        Args:
+            points: (x, y) client coordinates to cover
+            max_side: Maximum width and height of a single rectangle
+
+        Returns:
+            RegionLayout covering every point
+        """
+        bounds: List[List[int]] = []
+
+        for x, y in sorted(set(points), key=lambda point: (point[1], point[0])):
+            for rect in bounds:
+                left, top = min(rect[0], x), min(rect[1], y)
+                right, bottom = max(rect[2], x), max(rect[3], y)
+                if right - left < max_side and bottom - top < max_side:
+                    rect[:] = [left, top, right, bottom]
+                    break
+            else:
+                bounds.append([x, y, x, y])
+
+        regions = [
+            CaptureRegion(left, top, right - left + 1, bottom - top + 1)
+            for left, top, right, bottom in bounds
+        ]
+
+        base_offsets = []
+        buffer_size = 0
+        for region in regions:
+            base_offsets.append(buffer_size)
+            buffer_size += region.size
+
+        return cls(regions=regions, base_offsets=base_offsets, buffer_size=buffer_size)
+
+    def remap(self, x: int, y: int) -> int:
+        """
+        Get the byte offset of a client pixel inside the packed buffer.
+
+        Raises:
+            ValueError: If the pixel is not covered by the layout
+        """
+        for region, base in zip(self.regions, self.base_offsets):
+            if (
+                region.left <= x < region.left + region.width
+                and region.top <= y < region.top + region.height
+            ):
+                local = (y - region.top) * region.width + (x - region.left)
+                return base + local * BYTES_PER_PIXEL
+
+        raise ValueError(f"Pixel ({x}, {y}) is not covered by the region layout")
+
+
+@dataclass
+class RegionFrame:
+    """
+    Sparse capture of a client area.
+
+    Holds the BGRA bytes of every region of a layout packed back to back,
+    along with the size of the client area they were taken from.
+    """
+
+    width: int
+    height: int
+    layout: RegionLayout
+    raw: bytearray
+
+
+@dataclass
+class CompiledResolution:
+    """All patterns targeting one resolution, flattened into arrays."""
+
+    width: int
+    height: int
+    offsets: np.ndarray
+    expected: np.ndarray
+    tolerances: np.ndarray
+    pattern_starts: np.ndarray
+    pattern_states: np.ndarray
+    empty_patterns: np.ndarray
+    layout: RegionLayout
+    region_offsets: np.ndarray
+
+    @property
+    def frame_size(self) -> int:
+        """Number of bytes of a full BGRA frame at this resolution."""
+        return self.width * self.height * BYTES_PER_PIXEL
+
+
+class PixelStateMatcher:
+    """
+    Evaluates all pixel states of a game at once.
+
+    Pixels are grouped per resolution into flat arrays of byte offsets
+    (pointing at the blue channel of each BGRA pixel), expected BGR values and
+    tolerances. Patterns are stored contiguously in state order, so the first
+    matching pattern always belongs to the state the sequential lookup would
+    have returned.
+    """
+
+    def __init__(self, states: Dict[str, PixelState]):
+        """
+        Compile the given states.
+
+        Args:
+            states: Ordered mapping of state names to pixel states
+        """
+        self._states: List[PixelState] = list(states.values())
+        self._resolutions: Dict[Tuple[int, int], CompiledResolution] = {}
+        self._compile()
+
+    @property
+    def resolutions(self) -> List[Tuple[int, int]]:
+        """Resolutions that have at least one pattern."""
+        return list(self._resolutions.keys())
+
+    def get_compiled(self, width: int, height: int) -> Optional[CompiledResolution]:
+        """Get the compiled patterns for a resolution, if any."""
+        return self._resolutions.get((width, height))
+
+    def get_layout(self, width: int, height: int) -> Optional[RegionLayout]:
+        """Get the capture regions needed for a resolution, if any."""
+        compiled = self._resolutions.get((width, height))
+        return compiled.layout if compiled else None
+
+    def match(
+        self, screenshot: Union[ScreenShot, RegionFrame]
+    ) -> Optional[PixelState]:
+        """
+        Find the first state with a pattern matching the screenshot.
+
+        Args:
+            screenshot: Full screenshot from mss or a sparse region frame
+
+        Returns:
+            Matching state or None
+        """
+        compiled = self._resolutions.get((screenshot.width, screenshot.height))
+        if compiled is None:
+            return None
+
+        if isinstance(screenshot, RegionFrame):
+            if screenshot.layout is not compiled.layout:
+                return None
+            offsets = compiled.region_offsets
+            required_size = compiled.layout.buffer_size
+        else:
+            offsets = compiled.offsets
+            required_size = compiled.frame_size
+
+        if len(screenshot.raw) < required_size:
+            return None
+
+        frame = np.frombuffer(screenshot.raw, dtype=np.uint8)
+        return self._match_buffer(compiled, frame, offsets)
+
+    def _match_buffer(
+        self, compiled: CompiledResolution, frame: np.ndarray, offsets: np.ndarray
+    ) -> Optional[PixelState]:
+        """Run the gather-and-compare for one resolution over a byte buffer."""
+        pattern_ok = compiled.empty_patterns.copy()
+
+        if offsets.size:
+            values = frame[offsets[:, None] + _CHANNELS].astype(np.int16)
+            pixel_ok = (
+                np.abs(values - compiled.expected) <= compiled.tolerances[:, None]
+            ).all(axis=1)
+            pattern_ok[~compiled.empty_patterns] = np.logical_and.reduceat(
+                pixel_ok, compiled.pattern_starts
+            )
+
+        matched = np.flatnonzero(pattern_ok)
+        if not matched.size:
+            return None
+
+        return self._states[compiled.pattern_states[matched[0]]]
+
+    def _compile(self) -> None:
+        """Flatten every pattern into per-resolution arrays."""
+        grouped: Dict[Tuple[int, int], Dict[str, list]] = {}
+
+        for state_index, state in enumerate(self._states):
+            for pattern in state.patterns:
+                width, height = pattern.resolution[0], pattern.resolution[1]
+
+                # Pixels outside the frame can never match, same as Pixel.matches
+                if any(
+                    not (0 <= pixel.x < width and 0 <= pixel.y < height)
+                    for pixel in pattern.pixels
+                ):
+                    continue
+
+                group = grouped.setdefault(
+                    (width, height),
+                    {
+                        "offsets": [],
+                        "expected": [],
+                        "tolerances": [],
+                        "starts": [],
+                        "states": [],
+                        "empty": [],
+                        "points": [],
+                    },
+                )
+
+                group["states"].append(state_index)
+                group["empty"].append(not pattern.pixels)
+
+                # Patterns without pixels match on resolution alone, mirroring
+                # all() over nothing; they get no segment in the pixel arrays
+                if pattern.pixels:
+                    group["starts"].append(len(group["offsets"]))
+
+                for pixel in pattern.pixels:
+                    group["offsets"].append(
+                        (pixel.y * width + pixel.x) * BYTES_PER_PIXEL
+                    )
+                    group["expected"].append((pixel.b, pixel.g, pixel.r))
+                    group["tolerances"].append(pixel.tol)
+                    group["points"].append((pixel.x, pixel.y))
+
+        for (width, height), group in grouped.items():
+            layout = RegionLayout.covering(group["points"])
+            self._resolutions[(width, height)] = CompiledResolution(
+                width=width,
+                height=height,
+                offsets=np.array(group["offsets"], dtype=np.intp),
+                expected=np.array(group["expected"], dtype=np.int16).reshape(-1, 3),
+                tolerances=np.array(group["tolerances"], dtype=np.int16),
+                pattern_starts=np.array(group["starts"], dtype=np.intp),
+                pattern_states=np.array(group["states"], dtype=np.intp),
+                empty_patterns=np.array(group["empty"], dtype=bool),
+                layout=layout,
+                region_offsets=np.array(
+                    [layout.remap(x, y) for x, y in group["points"]], dtype=np.intp
+                ),
+            )
@@ -0,0 +1,113 @@
+"""
+obs-websocket v5 request batches.
+
+A RequestBatch (op 8) carries several requests in one message and is
+answered by a single RequestBatchResponse (op 9), so a group of changes costs
+one round trip instead of one per request. obsws-python has no batch support,
+so batches are sent over the request client's websocket directly.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+OP_REQUEST_BATCH = 8
+OP_REQUEST_BATCH_RESPONSE = 9
+
+# Status code OBS answers successful requests with
+SUCCESS = 100
+# Status code given to requests OBS skipped after an earlier failure
+NOT_RUN = 0
+
+
+@dataclass
+class OBSRequest:
+    """A request to send as part of a batch."""
+
+    request_type: str
+    request_data: Dict[str, Any] = field(default_factory=dict)
+    # Called with the response data once the request succeeded
+    on_success: Optional[Callable[[Dict[str, Any]], None]] = None
+
+
+@dataclass
+class OBSRequestResult:
+    """Outcome of one request of a batch."""
+
+    request_type: str
+    ok: bool
+    code: int
+    comment: str = ""
+    response_data: Dict[str, Any] = field(default_factory=dict)
+
+
+def send_request_batch(
+    ws, requests: List[OBSRequest], halt_on_failure: bool = False
+) -> List[OBSRequestResult]:
+    """
+    Send requests as one batch and wait for the results.
+
+    Args:
+        ws: Connected and identified websocket of an obsws ReqClient
+        requests: Requests to run, in order
+        halt_on_failure: Skip the remaining requests after one fails
+
+    Returns:
+        One result per request, in the order of the requests
+
+    Raises:
+        Exception: Whatever the websocket raises if the connection fails
+    """
+    batch_id = uuid.uuid4().hex
+    payload = {
+        "op": OP_REQUEST_BATCH,
+        "d": {
+            "requestId": batch_id,
+            "haltOnFailure": halt_on_failure,
+            "requests": [
+                {
+                    "requestType": request.request_type,
+                    "requestId": str(index),
+                    "requestData": request.request_data,
+                }
+                for index, request in enumerate(requests)
+            ],
+        },
+    }
+    ws.send(json.dumps(payload))
+
+    while True:
+        message = json.loads(ws.recv())
+        if (
+            message.get("op") == OP_REQUEST_BATCH_RESPONSE
+            and message["d"].get("requestId") == batch_id
+        ):
+            break
+
+    responses = {
+        response.get("requestId"): response for response in message["d"]["results"]
+    }
+    return [
+        _to_result(request, responses.get(str(index)))
+        for index, request in enumerate(requests)
+    ]
+
+
+def _to_result(
+    request: OBSRequest, response: Optional[Dict[str, Any]]
+) -> OBSRequestResult:
+    """Convert one entry of a batch response."""
+    if response is None:
+        return OBSRequestResult(
+            request.request_type, False, NOT_RUN, "Skipped after an earlier failure"
+        )
+
+    status = response.get("requestStatus", {})
+    return OBSRequestResult(
+        request_type=request.request_type,
+        ok=bool(status.get("result")),
+        code=status.get("code", NOT_RUN),
+        comment=status.get("comment") or "",
+        response_data=response.get("responseData") or {},
+    )
@@ -8,12 +8,15 @@ import logging
 import threading
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from typing import Callable, Iterator, List, Optional
 
 import obsws_python as obsws
+from obsws_python.error import OBSSDKRequestError
 
 from src.config.settings import AppSettings
 from src.core.interfaces.obs import IOBSController, IOBSEventHandler
+from src.obs.batch import NOT_RUN, OBSRequest, OBSRequestResult, send_request_batch
+from src.obs.state_cache import OBSStateCache
 from src.obs.videosettings import OBSVideoSettings
 
 
@@ -49,11 +52,16 @@ class OBSController(IOBSController):
 
     _prev_recording_active: bool = False
     recording_active: bool = False
+    replay_buffer_active: bool = False
 
     recording_completed_callback: Optional[Callable[[str], None]] = None
     _event_handlers: List[IOBSEventHandler] = field(default_factory=list)
 
     _initial_connection_thread: Optional[threading.Thread] = None
+    _event_dispatcher: Optional[Callable[[Callable[[], None]], None]] = None
+    state_cache: OBSStateCache = field(default_factory=OBSStateCache)
+    # Holds the requests queued by batched() on each thread
+    _batch_local: threading.local = field(default_factory=threading.local)
 
     def __post_init__(self):
         """Initialize event handlers list."""
@@ -70,8 +78,23 @@ class OBSController(IOBSController):
         )
 
     @classmethod
-    def connect(cls, settings: AppSettings) -> "OBSController":
-        """Initialize the OBS WebSocket clients."""
+    def connect(
+        cls,
+        settings: AppSettings,
+        background: bool = True,
+        event_dispatcher: Optional[Callable[[Callable[[], None]], None]] = None,
+    ) -> "OBSController":
+        """
+        Initialize the OBS WebSocket clients.
+
+        Args:
+            settings: Application settings
+            background: Whether to connect and keep the connection alive from
+                background threads. Without them, the owner is expected to
+                call connect_once and then check_connection periodically.
+            event_dispatcher: Optional dispatcher for OBS events, see
+                set_event_dispatcher
+        """
 
         instance = cls(
             req_client=None,
@@ -79,9 +102,11 @@ class OBSController(IOBSController):
             settings=settings,
             recording_active=False,
             _connection_lost=False,
+            _event_dispatcher=event_dispatcher,
         )
 
-        instance._start_initial_connection_thread()
+        if background:
+            instance._start_initial_connection_thread()
 
         return instance
 
@@ -97,14 +122,23 @@ class OBSController(IOBSController):
 
     def _attempt_initial_connection(self):
         """Attempt initial connection in background thread."""
+        self.connect_once()
+        self._start_keep_alive_thread()
+
+    def connect_once(self) -> bool:
+        """
+        Make the initial connection attempt.
+
+        Returns:
+            True if connected
+        """
         success = self._attempt_connection()
         if success:
             logging.info("Connected to OBS")
         else:
             logging.warning("Failed to connect to OBS")
             logging.info("Attempting to reconnect...")
-
-        self._start_keep_alive_thread()
+        return success
 
     def _attempt_connection(self) -> bool:
         """Attempt to establish connection to OBS. Returns True if successful."""
@@ -130,9 +164,13 @@ class OBSController(IOBSController):
             self.req_client = req_client
             self.event_client = event_client
             self.recording_active = resp.output_active
+            self.replay_buffer_active = self._get_replay_buffer_status(req_client)
             self._connection_lost = False
 
+            # Anything cached may have changed while disconnected
+            self.state_cache.invalidate()
             self.register_events()
+            self._populate_state_cache()
 
             return True
 
@@ -141,6 +179,19 @@ class OBSController(IOBSController):
             self._connection_lost = True
             return False
 
+    def _populate_state_cache(self) -> None:
+        """Fill the state cache right after connecting, so reads are free."""
+        self.get_scene_list()
+        self.get_video_settings()
+
+    @staticmethod
+    def _get_replay_buffer_status(req_client: obsws.ReqClient) -> bool:
+        """Check if the replay buffer is running, False if it is not enabled."""
+        try:
+            return req_client.get_replay_buffer_status().output_active
+        except OBSSDKRequestError:
+            return False
+
     def _start_keep_alive_thread(self):
         """Start the background keep-alive monitoring thread."""
         if self._keep_alive_thread is not None:
@@ -158,27 +209,30 @@ class OBSController(IOBSController):
     def _continuous_keep_alive(self):
         """Continuously monitor connection and reconnect if needed."""
         while not self._keep_alive_stop_event.is_set():
-            try:
-                if not self.is_connected:
-                    self._reconnect()
-                else:
-                    with _suppress_obsws_logging():
-                        self.req_client.get_version()
+            self._keep_alive_stop_event.wait(self.check_connection())
 
-                self._keep_alive_stop_event.wait(self.settings.obs_timeout)
-
-            except Exception as e:
-                logging.debug("[OBS] Keep-alive check failed: %s", str(e))
-                self._connection_lost = True
-                self._keep_alive_stop_event.wait(1)
+    def check_connection(self) -> float:
+        """
+        Run one keep-alive step, reconnecting if the connection was lost.
 
-    def _reconnect(self):
-        """Attempt to reconnect to OBS WebSocket."""
-        while not self._keep_alive_stop_event.is_set():
-            if self._attempt_connection():
+        Returns:
+            Seconds to wait before the next check
+        """
+        try:
+            if not self.is_connected:
+                if not self._attempt_connection():
+                    return 1.0
                 logging.info("[OBS] Reconnected successfully")
-                return
-            self._keep_alive_stop_event.wait(1)
+            else:
+                with _suppress_obsws_logging():
+                    self.req_client.get_version()
+
+            return self.settings.obs_timeout
+
+        except Exception as e:
+            logging.debug("[OBS] Keep-alive check failed: %s", str(e))
+            self._connection_lost = True
+            return 1.0
 
     def shutdown(self):
         """Gracefully shutdown the OBS controller and stop the keep-alive thread."""
@@ -204,20 +258,80 @@ class OBSController(IOBSController):
         """Register event callbacks."""
         if self.is_connected:
             try:
-                self.event_client.callback.register(self.on_record_state_changed)
+                self.event_client.callback.register(
+                    [
+                        self.on_record_state_changed,
+                        self.on_replay_buffer_state_changed,
+                        self.on_replay_buffer_saved,
+                        self.on_current_program_scene_changed,
+                        self.on_scene_list_changed,
+                        self.on_scene_name_changed,
+                    ]
+                )
             except Exception as e:
                 logging.debug("[OBS] Failed to register events: %s", str(e))
                 self._connection_lost = True
 
+    def set_event_dispatcher(
+        self, dispatcher: Optional[Callable[[Callable[[], None]], None]]
+    ) -> None:
+        """
+        Set how OBS events are handed to the rest of the application.
+
+        Events arrive on the websocket client's thread. By default they are
+        handled right there; a dispatcher can instead queue them elsewhere,
+        such as onto an ordered worker queue or an event loop.
+
+        Args:
+            dispatcher: Called with a function handling the event, or None to
+                handle events on the websocket thread
+        """
+        self._event_dispatcher = dispatcher
+
     def on_record_state_changed(self, event):
         """Callback for when the recording state changes."""
+        # The flag is updated on receipt so it stays current even while
+        # earlier events are still waiting for their handlers
         self._prev_recording_active = self.recording_active
         if event.output_state == "OBS_WEBSOCKET_OUTPUT_STARTED":
             self.recording_active = True
+        elif event.output_state == "OBS_WEBSOCKET_OUTPUT_STOPPED":
+            self.recording_active = False
+        self._dispatch(lambda: self._handle_record_state_changed(event))
+
+    def on_replay_buffer_state_changed(self, event):
+        """Callback for when the replay buffer starts or stops."""
+        self._handle_replay_buffer_state_changed(event)
+
+    def on_replay_buffer_saved(self, event):
+        """Callback for when the replay buffer has been saved to a file."""
+        self._dispatch(lambda: self._handle_replay_buffer_saved(event))
+
+    def on_current_program_scene_changed(self, event):
+        """Callback for when the program scene changes."""
+        self.state_cache.set_current_scene(event.scene_name)
+
+    def on_scene_list_changed(self, event):
+        """Callback for when scenes are created, removed or reordered."""
+        self.state_cache.set_scenes([scene["sceneName"] for scene in event.scenes])
+
+    def on_scene_name_changed(self, event):
+        """Callback for when a scene is renamed."""
+        self.state_cache.rename_scene(event.old_scene_name, event.scene_name)
+
+    def _dispatch(self, handler: Callable[[], None]) -> None:
+        """Handle an event here or through the event dispatcher."""
+        if self._event_dispatcher is not None:
+            self._event_dispatcher(handler)
+        else:
+            handler()
+
+    def _handle_record_state_changed(self, event):
+        """Notify handlers about a recording starting or stopping."""
+        if event.output_state == "OBS_WEBSOCKET_OUTPUT_STARTED":
             logging.info("Recording started")
             self._notify_recording_started()
         elif event.output_state == "OBS_WEBSOCKET_OUTPUT_STOPPED":
-            self.recording_active = False
             logging.info("Recording stopped")
 
             if self.recording_completed_callback:
@@ -227,6 +341,26 @@ class OBSController(IOBSController):
 
             self._notify_recording_stopped(event.output_path)
 
+    def _handle_replay_buffer_state_changed(self, event):
+        """Update the replay buffer state."""
+        if event.output_state == "OBS_WEBSOCKET_OUTPUT_STARTED":
+            self.replay_buffer_active = True
+            logging.debug("[OBS] Replay buffer started")
+        elif event.output_state == "OBS_WEBSOCKET_OUTPUT_STOPPED":
+            self.replay_buffer_active = False
+            logging.debug("[OBS] Replay buffer stopped")
+
+    def _handle_replay_buffer_saved(self, event):
+        """Hand a saved replay over like a completed recording."""
+        logging.info("Replay saved")
+
+        if self.recording_completed_callback:
+            self.recording_completed_callback(event.saved_replay_path)
+        else:
+            logging.debug("[OBS] Replay file available: %s", event.saved_replay_path)
+
+        self._notify_recording_stopped(event.saved_replay_path)
+
     def register_event_handler(self, handler: IOBSEventHandler) -> None:
         """Register an event handler."""
         if handler not in self._event_handlers:
@@ -262,7 +396,6 @@ class OBSController(IOBSController):
             try:
                 with _suppress_obsws_logging():
                     self.req_client.start_record()
-                self._notify_recording_started()
             except Exception as e:
                 logging.debug("[OBS] Failed to start recording: %s", str(e))
                 self._connection_lost = True
@@ -276,6 +409,154 @@ class OBSController(IOBSController):
                 logging.debug("[OBS] Failed to stop recording: %s", str(e))
                 self._connection_lost = True
 
+    def start_replay_buffer(self) -> None:
+        """Start the replay buffer."""
+        if not self.replay_buffer_active and self.is_connected:
+            self._replay_buffer_request("start_replay_buffer")
+
+    def stop_replay_buffer(self) -> None:
+        """Stop the replay buffer."""
+        if self.replay_buffer_active and self.is_connected:
+            self._replay_buffer_request("stop_replay_buffer")
+
+    def save_replay_buffer(self) -> None:
+        """Save the contents of the replay buffer to a file."""
+        if self.replay_buffer_active and self.is_connected:
+            self._replay_buffer_request("save_replay_buffer")
+
+    def _replay_buffer_request(self, request: str) -> None:
+        """
+        Send a replay buffer request.
+
+        OBS rejects these requests when the replay buffer is not enabled in
+        its output settings, which is reported without dropping the connection.
+
+        Args:
+            request: Name of the ReqClient method
+        """
+        try:
+            with _suppress_obsws_logging():
+                getattr(self.req_client, request)()
+        except OBSSDKRequestError as e:
+            logging.warning("[OBS] Replay buffer request failed: %s", e)
+        except Exception as e:
+            logging.debug("[OBS] Failed to %s: %s", request.replace("_", " "), e)
+            self._connection_lost = True
+
+    def get_replay_buffer_length(self) -> Optional[float]:
+        """
+        Get how many seconds the replay buffer keeps.
+
+        Returns:
+            Maximum replay length in seconds, or None if unknown
+        """
+        if not self.is_connected:
+            return None
+
+        try:
+            with _suppress_obsws_logging():
+                outputs = self.req_client.get_output_list().outputs
+                for output in outputs:
+                    if output.get("outputKind") == "replay_buffer":
+                        response = self.req_client.get_output_settings(
+                            output["outputName"]
+                        )
+                        max_time = response.output_settings.get("max_time_sec")
+                        return float(max_time) if max_time else None
+        except OBSSDKRequestError as e:
+            logging.debug("[OBS] Failed to get replay buffer length: %s", e)
+        except Exception as e:
+            logging.debug("[OBS] Failed to get replay buffer length: %s", e)
+            self._connection_lost = True
+        return None
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """
+        Send the scene and video settings changes of a block as one batch.
+
+        Changes made on the calling thread inside the block are queued and
+        sent in order, in a single RequestBatch, when the outermost block
+        exits. Until then, reads still return the state from before the
+        block.
+        """
+        if getattr(self._batch_local, "requests", None) is not None:
+            yield
+            return
+
+        self._batch_local.requests = []
+        try:
+            yield
+        finally:
+            requests = self._batch_local.requests
+            self._batch_local.requests = None
+            if requests:
+                self.send_batch(requests)
+
+    def send_batch(
+        self, requests: List[OBSRequest], halt_on_failure: bool = False
+    ) -> List[OBSRequestResult]:
+        """
+        Send requests to OBS in one round trip.
+
+        Failed requests are logged and leave the connection up. The
+        on_success callback of every successful request is called.
+
+        Args:
+            requests: Requests to run, in order
+            halt_on_failure: Skip the remaining requests after one fails
+
+        Returns:
+            One result per request, in the order of the requests
+        """
+        if not self.is_connected:
+            logging.warning("[OBS] Cannot send requests - not connected")
+            return [
+                OBSRequestResult(request.request_type, False, NOT_RUN, "Not connected")
+                for request in requests
+            ]
+
+        try:
+            with _suppress_obsws_logging():
+                results = send_request_batch(
+                    self.req_client.base_client.ws, requests, halt_on_failure
+                )
+        except Exception as e:
+            logging.debug("[OBS] Failed to send request batch: %s", str(e))
+            self._connection_lost = True
+            return [
+                OBSRequestResult(request.request_type, False, NOT_RUN, str(e))
+                for request in requests
+            ]
+
+        for request, result in zip(requests, results):
+            if result.ok:
+                if request.on_success:
+                    request.on_success(result.response_data)
+            elif result.code == NOT_RUN:
+                logging.debug("[OBS] %s skipped", result.request_type)
+            else:
+                logging.warning(
+                    "[OBS] %s failed with code %d: %s",
+                    result.request_type,
+                    result.code,
+                    result.comment,
+                )
+        return results
+
+    def _queue_request(self, request: OBSRequest) -> bool:
+        """
+        Queue a request if batched() is active on this thread.
+
+        Returns:
+            True if the request was queued, False if it must be sent now
+        """
+        requests = getattr(self._batch_local, "requests", None)
+        if requests is None:
+            return False
+        requests.append(request)
+        return True
+
     def set_video_settings(
         self,
         obssettings: OBSVideoSettings,
@@ -283,6 +564,9 @@ class OBSController(IOBSController):
         """
         Set OBS video settings (base canvas, output resolution, and FPS).
 
+        A running replay buffer is stopped for the change and started again,
+        which drops what it held.
+
         Args:
             obssettings: OBSVideoSettings object
         """
@@ -290,10 +574,12 @@ class OBSController(IOBSController):
             logging.warning("[OBS] Cannot set video settings - not connected")
             return
 
+        current_settings = self.get_video_settings()
+        if current_settings is None:
+            return
+
         try:
             with _suppress_obsws_logging():
-                current_settings = self.req_client.get_video_settings()
-
                 base_width = obssettings.base_width or current_settings.base_width
                 base_height = obssettings.base_height or current_settings.base_height
                 output_width = obssettings.output_width or current_settings.output_width
@@ -319,6 +605,39 @@ class OBSController(IOBSController):
                     },
                 )
 
+                new_settings = OBSVideoSettings(
+                    base_width=base_width,
+                    base_height=base_height,
+                    output_width=output_width,
+                    output_height=output_height,
+                    fps_numerator=fps_numerator,
+                    fps_denominator=fps_denominator,
+                )
+                request = OBSRequest(
+                    "SetVideoSettings",
+                    {
+                        "baseWidth": base_width,
+                        "baseHeight": base_height,
+                        "outputWidth": output_width,
+                        "outputHeight": output_height,
+                        "fpsNumerator": fps_numerator,
+                        "fpsDenominator": fps_denominator,
+                    },
+                    lambda _: self.state_cache.set_video_settings(new_settings),
+                )
+
+                if self.replay_buffer_active:
+                    # OBS refuses video changes while an output runs, so the
+                    # replay buffer is restarted around them in one batch
+                    with self.batched():
+                        self._queue_request(OBSRequest("StopReplayBuffer"))
+                        self._queue_request(request)
+                        self._queue_request(OBSRequest("StartReplayBuffer"))
+                    return
+
+                if self._queue_request(request):
+                    return
+
                 self.req_client.set_video_settings(
                     base_width=base_width,
                     base_height=base_height,
@@ -327,24 +646,34 @@ class OBSController(IOBSController):
                     numerator=fps_numerator,
                     denominator=fps_denominator,
                 )
+            self.state_cache.set_video_settings(new_settings)
         except Exception as e:
             logging.debug("[OBS] Failed to set video settings: %s", str(e))
+            self.state_cache.set_video_settings(None)
             self._connection_lost = True
 
     def get_video_settings(self) -> Optional[OBSVideoSettings]:
         """
         Get current OBS video settings.
 
+        OBS has no event for video settings changes, so the cached settings
+        only follow changes made through this controller. They are read
+        again on every reconnect.
+
         Returns:
             Dictionary containing video settings, or None if not connected or error occurred
         """
         if not self.is_connected:
             return None
 
+        cached = self.state_cache.video_settings
+        if cached is not None:
+            return cached
+
         try:
             with _suppress_obsws_logging():
                 response = self.req_client.get_video_settings()
-            return OBSVideoSettings(
+            video_settings = OBSVideoSettings(
                 base_width=response.base_width,
                 base_height=response.base_height,
                 output_width=response.output_width,
@@ -352,6 +681,8 @@ class OBSController(IOBSController):
                 fps_numerator=response.fps_numerator,
                 fps_denominator=response.fps_denominator,
             )
+            self.state_cache.set_video_settings(video_settings)
+            return video_settings
         except Exception as e:
             logging.debug("[OBS] Failed to get video settings: %s", str(e))
             self._connection_lost = True
@@ -418,8 +749,22 @@ class OBSController(IOBSController):
         try:
             current_scene = self.get_current_scene()
             if current_scene != scene_name:
+                if self._queue_request(
+                    OBSRequest(
+                        "SetCurrentProgramScene",
+                        {"sceneName": scene_name},
+                        lambda _: self.state_cache.set_current_scene(scene_name),
+                    )
+                ):
+                    logging.debug(
+                        "[OBS][Scene] '%s' → '%s' (batched)", current_scene, scene_name
+                    )
+                    return
+
                 with _suppress_obsws_logging():
                     self.req_client.set_current_program_scene(scene_name)
+                # Don't wait for the event, the next transition may come first
+                self.state_cache.set_current_scene(scene_name)
                 logging.debug("[OBS][Scene] '%s' → '%s'", current_scene, scene_name)
         except Exception as e:
             logging.error("[OBS] Failed to switch scene: %s", str(e))
@@ -435,9 +780,14 @@ class OBSController(IOBSController):
         if not self.is_connected:
             return None
 
+        cached = self.state_cache.current_scene
+        if cached is not None:
+            return cached
+
         try:
             with _suppress_obsws_logging():
                 response = self.req_client.get_current_program_scene()
+            self.state_cache.set_current_scene(response.current_program_scene_name)
             return response.current_program_scene_name
         except Exception as e:
             logging.debug("[OBS] Failed to get current scene: %s", str(e))
@@ -454,10 +804,17 @@ class OBSController(IOBSController):
         if not self.is_connected:
             return []
 
+        cached = self.state_cache.scenes
+        if cached is not None:
+            return cached
+
         try:
             with _suppress_obsws_logging():
                 response = self.req_client.get_scene_list()
-            return [scene["sceneName"] for scene in response.scenes]
+            scenes = [scene["sceneName"] for scene in response.scenes]
+            self.state_cache.set_scenes(scenes)
+            self.state_cache.set_current_scene(response.current_program_scene_name)
+            return scenes
         except Exception as e:
             logging.debug("[OBS] Failed to get scene list: %s", str(e))
             self._connection_lost = True
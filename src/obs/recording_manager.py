@@ -12,10 +12,12 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 import mss.tools
+from mss.screenshot import ScreenShot
 
 from src.audio import SoundService
 from src.config.settings import AppSettings
 from src.core.interfaces.recording import IRecordingManager
+from src.core.workers import DRAIN_TIMEOUT, ENCODING, FILE_OPS, OBS_EVENTS, WorkerPool
 from src.detection.screen_capture import ScreenCaptureService
 from src.games.objects import Game
 
@@ -28,6 +30,7 @@ class RecordingManager(IRecordingManager):
         settings: AppSettings,
         sound_service: SoundService,
         screen: ScreenCaptureService,
+        workers: Optional[WorkerPool] = None,
     ):
         """
         Initialize the recording manager.
@@ -36,13 +39,16 @@ class RecordingManager(IRecordingManager):
             settings: Application settings
             sound_service: Sound service for playing sounds
             screen: Screen capture service for creating thumbnails
-            obs: OBS controller
+            workers: Worker pool for file operations and thumbnail encoding,
+                which run inline if not given
         """
         self.settings = settings
         self.sound_service = sound_service
         self.screen = screen
+        self.workers = workers
         self._current_lastplay_path: Optional[Path] = None
         self._current_thumbnail_path: Optional[Path] = None
+        self._lastplay_pending = False
 
         logging.debug("[Recording] Manager initialized")
 
@@ -63,33 +69,61 @@ class RecordingManager(IRecordingManager):
         """
         Handle a recording that just stopped by renaming it to lastplay.
 
+        The thumbnail is grabbed right away, while renaming the file and
+        encoding the thumbnail are queued on the worker pool so the OBS event
+        thread is not held up by the disk.
+
         Args:
             output_path: Original path of the recorded file
-            game: Game object if detection was active
 
         Returns:
             Path to the lastplay file
         """
         original_path = Path(output_path)
+        lastplay_path = original_path.parent / f"lastplay{original_path.suffix}"
 
-        if not original_path.exists():
-            logging.warning("[Recording] Recording file not found: %s", output_path)
-            return output_path
+        screenshot = None
+        if self.settings.save_thumbnails:
+            screenshot = self.screen.capture_focused_window()
 
-        recording_dir = original_path.parent
+        self._lastplay_pending = True
+        self._current_lastplay_path = lastplay_path
+        self._submit(FILE_OPS, self._promote_to_lastplay, original_path, screenshot)
 
-        extension = original_path.suffix
-        lastplay_path = recording_dir / f"lastplay{extension}"
+        return str(lastplay_path)
 
-        if lastplay_path.exists():
-            lastplay_path.unlink()
-            logging.debug("[Recording] Removed previous lastplay file")
+    def _promote_to_lastplay(
+        self, original_path: Path, screenshot: Optional[ScreenShot]
+    ) -> None:
+        """
+        Rename a stopped recording to lastplay, replacing the previous one.
 
-        shutil.move(str(original_path), str(lastplay_path))
-        self._current_lastplay_path = lastplay_path
+        Args:
+            original_path: Original path of the recorded file
+            screenshot: Capture to encode as the lastplay thumbnail
+        """
+        try:
+            if not original_path.exists():
+                logging.warning(
+                    "[Recording] Recording file not found: %s", original_path
+                )
+                self._current_lastplay_path = None
+                return
 
-        if self.settings.save_thumbnails:
-            self._create_lastplay_thumbnail(lastplay_path)
+            lastplay_path = original_path.parent / f"lastplay{original_path.suffix}"
+
+            if lastplay_path.exists():
+                lastplay_path.unlink()
+                logging.debug("[Recording] Removed previous lastplay file")
+
+            shutil.move(str(original_path), str(lastplay_path))
+        finally:
+            self._lastplay_pending = False
+
+        if screenshot is not None:
+            self._submit(
+                ENCODING, self._create_lastplay_thumbnail, lastplay_path, screenshot
+            )
 
         logging.info(
             "Recording renamed to lastplay",
@@ -97,8 +131,6 @@ class RecordingManager(IRecordingManager):
 
         self.sound_service.play_ready()
 
-        return str(lastplay_path)
-
     def save_lastplay(self, game: Optional[Game]) -> Tuple[bool, str]:
         """
         Save the current lastplay file with proper organization.
@@ -109,6 +141,8 @@ class RecordingManager(IRecordingManager):
         Returns:
             Tuple of (success, message)
         """
+        self._wait_for_pending()
+
         if not self.has_lastplay():
             return False, "No lastplay file available"
 
@@ -139,12 +173,32 @@ class RecordingManager(IRecordingManager):
         Check if a lastplay file exists.
 
         Returns:
-            True if lastplay file exists and is accessible
+            True if lastplay file exists and is accessible, or is still being
+            renamed
         """
-        return (
-            self._current_lastplay_path is not None
-            and self._current_lastplay_path.exists()
-        )
+        if self._current_lastplay_path is None:
+            return False
+        return self._lastplay_pending or self._current_lastplay_path.exists()
+
+    def _submit(self, queue_name: str, func, *args) -> None:
+        """Run a job on the worker pool, or inline without one."""
+        if self.workers:
+            self.workers.submit(queue_name, func, *args)
+        else:
+            func(*args)
+
+    def _wait_for_pending(self) -> None:
+        """
+        Wait for queued renames and thumbnails before touching lastplay.
+
+        A recording that just stopped may still have its event queued, which
+        is what queues its rename, so OBS events are waited for first. This
+        is never called from the OBS event worker itself.
+        """
+        if self.workers and not self.workers.wait_idle(
+            [OBS_EVENTS, FILE_OPS, ENCODING], timeout=DRAIN_TIMEOUT
+        ):
+            logging.warning("[Recording] Timed out waiting for pending file operations")
 
     def _generate_filename(
         self, original_path: Path, game: Optional[Game] = None
@@ -213,17 +267,16 @@ class RecordingManager(IRecordingManager):
 
         return filename
 
-    def _create_lastplay_thumbnail(self, video_path: Path) -> None:
+    def _create_lastplay_thumbnail(
+        self, video_path: Path, screenshot: ScreenShot
+    ) -> None:
         """
-        Create a thumbnail for the lastplay video using current screen capture.
+        Encode a thumbnail for the lastplay video.
 
         Args:
             video_path: Path to the lastplay video file
+            screenshot: Screen capture taken when the recording stopped
         """
-        screenshot = self.screen.capture_focused_window()
-        if not screenshot:
-            return None
-
         recording_dir = video_path.parent
         thumbnail_path = recording_dir / "lastplay.png"
 
@@ -0,0 +1,74 @@
+"""
+Local mirror of the OBS state SIGMArec reads.
+
+Scene and video settings lookups happen on every state transition and game
+change. The mirror answers them without a websocket round trip: it is filled
+once per connection and kept current by OBS events and by the changes the
+controller makes itself.
+"""
+
+import threading
+from typing import List, Optional
+
+from src.obs.videosettings import OBSVideoSettings
+
+
+class OBSStateCache:
+    """Thread-safe cache of the current scene, scene list and video settings."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._current_scene: Optional[str] = None
+        self._scenes: Optional[List[str]] = None
+        self._video_settings: Optional[OBSVideoSettings] = None
+
+    @property
+    def current_scene(self) -> Optional[str]:
+        """Name of the current program scene, None if unknown."""
+        with self._lock:
+            return self._current_scene
+
+    @property
+    def scenes(self) -> Optional[List[str]]:
+        """Names of all scenes, None if unknown."""
+        with self._lock:
+            return list(self._scenes) if self._scenes is not None else None
+
+    @property
+    def video_settings(self) -> Optional[OBSVideoSettings]:
+        """Current video settings, None if unknown."""
+        with self._lock:
+            return self._video_settings
+
+    def invalidate(self) -> None:
+        """Forget everything, e.g. because the connection to OBS was replaced."""
+        with self._lock:
+            self._current_scene = None
+            self._scenes = None
+            self._video_settings = None
+
+    def set_current_scene(self, scene_name: Optional[str]) -> None:
+        """Record the current program scene."""
+        with self._lock:
+            self._current_scene = scene_name
+
+    def set_scenes(self, scenes: Optional[List[str]]) -> None:
+        """Record the scene list."""
+        with self._lock:
+            self._scenes = list(scenes) if scenes is not None else None
+
+    def rename_scene(self, old_name: str, new_name: str) -> None:
+        """Follow a scene being renamed."""
+        with self._lock:
+            if self._scenes is not None:
+                self._scenes = [
+                    new_name if scene == old_name else scene for scene in self._scenes
+                ]
+            if self._current_scene == old_name:
+                self._current_scene = new_name
+
+    def set_video_settings(self, video_settings: Optional[OBSVideoSettings]) -> None:
+        """Record the video settings."""
+        with self._lock:
+            self._video_settings = video_settings
@@ -0,0 +1,13 @@
+"""
+Offline replay of recorded detection traces.
+
+Traces are recorded by the running application when detection.trace_dir is
+set, and replayed with `python -m src.replay <trace_dir>`. The replay driver
+lives in src.replay.driver and must be imported after install_win32_stubs on
+platforms without the Windows modules.
+"""
+
+from .stubs import install_win32_stubs
+from .trace import TraceReader, TraceRecorder, TraceTick
+
+__all__ = ["install_win32_stubs", "TraceReader", "TraceRecorder", "TraceTick"]
@@ -0,0 +1,82 @@
+"""
+Replay a recorded trace and report detected transitions and throughput.
+
+Usage:
+    python -m src.replay <trace_dir> [--games games.json] [--json report.json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from src.replay.stubs import install_win32_stubs
+
+
+def main() -> int:
+    """Entry point for offline replays."""
+    parser = argparse.ArgumentParser(description="Replay a SIGMArec detection trace")
+    parser.add_argument("trace_dir", help="Directory of the recorded trace")
+    parser.add_argument(
+        "--games", default="games.json", help="Games definition file to detect with"
+    )
+    parser.add_argument(
+        "--detections-required",
+        type=int,
+        default=2,
+        help="Consecutive detections needed to confirm a state",
+    )
+    parser.add_argument(
+        "--full-frame",
+        action="store_true",
+        help="Match against full frames instead of captured regions",
+    )
+    parser.add_argument("--json", help="Write the report to this JSON file")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+    install_win32_stubs()
+
+    # Detection imports Windows modules, so it is only loaded once they are stubbed
+    from src.games import GameDataLoader, GameRepository
+    from src.replay.driver import ReplayDriver
+    from src.replay.trace import TraceReader
+
+    games = GameRepository(GameDataLoader(args.games)).load_all_games()
+    trace = TraceReader(args.trace_dir)
+    driver = ReplayDriver(
+        games,
+        detections_required=args.detections_required,
+        region_capture=not args.full_frame,
+    )
+    report = driver.run(trace)
+
+    for transition in report.transitions:
+        print(
+            f"[{transition.time:9.3f}s #{transition.tick:<6}] {transition.game}: "
+            f"{transition.from_state} → {transition.to_state} "
+            f"{transition.patterns or ''}"
+        )
+
+    summary = report.to_dict()
+    print(
+        f"{summary['ticks']} ticks in {summary['elapsed']:.3f}s "
+        f"({summary['ticks_per_second']:.1f} ticks/s, "
+        f"p50 {summary['tick_ms']['p50']:.3f}ms, "
+        f"p99 {summary['tick_ms']['p99']:.3f}ms, "
+        f"max {summary['tick_ms']['max']:.3f}ms per tick)"
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Replays recorded traces through the detection pipeline.
+
+The driver wires the real GameDetector, PixelStateDetector, LogStateDetector
+and StateManager to in-memory fakes fed from a trace, then runs every tick as
+fast as possible. Windows-only modules must be stubbed (see
+install_win32_stubs) before this module is imported on other platforms.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.core.interfaces import DetectionContext, StateTransition
+from src.core.metrics import LatencyHistogram
+from src.detection.capture import FrameCaptureBackend
+from src.detection.detectors import GameDetector, LogStateDetector, PixelStateDetector
+from src.detection.engine.pipeline import DetectionPipeline
+from src.detection.engine.state_manager import StateManager
+from src.detection.log_service import LogService
+from src.detection.process_metadata import (
+    ProcessMetadataCache,
+    StaticProcessMetadataProvider,
+)
+from src.detection.screen_capture import ScreenCaptureService
+from src.games import Game
+
+from .trace import TraceReader, TraceTick
+
+# Stands in for ticks that were recorded without a frame, such as log games
+BLANK_FRAME = np.zeros((1, 1, 4), dtype=np.uint8)
+
+
+class ReplayContextProvider:
+    """Serves detection contexts from trace ticks instead of the desktop."""
+
+    def __init__(self, logs: LogService):
+        """
+        Initialize the provider.
+
+        Args:
+            logs: Log service, exposed like DetectionContextProvider.logs
+        """
+        self.logs = logs
+        self._tick: Optional[TraceTick] = None
+        self._entries: Dict[str, List[Dict[str, str]]] = {}
+
+    def set_tick(
+        self, tick: TraceTick, entries: Dict[str, List[Dict[str, str]]]
+    ) -> None:
+        """
+        Set the tick served by the next captures.
+
+        Args:
+            tick: Trace tick to replay
+            entries: Log entries of the tick by log file name
+        """
+        self._tick = tick
+        self._entries = entries
+
+    def capture(self) -> DetectionContext:
+        """Build the detection context of the current tick."""
+        tick = self._tick
+        if tick is None or not tick.window_title:
+            return DetectionContext(window_title="", timestamp=0.0)
+
+        return DetectionContext(
+            window_title=tick.window_title,
+            timestamp=tick.time,
+            pid=tick.pid,
+            process_name=tick.process_name,
+            jar_path=tick.jar_path,
+            log_loader=self._load_log,
+        )
+
+    def _load_log(self, pid: int, log_filename: str) -> List[Dict[str, str]]:
+        return self._entries.get(log_filename, [])
+
+
+@dataclass
+class ReplayTransition:
+    """A state transition observed during a replay."""
+
+    tick: int
+    time: float
+    game: str
+    from_state: Optional[str]
+    to_state: str
+    patterns: List[str]
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of replaying a trace."""
+
+    ticks: int = 0
+    elapsed: float = 0.0
+    transitions: List[ReplayTransition] = field(default_factory=list)
+    tick_times: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Replay throughput."""
+        return self.ticks / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert the report to plain data, e.g. for JSON output."""
+        return {
+            "ticks": self.ticks,
+            "elapsed": round(self.elapsed, 6),
+            "ticks_per_second": round(self.ticks_per_second, 1),
+            "tick_ms": {
+                "p50": round(self.tick_times.percentile(50) / 1000, 3),
+                "p99": round(self.tick_times.percentile(99) / 1000, 3),
+                "max": round(self.tick_times.max_micros / 1000, 3),
+            },
+            "transitions": [
+                {
+                    "tick": t.tick,
+                    "time": round(t.time, 3),
+                    "game": t.game,
+                    "from": t.from_state,
+                    "to": t.to_state,
+                    "patterns": t.patterns,
+                }
+                for t in self.transitions
+            ],
+        }
+
+
+class ReplayDriver:
+    """Runs the detection pipeline over a recorded trace."""
+
+    def __init__(
+        self,
+        games: List[Game],
+        detections_required: int = 2,
+        region_capture: bool = True,
+    ):
+        """
+        Build the detection pipeline on top of in-memory fakes.
+
+        Args:
+            games: Games to detect
+            detections_required: Consecutive detections needed to confirm a state
+            region_capture: Whether pixel detection grabs only pattern regions
+        """
+        self.backend = FrameCaptureBackend()
+        self.screen = ScreenCaptureService(self.backend)
+        self.logs = LogService(ProcessMetadataCache(StaticProcessMetadataProvider()))
+        self.contexts = ReplayContextProvider(self.logs)
+
+        self.game_detector = GameDetector(games, self.screen, self.contexts)
+        self.pixel_detector = PixelStateDetector(
+            self.screen, detections_required, region_capture=region_capture
+        )
+        self.log_detector = LogStateDetector(detections_required, self.logs)
+        self.state_manager = StateManager(self.logs)
+        self.pipeline = DetectionPipeline(
+            self.game_detector,
+            self.pixel_detector,
+            self.log_detector,
+            self.state_manager,
+        )
+
+    def run(self, trace: TraceReader) -> ReplayReport:
+        """
+        Replay every tick of a trace.
+
+        Args:
+            trace: Trace to replay
+
+        Returns:
+            ReplayReport with the transitions and throughput
+        """
+        report = ReplayReport()
+        start = time.perf_counter()
+
+        for index, tick in enumerate(trace):
+            frame = trace.load_frame(tick)
+            entries = trace.load_logs(tick)
+
+            tick_start = time.perf_counter_ns()
+            self._feed(tick, frame, entries)
+            transition = self._detect()
+            report.tick_times.record((time.perf_counter_ns() - tick_start) // 1000)
+
+            if transition:
+                report.transitions.append(
+                    ReplayTransition(
+                        tick=index,
+                        time=tick.time,
+                        game=transition.game.name,
+                        from_state=transition.from_state,
+                        to_state=transition.to_state,
+                        patterns=list(transition.triggered_patterns),
+                    )
+                )
+            report.ticks += 1
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _feed(
+        self,
+        tick: TraceTick,
+        frame: Optional[np.ndarray],
+        entries: Dict[str, List[Dict[str, str]]],
+    ) -> None:
+        """Point the fakes at a tick's recorded input."""
+        self.backend.title = tick.window_title
+        if frame is not None:
+            self.backend.set_frame(frame)
+        elif tick.window_title:
+            # The backend only reports a title while it holds a frame
+            self.backend.set_frame(BLANK_FRAME)
+        else:
+            self.backend.clear_frame()
+        self.contexts.set_tick(tick, entries)
+
+    def _detect(self) -> Optional[StateTransition]:
+        """Run one tick the way DetectionCoordinator does, without OBS."""
+        context = self.contexts.capture()
+        active_game = self.pipeline.detect_game(context)
+        self.pipeline.change_game(active_game)
+
+        if not active_game:
+            return None
+
+        return self.pipeline.detect_state(active_game, context).transition
@@ -0,0 +1,96 @@
+"""
+Stand-ins for Windows-only modules so detection can be imported elsewhere.
+
+Replays never touch the real desktop: frames, titles and logs all come from
+the trace. The stubs only have to satisfy imports and report an empty
+desktop if anything asks.
+"""
+
+import ctypes
+import importlib
+import logging
+import sys
+import types
+from typing import List
+
+
+class _NullCall:
+    """Attribute chain whose calls all return 0, standing in for ctypes.windll."""
+
+    def __getattr__(self, name: str) -> "_NullCall":
+        return self
+
+    def __call__(self, *args, **kwargs) -> int:
+        return 0
+
+
+def _win32gui() -> types.ModuleType:
+    module = types.ModuleType("win32gui")
+    module.GetForegroundWindow = lambda: 0
+    module.GetWindowText = lambda hwnd: ""
+    module.GetClientRect = lambda hwnd: (0, 0, 0, 0)
+    module.ClientToScreen = lambda hwnd, point: point
+    return module
+
+
+def _win32process() -> types.ModuleType:
+    module = types.ModuleType("win32process")
+    module.GetWindowThreadProcessId = lambda hwnd: (0, 0)
+    return module
+
+
+def _wmi() -> types.ModuleType:
+    module = types.ModuleType("wmi")
+
+    class WMI:
+        """WMI connection without any processes."""
+
+        def Win32_Process(self, **kwargs) -> list:
+            return []
+
+    module.WMI = WMI
+    return module
+
+
+def _winsound() -> types.ModuleType:
+    module = types.ModuleType("winsound")
+    module.SND_FILENAME = 0x20000
+    module.SND_ASYNC = 0x0001
+    module.SND_NODEFAULT = 0x0002
+    module.PlaySound = lambda sound, flags: None
+    return module
+
+
+_STUBS = {
+    "win32gui": _win32gui,
+    "win32process": _win32process,
+    "wmi": _wmi,
+    "winsound": _winsound,
+}
+
+
+def install_win32_stubs() -> List[str]:
+    """
+    Install stubs for every Windows-only module that cannot be imported.
+
+    Real modules are left alone, so replays on Windows use them unchanged.
+
+    Returns:
+        Names of the modules that were stubbed
+    """
+    installed = []
+
+    for name, factory in _STUBS.items():
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            sys.modules[name] = factory()
+            installed.append(name)
+
+    if not hasattr(ctypes, "windll"):
+        ctypes.windll = _NullCall()
+        installed.append("ctypes.windll")
+
+    if installed:
+        logging.debug("[Replay] Stubbed Windows modules: %s", ", ".join(installed))
+    return installed
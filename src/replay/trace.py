@@ -0,0 +1,262 @@
+"""
+On-disk traces of detection input.
+
+A trace is a directory holding everything detection read during a session:
+
+- ticks.jsonl: one line per tick with the time since the trace started, the
+  foreground window title and process, and references to the frame and log
+  snapshots of that tick
+- frames/: compressed BGRA frames of the focused window, as .npz
+- logs/: JSON snapshots of the log entries of Java games
+
+Frames and log snapshots are only written when they changed, so a tick can
+reference the same file as the previous one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from mss.screenshot import ScreenShot
+
+from src.core.interfaces import DetectionContext
+from src.games import Game, LogGame, PixelGame
+
+if TYPE_CHECKING:
+    from src.detection.screen_capture import ScreenCaptureService
+
+TICKS_FILE = "ticks.jsonl"
+FRAMES_DIR = "frames"
+LOGS_DIR = "logs"
+
+
+@dataclass(frozen=True)
+class TraceTick:
+    """Detection input of a single recorded tick."""
+
+    time: float
+    window_title: str
+    pid: Optional[int] = None
+    process_name: Optional[str] = None
+    jar_path: Optional[str] = None
+    frame: Optional[str] = None
+    logs: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Convert the tick to its JSON line representation."""
+        return {
+            "time": round(self.time, 6),
+            "title": self.window_title,
+            "pid": self.pid,
+            "process": self.process_name,
+            "jar": self.jar_path,
+            "frame": self.frame,
+            "logs": self.logs,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TraceTick":
+        """Create a tick from its JSON line representation."""
+        return cls(
+            time=float(data.get("time", 0.0)),
+            window_title=data.get("title", ""),
+            pid=data.get("pid"),
+            process_name=data.get("process"),
+            jar_path=data.get("jar"),
+            frame=data.get("frame"),
+            logs=dict(data.get("logs") or {}),
+        )
+
+
+class TraceRecorder:
+    """Writes the detection input of every tick to a trace directory."""
+
+    def __init__(self, trace_dir: Union[str, Path], screen: "ScreenCaptureService"):
+        """
+        Initialize the recorder and create the trace directory.
+
+        Args:
+            trace_dir: Directory to write the trace to
+            screen: Screen capture service used to grab full frames
+        """
+        self.trace_dir = Path(trace_dir)
+        self.screen = screen
+        (self.trace_dir / FRAMES_DIR).mkdir(parents=True, exist_ok=True)
+        (self.trace_dir / LOGS_DIR).mkdir(parents=True, exist_ok=True)
+
+        self._ticks_file = open(self.trace_dir / TICKS_FILE, "a", encoding="utf-8")
+        self._start = time.monotonic()
+        self._frame_count = 0
+        self._log_count = 0
+        self._last_frame_hash: Optional[bytes] = None
+        self._last_frame_path: Optional[str] = None
+        self._last_logs: Dict[str, Sequence[Dict[str, str]]] = {}
+        self._last_log_paths: Dict[str, str] = {}
+
+        logging.info("Recording detection trace to '%s'", self.trace_dir)
+
+    def record(self, context: DetectionContext, game: Optional[Game]) -> None:
+        """
+        Record one tick.
+
+        Full frames are grabbed for pixel games and log entries are read for
+        log games, regardless of what detection itself captured this tick.
+
+        Args:
+            context: Snapshot of the current tick
+            game: Active game, or None if no game is focused
+        """
+        frame_path = None
+        if isinstance(game, PixelGame):
+            frame_path = self._write_frame(self.screen.capture_focused_window())
+
+        log_paths = {}
+        if isinstance(game, LogGame):
+            log_path = self._write_logs(game.logs, context.get_log_entries(game.logs))
+            if log_path:
+                log_paths[game.logs] = log_path
+
+        tick = TraceTick(
+            time=time.monotonic() - self._start,
+            window_title=context.window_title,
+            pid=context.pid,
+            process_name=context.process_name,
+            jar_path=context.jar_path,
+            frame=frame_path,
+            logs=log_paths,
+        )
+        self._ticks_file.write(json.dumps(tick.to_dict()) + "\n")
+
+    def cleanup(self) -> None:
+        """Flush and close the trace."""
+        if not self._ticks_file.closed:
+            self._ticks_file.close()
+            logging.debug(
+                "[Trace] Closed with %d frames and %d log snapshots",
+                self._frame_count,
+                self._log_count,
+            )
+
+    def _write_frame(self, screenshot: Optional[ScreenShot]) -> Optional[str]:
+        """Write a frame unless it is identical to the previous one."""
+        if screenshot is None:
+            return None
+
+        raw = bytes(screenshot.raw)
+        frame_hash = hashlib.blake2b(raw, digest_size=16).digest()
+        if frame_hash == self._last_frame_hash:
+            return self._last_frame_path
+
+        pixels = np.frombuffer(raw, dtype=np.uint8).reshape(
+            screenshot.height, screenshot.width, 4
+        )
+        relative_path = f"{FRAMES_DIR}/{self._frame_count:06d}.npz"
+        np.savez_compressed(self.trace_dir / relative_path, frame=pixels)
+
+        self._frame_count += 1
+        self._last_frame_hash = frame_hash
+        self._last_frame_path = relative_path
+        return relative_path
+
+    def _write_logs(
+        self, log_filename: str, entries: Sequence[Dict[str, str]]
+    ) -> Optional[str]:
+        """Write a log snapshot unless it is identical to the previous one."""
+        if not entries:
+            return None
+
+        if list(entries) == list(self._last_logs.get(log_filename, ())):
+            return self._last_log_paths[log_filename]
+
+        relative_path = f"{LOGS_DIR}/{self._log_count:06d}.json"
+        with open(self.trace_dir / relative_path, "w", encoding="utf-8") as f:
+            json.dump(list(entries), f)
+
+        self._log_count += 1
+        self._last_logs[log_filename] = entries
+        self._last_log_paths[log_filename] = relative_path
+        return relative_path
+
+
+class TraceReader:
+    """Reads a trace directory back tick by tick."""
+
+    def __init__(self, trace_dir: Union[str, Path]):
+        """
+        Initialize the reader.
+
+        Args:
+            trace_dir: Directory of a recorded trace
+
+        Raises:
+            FileNotFoundError: If the directory holds no ticks file
+        """
+        self.trace_dir = Path(trace_dir)
+        ticks_path = self.trace_dir / TICKS_FILE
+        if not ticks_path.exists():
+            raise FileNotFoundError(f"No trace found in '{self.trace_dir}'")
+
+        with open(ticks_path, "r", encoding="utf-8") as f:
+            self.ticks: List[TraceTick] = [
+                TraceTick.from_dict(json.loads(line)) for line in f if line.strip()
+            ]
+
+        self._log_cache: Dict[str, List[Dict[str, str]]] = {}
+        self._last_frame: Optional[Tuple[str, np.ndarray]] = None
+
+    def __iter__(self) -> Iterator[TraceTick]:
+        return iter(self.ticks)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def load_frame(self, tick: TraceTick) -> Optional[np.ndarray]:
+        """
+        Load the frame of a tick.
+
+        Returns:
+            (height, width, 4) BGRA array, or None if the tick has no frame
+        """
+        if not tick.frame:
+            return None
+
+        if self._last_frame is not None and self._last_frame[0] == tick.frame:
+            return self._last_frame[1]
+
+        with np.load(self.trace_dir / tick.frame) as data:
+            frame = data["frame"]
+        self._last_frame = (tick.frame, frame)
+        return frame
+
+    def load_logs(self, tick: TraceTick) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Load the log snapshots of a tick.
+
+        Returns:
+            Mapping of log file name to its entries
+        """
+        logs = {}
+        for log_filename, relative_path in tick.logs.items():
+            entries = self._log_cache.get(relative_path)
+            if entries is None:
+                with open(
+                    os.path.join(self.trace_dir, relative_path), "r", encoding="utf-8"
+                ) as f:
+                    entries = self._log_cache[relative_path] = json.load(f)
+            logs[log_filename] = entries
+        return logs
@@ -0,0 +1,81 @@
+"""
+Shared fixtures for the test suite.
+
+Windows-only modules are stubbed before anything from src is imported, so the
+suite runs on any platform.
+"""
+
+import time
+
+import pytest
+
+from src.replay.stubs import install_win32_stubs
+
+install_win32_stubs()
+
+from src.config.settings import AppSettings  # noqa: E402
+from src.fake_obs import FakeOBSServer  # noqa: E402
+from src.obs.controller import OBSController  # noqa: E402
+
+OBS_PASSWORD = "test"
+WAIT_TIMEOUT = 5.0
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to, or when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _wait_until(condition, timeout: float = WAIT_TIMEOUT) -> None:
+    """Poll a condition until it holds, failing the test on timeout."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("Condition not met in time")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def wait_until():
+    """Poll a condition until it holds, for events arriving on other threads."""
+    return _wait_until
+
+
+@pytest.fixture
+def clock():
+    """A fake monotonic clock, for schedulers and tickers."""
+    return FakeClock()
+
+
+@pytest.fixture
+def obs_server():
+    """A fake OBS listening on a free local port."""
+    with FakeOBSServer(password=OBS_PASSWORD) as server:
+        yield server
+
+
+@pytest.fixture
+def obs_settings(obs_server):
+    """Settings pointing at the fake OBS."""
+    return AppSettings(
+        obs_host=obs_server.host, obs_port=obs_server.port, obs_password=OBS_PASSWORD
+    )
+
+
+@pytest.fixture
+def obs(obs_server, obs_settings):
+    """An OBS controller connected to the fake OBS, without background threads."""
+    controller = OBSController.connect(obs_settings, background=False)
+    assert controller.connect_once()
+    yield controller
+    controller.shutdown()
@@ -0,0 +1,140 @@
+"""
+Tests for the ordering of calls handed over to the asyncio runtime.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core import async_runtime
+from src.core.async_runtime import AsyncRuntime
+from src.core.interfaces import DetectionResult
+from src.core.metrics import PipelineMetrics
+from src.core.scheduler import Scheduler
+
+
+class FakeSettings:
+    obs_timeout = 5.0
+    save_key = "f9"
+
+    def get_detection_interval(self, state, idle=False):
+        return 0.01
+
+
+class FakeEngine:
+    def detect_and_control(self):
+        return DetectionResult(game=None, state=None, confidence=0.0, metadata={})
+
+
+class FakeOBS:
+    def __init__(self):
+        self.dispatcher = None
+
+    def set_event_dispatcher(self, dispatcher):
+        self.dispatcher = dispatcher
+
+    def connect_once(self):
+        return False
+
+    def check_connection(self):
+        return 5.0
+
+
+class FakeContainer:
+    def __init__(self, services):
+        self.services = services
+
+    def get(self, name):
+        return self.services[name]
+
+
+@pytest.fixture
+def hotkeys(monkeypatch):
+    """Capture the hotkey callbacks instead of hooking the keyboard."""
+    callbacks = []
+
+    def add_hotkey(key, callback, trigger_on_release=False):
+        callbacks.append((callback, trigger_on_release))
+        return len(callbacks)
+
+    monkeypatch.setattr(async_runtime.keyboard, "add_hotkey", add_hotkey)
+    monkeypatch.setattr(async_runtime.keyboard, "remove_hotkey", lambda hotkey: None)
+    return callbacks
+
+
+def run_runtime(on_save, actions, hotkeys, duration=0.5):
+    """Run the runtime while a thread performs actions against it."""
+    obs = FakeOBS()
+    container = FakeContainer(
+        {
+            "AppSettings": FakeSettings(),
+            "IDetectionEngine": FakeEngine(),
+            "Scheduler": Scheduler(),
+            "IOBSController": obs,
+            "PipelineMetrics": PipelineMetrics(),
+        }
+    )
+    start = time.monotonic()
+    runtime = AsyncRuntime(
+        container,
+        on_save_hotkey=on_save,
+        should_stop=lambda: time.monotonic() - start > duration,
+    )
+
+    def act():
+        while obs.dispatcher is None or len(hotkeys) < 2:
+            time.sleep(0.001)
+        actions(obs.dispatcher)
+
+    thread = threading.Thread(target=act)
+    thread.start()
+    runtime.run()
+    thread.join()
+
+
+def test_save_hotkey_waits_for_queued_obs_events(hotkeys):
+    calls = []
+
+    def slow_start():
+        time.sleep(0.1)
+        calls.append("started")
+
+    def actions(dispatch):
+        # The stop waits in the queue while the start is handled
+        dispatch(slow_start)
+        dispatch(lambda: calls.append("stopped"))
+        press = next(cb for cb, on_release in hotkeys if not on_release)
+        press()
+
+    run_runtime(lambda: calls.append("saved"), actions, hotkeys)
+
+    assert calls == ["started", "stopped", "saved"]
+
+
+def test_obs_events_are_never_dropped(hotkeys):
+    handled = []
+
+    def actions(dispatch):
+        for index in range(300):
+            dispatch(lambda index=index: handled.append(index))
+
+    run_runtime(lambda: None, actions, hotkeys, duration=0.2)
+
+    assert handled == list(range(300))
+
+
+def test_held_hotkey_saves_once(hotkeys):
+    saves = []
+
+    def actions(dispatch):
+        press = next(cb for cb, on_release in hotkeys if not on_release)
+        release = next(cb for cb, on_release in hotkeys if on_release)
+        press()
+        press()
+        release()
+        press()
+
+    run_runtime(lambda: saves.append(1), actions, hotkeys, duration=0.2)
+
+    assert len(saves) == 2
@@ -0,0 +1,105 @@
+"""
+Tests for the capture session, fed by in-memory frames.
+"""
+
+import numpy as np
+import pytest
+
+from src.detection.capture import CaptureSession, FrameCaptureBackend
+from src.games import RegionLayout
+
+POINTS = [(1, 1), (10, 2), (100, 50)]
+
+
+def make_frame(width: int, height: int) -> np.ndarray:
+    """A BGRA frame whose every pixel encodes its coordinates."""
+    frame = np.zeros((height, width, 4), dtype=np.uint8)
+    frame[..., 0] = np.arange(width, dtype=np.uint8)[None, :]
+    frame[..., 1] = np.arange(height, dtype=np.uint8)[:, None]
+    frame[..., 3] = 255
+    return frame
+
+
+@pytest.fixture
+def backend():
+    backend = FrameCaptureBackend(title="beatoraja")
+    backend.set_frame(make_frame(160, 90))
+    return backend
+
+
+@pytest.fixture
+def layout():
+    return RegionLayout.covering(POINTS)
+
+
+def pixel_at(raw: bytearray, offset: int):
+    return tuple(raw[offset : offset + 4])
+
+
+def test_grab_window_returns_the_frame(backend):
+    session = CaptureSession(backend)
+    shot = session.grab_window()
+
+    assert (shot.width, shot.height) == (160, 90)
+    assert bytes(shot.raw) == make_frame(160, 90).tobytes()
+    assert backend.get_foreground_title() == "beatoraja"
+
+
+def test_nothing_is_grabbed_without_a_window(backend, layout):
+    backend.clear_frame()
+    session = CaptureSession(backend)
+
+    assert session.grab_window() is None
+    assert session.grab_regions(lambda width, height: layout) is None
+    assert backend.get_foreground_title() == ""
+
+
+def test_regions_hold_the_covered_pixels(backend, layout):
+    session = CaptureSession(backend)
+    frame = session.grab_regions(lambda width, height: layout)
+
+    assert (frame.width, frame.height) == (160, 90)
+    for x, y in POINTS:
+        assert pixel_at(frame.raw, layout.remap(x, y)) == (x, y, 0, 255)
+
+
+def test_region_buffers_are_pooled(backend, layout):
+    session = CaptureSession(backend, pool_size=2)
+    grabs = [session.grab_regions(lambda width, height: layout) for _ in range(3)]
+
+    assert grabs[0].raw is not grabs[1].raw
+    assert grabs[2].raw is grabs[0].raw
+
+
+def test_resized_window_gets_its_own_layout(backend, layout):
+    session = CaptureSession(backend)
+    sizes = []
+
+    def get_layout(width, height):
+        sizes.append((width, height))
+        return layout if width == 160 else None
+
+    first = session.grab_regions(get_layout)
+    backend.set_frame(make_frame(200, 100))
+    assert session.grab_regions(get_layout) is None
+
+    backend.set_frame(make_frame(160, 90))
+    assert session.grab_regions(get_layout).raw is not first.raw
+    assert sizes == [(160, 90), (200, 100), (160, 90)]
+
+
+def test_grabs_outside_the_frame_are_black(backend):
+    shot = backend.grab({"left": 150, "top": 80, "width": 20, "height": 20})
+    pixels = np.frombuffer(bytes(shot.raw), dtype=np.uint8).reshape(20, 20, 4)
+
+    assert pixels[0, 0].tolist() == [150, 80, 0, 255]
+    assert not pixels[10:, :].any()
+    assert not pixels[:, 10:].any()
+
+
+def test_raw_frames_need_a_size(backend):
+    with pytest.raises(ValueError):
+        backend.set_frame(bytes(16))
+
+    backend.set_frame(bytes(16), width=2, height=2)
+    assert backend.get_foreground_area().width == 2
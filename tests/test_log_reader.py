@@ -0,0 +1,128 @@
+"""
+Tests for the incremental XML log reader.
+"""
+
+import os
+
+import pytest
+
+from src.detection.log_reader import IncrementalLogReader
+
+HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<log>\n'
+
+
+def record(message: str, method: str = "update") -> str:
+    return (
+        "<record>\n"
+        "  <date>2024-01-01T00:00:00</date>\n"
+        "  <class>bms.player.Main</class>\n"
+        f"  <method>{method}</method>\n"
+        f"  <message>{message}</message>\n"
+        "</record>\n"
+    )
+
+
+def messages(entries):
+    return [entry["message"] for entry in entries]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "beatoraja_log.xml"
+    path.write_text(HEADER + record("one"), encoding="utf-8")
+    return str(path)
+
+
+def append(path: str, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_reads_only_appended_records(log_path):
+    reader = IncrementalLogReader()
+    assert messages(reader.read(log_path)) == ["one"]
+
+    append(log_path, record("two") + record("three"))
+    assert messages(reader.read(log_path)) == ["one", "two", "three"]
+    assert messages(reader.read(log_path, max_entries=1)) == ["three"]
+
+
+def test_waits_for_a_record_to_be_complete(log_path):
+    reader = IncrementalLogReader()
+    reader.read(log_path)
+
+    partial = record("two")
+    append(log_path, partial[:30])
+    assert messages(reader.read(log_path)) == ["one"]
+
+    append(log_path, partial[30:])
+    assert messages(reader.read(log_path)) == ["one", "two"]
+
+
+def test_keeps_split_multibyte_characters(log_path):
+    reader = IncrementalLogReader()
+    reader.read(log_path)
+
+    data = record("曲選択").encode("utf-8")
+    split = data.index("選".encode("utf-8")) + 1
+    with open(log_path, "ab") as f:
+        f.write(data[:split])
+    reader.read(log_path)
+    with open(log_path, "ab") as f:
+        f.write(data[split:])
+
+    assert messages(reader.read(log_path))[-1] == "曲選択"
+
+
+def test_truncated_file_is_read_from_scratch(log_path):
+    reader = IncrementalLogReader()
+    append(log_path, record("two") + record("three"))
+    reader.read(log_path)
+
+    with open(log_path, "w", encoding="utf-8") as f:
+        f.write(HEADER + record("fresh"))
+    assert messages(reader.read(log_path)) == ["fresh"]
+
+
+def test_rotated_file_is_read_from_scratch(log_path, tmp_path):
+    reader = IncrementalLogReader()
+    reader.read(log_path)
+
+    # A new file of the same size only differs by its identity
+    rotated = tmp_path / "new_log.xml"
+    rotated.write_text(HEADER + record("new"), encoding="utf-8")
+    os.replace(rotated, log_path)
+    assert messages(reader.read(log_path)) == ["new"]
+
+
+def test_new_file_is_only_read_from_its_tail(tmp_path):
+    path = tmp_path / "long_log.xml"
+    path.write_text(
+        HEADER + "".join(record(str(index)) for index in range(1000)),
+        encoding="utf-8",
+    )
+
+    reader = IncrementalLogReader(initial_tail_bytes=2048)
+    entries = reader.read(str(path))
+    assert messages(entries)[-1] == "999"
+    assert 0 < len(entries) <= 2048 // len(record("999"))
+
+
+def test_missing_file_forgets_its_position(log_path):
+    reader = IncrementalLogReader()
+    reader.read(log_path)
+
+    os.remove(log_path)
+    assert reader.read(log_path) == []
+
+    with open(log_path, "w", encoding="utf-8") as f:
+        f.write(HEADER + record("again"))
+    assert messages(reader.read(log_path)) == ["again"]
+
+
+def test_malformed_record_is_skipped(log_path):
+    reader = IncrementalLogReader()
+    reader.read(log_path)
+
+    append(log_path, "<record><class>x</clas></record>\n" + record("two"))
+    assert messages(reader.read(log_path)) == ["one", "two"]
@@ -0,0 +1,104 @@
+"""
+Tests for batched OBS requests, against the fake OBS.
+"""
+
+import pytest
+
+from src.obs import OBSVideoSettings
+from src.obs.batch import NOT_RUN, OBSRequest
+
+GAME_VIDEO = OBSVideoSettings(1280, 720, 1280, 720, 120, 1)
+
+
+@pytest.fixture
+def sent(obs, monkeypatch):
+    """Messages the controller sends on its request websocket."""
+    ws = obs.req_client.base_client.ws
+    messages = []
+    send = ws.send
+
+    def record(payload, *args, **kwargs):
+        messages.append(payload)
+        return send(payload, *args, **kwargs)
+
+    monkeypatch.setattr(ws, "send", record)
+    return messages
+
+
+def test_batch_runs_requests_in_order(obs, obs_server):
+    scenes = []
+    results = obs.send_batch(
+        [
+            OBSRequest("SetCurrentProgramScene", {"sceneName": "Playing"}),
+            OBSRequest(
+                "GetCurrentProgramScene",
+                on_success=lambda data: scenes.append(data["sceneName"]),
+            ),
+        ]
+    )
+
+    assert [result.ok for result in results] == [True, True]
+    assert scenes == ["Playing"]
+    assert [request for _, request in obs_server.requests][-2:] == [
+        "SetCurrentProgramScene",
+        "GetCurrentProgramScene",
+    ]
+
+
+def test_failed_request_does_not_stop_the_batch(obs, obs_server):
+    results = obs.send_batch(
+        [
+            OBSRequest("SetCurrentProgramScene", {"sceneName": "Missing"}),
+            OBSRequest("SetCurrentProgramScene", {"sceneName": "Result"}),
+        ]
+    )
+
+    assert not results[0].ok
+    assert results[0].code == 600
+    assert results[1].ok
+    assert obs_server.state.current_scene == "Result"
+    assert obs.is_connected
+
+
+def test_halt_on_failure_skips_the_rest(obs, obs_server):
+    obs_server.fail_request("SetVideoSettings", times=1)
+    called = []
+    results = obs.send_batch(
+        [
+            OBSRequest("SetVideoSettings", {"baseWidth": 1280}),
+            OBSRequest(
+                "SetCurrentProgramScene",
+                {"sceneName": "Result"},
+                lambda data: called.append(data),
+            ),
+        ],
+        halt_on_failure=True,
+    )
+
+    assert not results[0].ok
+    assert results[1].code == NOT_RUN
+    assert called == []
+    assert obs_server.state.current_scene == "Scene"
+
+
+def test_batched_block_sends_one_message(obs, obs_server, sent):
+    with obs.batched():
+        obs.set_video_settings(GAME_VIDEO)
+        obs.set_current_scene("Playing")
+        # Nothing is sent before the block exits
+        assert sent == []
+        assert obs.get_current_scene() == "Scene"
+
+    assert len(sent) == 1
+    assert obs_server.state.current_scene == "Playing"
+    assert obs_server.state.video["baseWidth"] == 1280
+    assert obs.get_current_scene() == "Playing"
+    assert obs.get_video_settings() == GAME_VIDEO
+
+
+def test_batch_without_connection_runs_nothing(obs, obs_server):
+    obs_server.disconnect_clients()
+    obs.check_connection()
+
+    results = obs.send_batch([OBSRequest("GetVersion")])
+    assert [result.code for result in results] == [NOT_RUN]
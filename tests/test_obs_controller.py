@@ -0,0 +1,128 @@
+"""
+Tests for the OBS controller's connection and recording events, against the
+fake OBS.
+"""
+
+from src.config.settings import AppSettings
+from src.core.interfaces import IOBSEventHandler
+from src.obs.controller import OBSController
+
+
+class RecordingHandler(IOBSEventHandler):
+    """Event handler remembering what it was told."""
+
+    def __init__(self):
+        self.started = 0
+        self.stopped = []
+
+    def on_recording_started(self) -> None:
+        self.started += 1
+
+    def on_recording_stopped(self, output_path: str) -> None:
+        self.stopped.append(output_path)
+
+
+def test_connect_reads_initial_state(obs_server, obs_settings):
+    obs_server.state.recording = True
+    obs_server.state.replay_buffer = True
+    obs_server.state.current_scene = "Playing"
+
+    obs = OBSController.connect(obs_settings, background=False)
+    try:
+        assert obs.connect_once()
+        assert obs.is_connected
+        assert obs.recording_active
+        assert obs.replay_buffer_active
+        assert obs.get_current_scene() == "Playing"
+    finally:
+        obs.shutdown()
+
+
+def test_wrong_password_fails_to_connect(obs_server):
+    settings = AppSettings(
+        obs_host=obs_server.host,
+        obs_port=obs_server.port,
+        obs_password="wrong",
+        obs_timeout=1,
+    )
+    obs = OBSController.connect(settings, background=False)
+    assert not obs.connect_once()
+    assert not obs.is_connected
+
+
+def test_reconnects_after_disconnect(obs, obs_server, obs_settings):
+    obs_server.disconnect_clients()
+
+    # The first check notices the lost connection, the next one reconnects
+    assert obs.check_connection() == 1.0
+    assert not obs.is_connected
+    assert obs.check_connection() == obs_settings.obs_timeout
+    assert obs.is_connected
+    assert obs_server.wait_for_clients(2)
+
+
+def test_keeps_retrying_while_obs_is_closed(obs, obs_server, obs_settings):
+    obs_server.refuse_connections = True
+    obs_server.disconnect_clients()
+
+    for _ in range(3):
+        assert obs.check_connection() == 1.0
+    assert not obs.is_connected
+
+    obs_server.refuse_connections = False
+    assert obs.check_connection() == obs_settings.obs_timeout
+    assert obs.is_connected
+
+
+def test_record_state_changes_drive_callbacks(obs, obs_server, wait_until):
+    completed = []
+    handler = RecordingHandler()
+    obs.set_recording_completed_callback(completed.append)
+    obs.register_event_handler(handler)
+
+    obs.start_recording()
+    wait_until(lambda: obs.recording_active)
+    wait_until(lambda: handler.started == 1)
+    assert obs_server.state.recording
+
+    obs.stop_recording()
+    wait_until(lambda: completed)
+    assert not obs.recording_active
+    assert completed[0].endswith(".mkv")
+    assert handler.stopped == completed
+
+
+def test_recording_flag_follows_events_from_obs(obs, obs_server, wait_until):
+    obs_server.emit_event(
+        "RecordStateChanged",
+        {"outputActive": True, "outputState": "OBS_WEBSOCKET_OUTPUT_STARTED"},
+    )
+    wait_until(lambda: obs.recording_active)
+
+    obs_server.emit_event(
+        "RecordStateChanged",
+        {
+            "outputActive": False,
+            "outputState": "OBS_WEBSOCKET_OUTPUT_STOPPED",
+            "outputPath": "recordings/external.mkv",
+        },
+    )
+    wait_until(lambda: not obs.recording_active)
+
+
+def test_dispatched_events_update_the_flag_on_receipt(obs, obs_server, wait_until):
+    handlers = []
+    completed = []
+    obs.set_event_dispatcher(handlers.append)
+    obs.set_recording_completed_callback(completed.append)
+
+    obs.start_recording()
+    wait_until(lambda: obs.recording_active)
+    obs.stop_recording()
+    wait_until(lambda: not obs.recording_active)
+
+    # The flag is current while the handlers still wait to be run
+    assert completed == []
+    for handler in handlers:
+        handler()
+    assert len(completed) == 1
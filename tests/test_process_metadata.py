@@ -0,0 +1,96 @@
+"""
+Tests for process metadata caching and its use by the focus trackers.
+"""
+
+import pytest
+
+from src.detection.focus import polling
+from src.detection.focus.fake import StaticFocusTracker
+from src.detection.focus.polling import PollingFocusTracker
+from src.detection.process_metadata import (
+    ProcessMetadata,
+    ProcessMetadataCache,
+    StaticProcessMetadataProvider,
+    parse_jar_path,
+)
+
+CMDLINE = "java -cp beatoraja.jar;lib/* bms.player.MainLoader"
+INCOMPLETE = ProcessMetadata(
+    pid=42, create_time=1.0, exe_name="java.exe", cmdline=CMDLINE, complete=False
+)
+COMPLETE = ProcessMetadata(
+    pid=42,
+    create_time=1.0,
+    exe_name="java.exe",
+    cmdline=CMDLINE,
+    cwd="/games/beatoraja",
+    jar_path="/games/beatoraja/beatoraja.jar",
+)
+
+
+@pytest.fixture
+def provider():
+    return StaticProcessMetadataProvider([INCOMPLETE])
+
+
+@pytest.fixture
+def foreground(monkeypatch):
+    """Focus a window owned by PID 42 for the polling tracker."""
+    monkeypatch.setattr(polling.win32gui, "GetForegroundWindow", lambda: 7)
+    monkeypatch.setattr(polling.win32gui, "GetWindowText", lambda hwnd: "beatoraja")
+    monkeypatch.setattr(
+        polling.win32process, "GetWindowThreadProcessId", lambda hwnd: (1, 42)
+    )
+
+
+def test_parse_jar_path_needs_cwd_for_relative_jars():
+    assert parse_jar_path(CMDLINE, "") is None
+    assert parse_jar_path(CMDLINE, "/games/beatoraja").endswith("beatoraja.jar")
+    assert parse_jar_path("java -cp /abs/game.jar Main", "") == "/abs/game.jar"
+
+
+def test_cache_does_not_keep_incomplete_metadata(provider):
+    cache = ProcessMetadataCache(provider)
+
+    assert cache.get(42) == INCOMPLETE
+    assert len(cache) == 0
+
+    provider.add(COMPLETE)
+    assert cache.get(42) == COMPLETE
+    assert cache.get(42) == COMPLETE
+    assert provider.fetch_count == 2
+
+
+def test_cache_detects_pid_reuse(provider):
+    provider.add(COMPLETE)
+    cache = ProcessMetadataCache(provider)
+    assert cache.get(42).create_time == 1.0
+
+    provider.add(ProcessMetadata(pid=42, create_time=2.0, exe_name="other.exe"))
+    assert cache.get(42).exe_name == "other.exe"
+
+
+def test_polling_tracker_fills_in_jar_path_once_complete(provider, foreground):
+    tracker = PollingFocusTracker(ProcessMetadataCache(provider))
+
+    assert tracker.refresh().metadata.jar_path is None
+    assert tracker.refresh().metadata.jar_path is None
+
+    provider.add(COMPLETE)
+    assert tracker.refresh().metadata.jar_path == COMPLETE.jar_path
+
+    fetches = provider.fetch_count
+    for _ in range(3):
+        assert tracker.refresh().metadata.jar_path == COMPLETE.jar_path
+    assert provider.fetch_count == fetches
+
+
+def test_static_tracker_drops_metadata_of_reused_pid(provider):
+    provider.add(COMPLETE)
+    tracker = StaticFocusTracker(ProcessMetadataCache(provider))
+    tracker.set_foreground("beatoraja", pid=42)
+    assert tracker.snapshot.metadata == COMPLETE
+
+    provider.add(ProcessMetadata(pid=42, create_time=2.0, exe_name="other.exe"))
+    tracker.set_foreground("other", pid=42)
+    assert tracker.snapshot.exe_name == "other.exe"
@@ -0,0 +1,165 @@
+"""
+Tests for capturing plays through the OBS replay buffer, against the fake OBS.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.interfaces import StateTransition
+from src.core.scheduler import Scheduler
+from src.detection.processors.recording_processor import (
+    REPLAY_DISARM_DELAY,
+    RecordingProcessor,
+)
+from src.detection.processors.video_processor import VideoProcessor
+from src.obs import OBSVideoSettings
+
+GAME = SimpleNamespace(name="Game", shortname="game")
+DEFAULT_VIDEO = {"Base": "1920x1080", "Output": "1920x1080", "FPS": "60"}
+GAME_VIDEO = {"Base": "1280x720", "Output": "1280x720", "FPS": "120"}
+
+
+class FakeSounds:
+    """Sound service counting what it was asked to play."""
+
+    def __init__(self):
+        self.played = []
+
+    def play_start(self):
+        self.played.append("start")
+
+    def play_failed(self):
+        self.played.append("failed")
+
+
+@pytest.fixture
+def flow(obs, obs_settings, clock):
+    """Recording and video processors saving plays from the replay buffer."""
+    obs_settings.capture_mode = "replay_buffer"
+    obs_settings.video = {"Default": DEFAULT_VIDEO, "game": GAME_VIDEO}
+    scheduler = Scheduler(clock=clock)
+    video = VideoProcessor(obs, obs_settings)
+    recording = RecordingProcessor(
+        obs,
+        obs_settings,
+        scene_processor=None,
+        sound_service=FakeSounds(),
+        scheduler=scheduler,
+        video_processor=video,
+    )
+    return SimpleNamespace(
+        recording=recording,
+        video=video,
+        scheduler=scheduler,
+        sounds=recording.sound_service,
+    )
+
+
+def transition(*patterns: str) -> StateTransition:
+    return StateTransition(
+        from_state=None,
+        to_state="state",
+        game=GAME,
+        timestamp=time.time(),
+        triggered_patterns=list(patterns),
+    )
+
+
+def focus(flow, game) -> None:
+    """Hand a focus change to the processors like the coordinator does."""
+    flow.video.process_game_change(game)
+    flow.recording.process_game_change(game)
+
+
+def test_play_is_saved_from_the_replay_buffer(
+    obs, obs_server, flow, clock, obs_settings, wait_until
+):
+    saved = []
+    obs.set_recording_completed_callback(saved.append)
+
+    focus(flow, GAME)
+    wait_until(lambda: obs.replay_buffer_active)
+    assert obs_server.state.video["baseWidth"] == 1280
+    assert flow.recording._replay_buffer_length == 120
+
+    flow.recording.process_transition(transition("start_play"))
+    flow.recording.process_transition(transition("stop_play"))
+    assert flow.scheduler.run_pending() == 0
+
+    clock.now += obs_settings.result_wait
+    assert flow.scheduler.run_pending() == 1
+    wait_until(lambda: saved)
+    assert saved[0].endswith(".mkv")
+    assert flow.sounds.played == ["start"]
+    # The buffer keeps running for the next play
+    assert obs_server.state.replay_buffer
+
+
+def test_discarded_play_is_not_saved(obs, obs_server, flow, clock, wait_until):
+    focus(flow, GAME)
+    wait_until(lambda: obs.replay_buffer_active)
+
+    flow.recording.process_transition(transition("start_play"))
+    flow.recording.process_transition(transition("discard_play"))
+    clock.now += 60
+    flow.scheduler.run_pending()
+
+    assert "SaveReplayBuffer" not in [request for _, request in obs_server.requests]
+    assert flow.sounds.played == ["start", "failed"]
+
+
+def test_buffer_survives_the_focus_grace_period(
+    obs, obs_server, flow, clock, wait_until
+):
+    focus(flow, GAME)
+    wait_until(lambda: obs.replay_buffer_active)
+
+    focus(flow, None)
+    clock.now += REPLAY_DISARM_DELAY / 2
+    flow.scheduler.run_pending()
+    assert obs_server.state.replay_buffer
+    assert obs_server.state.video["baseWidth"] == 1280
+
+    # Coming back within the grace period keeps the buffer untouched
+    focus(flow, GAME)
+    clock.now += REPLAY_DISARM_DELAY
+    flow.scheduler.run_pending()
+    assert obs_server.state.replay_buffer
+    assert "StopReplayBuffer" not in [request for _, request in obs_server.requests]
+
+
+def test_buffer_stops_then_default_video_applies(
+    obs, obs_server, flow, clock, wait_until
+):
+    focus(flow, GAME)
+    wait_until(lambda: obs.replay_buffer_active)
+
+    focus(flow, None)
+    clock.now += REPLAY_DISARM_DELAY
+    flow.scheduler.run_pending()
+    wait_until(lambda: not obs.replay_buffer_active)
+
+    # The default settings wait for OBS to report the buffer stopped
+    while obs_server.state.video["baseWidth"] != 1920:
+        assert flow.scheduler.time_until_next() is not None
+        clock.now += flow.scheduler.time_until_next()
+        flow.scheduler.run_pending()
+    assert not obs_server.state.replay_buffer
+
+
+def test_video_change_restarts_a_running_buffer(obs, obs_server, wait_until):
+    obs.start_replay_buffer()
+    wait_until(lambda: obs.replay_buffer_active)
+
+    obs.set_video_settings(OBSVideoSettings(1280, 720, 1280, 720, 120, 1))
+
+    assert obs.is_connected
+    assert obs_server.state.video["baseWidth"] == 1280
+    assert obs_server.state.replay_buffer
+    assert [request for _, request in obs_server.requests][-3:] == [
+        "StopReplayBuffer",
+        "SetVideoSettings",
+        "StartReplayBuffer",
+    ]
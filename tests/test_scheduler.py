@@ -0,0 +1,87 @@
+"""
+Tests for the deferred action scheduler.
+"""
+
+import pytest
+
+from src.core.scheduler import Scheduler
+
+
+@pytest.fixture
+def scheduler(clock):
+    return Scheduler(clock=clock)
+
+
+def test_tasks_run_once_due_in_order(scheduler, clock):
+    ran = []
+    scheduler.schedule(2.0, lambda: ran.append("late"), "late")
+    scheduler.schedule(1.0, lambda: ran.append("early"), "early")
+    scheduler.schedule(1.0, lambda: ran.append("tied"), "tied")
+
+    assert scheduler.run_pending() == 0
+    assert scheduler.time_until_next() == 1.0
+
+    clock.now = 1.0
+    assert scheduler.run_pending() == 2
+    assert ran == ["early", "tied"]
+
+    clock.now = 5.0
+    assert scheduler.run_pending() == 1
+    assert ran == ["early", "tied", "late"]
+    assert scheduler.time_until_next() is None
+
+
+def test_cancel_by_name(scheduler, clock):
+    ran = []
+    scheduler.schedule(1.0, lambda: ran.append("stop"), "recording.delayed_stop")
+    scheduler.schedule(1.0, lambda: ran.append("stop"), "recording.delayed_stop")
+    scheduler.schedule(1.0, lambda: ran.append("other"), "other")
+
+    assert scheduler.has_pending("recording.delayed_stop")
+    assert scheduler.cancel("recording.delayed_stop") == 2
+    assert scheduler.cancel("recording.delayed_stop") == 0
+    assert not scheduler.has_pending("recording.delayed_stop")
+
+    clock.now = 1.0
+    assert scheduler.run_pending() == 1
+    assert ran == ["other"]
+
+
+def test_cancelled_head_does_not_hold_up_the_next_task(scheduler):
+    scheduler.schedule(1.0, lambda: None, "first")
+    scheduler.schedule(3.0, lambda: None, "second")
+
+    scheduler.cancel("first")
+    assert scheduler.time_until_next() == 3.0
+
+
+def test_cancel_through_the_handle(scheduler, clock):
+    ran = []
+    task = scheduler.schedule(1.0, lambda: ran.append(1), "task")
+    task.cancel()
+
+    clock.now = 1.0
+    assert scheduler.run_pending() == 0
+    assert ran == []
+
+
+def test_failing_task_does_not_stop_the_others(scheduler, clock):
+    ran = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    scheduler.schedule(0.0, fail, "fail")
+    scheduler.schedule(0.0, lambda: ran.append(1), "ok")
+
+    assert scheduler.run_pending() == 2
+    assert ran == [1]
+
+
+def test_cleanup_drops_everything(scheduler, clock):
+    scheduler.schedule(1.0, lambda: None, "task")
+    scheduler.cleanup()
+
+    clock.now = 1.0
+    assert scheduler.run_pending() == 0
+    assert not scheduler.has_pending("task")
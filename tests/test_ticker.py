@@ -0,0 +1,123 @@
+"""
+Tests for deadline pacing of the detection loop.
+"""
+
+import pytest
+
+from src.core.scheduler import Scheduler
+from src.core.ticker import MODE_ACTIVE, MODE_IDLE, DeadlineTicker
+
+
+class FakeCpuClock:
+    """Process CPU time that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cpu_clock():
+    return FakeCpuClock()
+
+
+@pytest.fixture
+def ticker(clock, cpu_clock):
+    return DeadlineTicker(
+        clock=clock, sleep=clock.sleep, report_interval=3600, cpu_clock=cpu_clock
+    )
+
+
+def test_processing_time_does_not_drift_the_period(ticker, clock):
+    ticker.wait(1.0)
+    for _ in range(3):
+        clock.now += 0.3
+        ticker.wait(1.0)
+
+    assert clock.sleeps == pytest.approx([1.0, 0.7, 0.7, 0.7])
+    assert clock.now == pytest.approx(4.0)
+    assert ticker.stats.overruns == 0
+
+
+def test_overrun_is_counted_without_skipping(ticker, clock):
+    ticker.wait(1.0)
+    clock.now += 1.5
+    ticker.wait(1.0)
+
+    assert ticker.stats.overruns == 1
+    assert ticker.stats.skipped == 0
+    assert ticker.stats.max_lateness == pytest.approx(0.5)
+    # The late tick runs right away and the grid is kept
+    assert clock.now == pytest.approx(2.5)
+    ticker.wait(1.0)
+    assert clock.now == pytest.approx(3.0)
+
+
+def test_missed_deadlines_are_skipped(ticker, clock):
+    ticker.wait(1.0)
+    clock.now += 3.5
+    ticker.wait(1.0)
+
+    assert ticker.stats.overruns == 1
+    assert ticker.stats.skipped == 2
+    assert ticker.stats.average_lateness == pytest.approx(2.5)
+    # The next tick lands on the grid rather than catching up
+    ticker.wait(1.0)
+    assert clock.now == pytest.approx(5.0)
+
+
+def test_reset_restarts_the_grid(ticker, clock):
+    ticker.wait(1.0)
+    clock.now += 10.0
+    ticker.reset()
+    ticker.wait(1.0)
+
+    assert ticker.stats.overruns == 0
+    assert clock.now == pytest.approx(12.0)
+
+
+def test_due_tasks_run_while_waiting(ticker, clock):
+    ran = []
+    scheduler = Scheduler(clock=clock)
+    scheduler.schedule(0.4, lambda: ran.append(clock.now), "task")
+
+    ticker.wait(1.0, scheduler)
+
+    assert ran == [pytest.approx(0.4)]
+    assert clock.sleeps == pytest.approx([0.4, 0.6])
+    assert ticker.stats.mode(MODE_ACTIVE).wakeups == 2
+
+
+def test_usage_is_charged_to_each_mode(ticker, clock, cpu_clock):
+    clock.now += 0.2
+    cpu_clock.now += 0.1
+    ticker.wait(1.0, mode=MODE_ACTIVE)
+
+    clock.now += 0.5
+    cpu_clock.now += 0.05
+    ticker.wait(5.0, mode=MODE_IDLE)
+
+    active = ticker.stats.mode(MODE_ACTIVE)
+    idle = ticker.stats.mode(MODE_IDLE)
+    assert (active.ticks, idle.ticks) == (1, 1)
+    assert active.wall_time == pytest.approx(0.2)
+    assert active.cpu_time == pytest.approx(0.1)
+    # The idle wait is charged the active sleep and its own processing
+    assert idle.wall_time == pytest.approx(1.5)
+    assert idle.cpu_time == pytest.approx(0.05)
+    assert idle.cpu_percent == pytest.approx(0.05 / 1.5 * 100)
+
+
+def test_report_resets_the_statistics(clock, cpu_clock):
+    ticker = DeadlineTicker(
+        clock=clock, sleep=clock.sleep, report_interval=2.0, cpu_clock=cpu_clock
+    )
+    ticker.wait(1.0)
+    clock.now += 1.5
+    ticker.wait(1.0)
+    assert ticker.stats.ticks == 0
+
+    ticker.wait(1.0)
+    assert ticker.stats.ticks == 1
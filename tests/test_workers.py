@@ -0,0 +1,165 @@
+"""
+Tests for the bounded worker pool.
+"""
+
+import functools
+import threading
+
+import pytest
+
+from src.core.metrics import PipelineMetrics
+from src.core.workers import DEFAULT_QUEUES, OBS_EVENTS, QueueSpec, WorkerPool
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture
+def make_pool():
+    """Build pools that are shut down after the test."""
+    pools = []
+
+    def make(**queues: QueueSpec) -> WorkerPool:
+        pool = WorkerPool(queues, pipeline_metrics=PipelineMetrics())
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.cleanup(timeout=TIMEOUT)
+
+
+class Gate:
+    """A job that holds its worker until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        assert self.released.wait(TIMEOUT)
+
+
+def fill(pool: WorkerPool, name: str) -> Gate:
+    """Occupy the single worker of a queue and its one free slot."""
+    gate = Gate()
+    pool.submit(name, gate)
+    assert gate.started.wait(TIMEOUT)
+    assert pool.submit(name, lambda: None)
+    return gate
+
+
+def test_jobs_run_on_worker_threads(make_pool):
+    pool = make_pool(files=QueueSpec(workers=2))
+    threads = []
+
+    for _ in range(10):
+        pool.submit("files", lambda: threads.append(threading.current_thread().name))
+
+    assert pool.wait_idle(timeout=TIMEOUT)
+    assert len(threads) == 10
+    assert all(name.startswith("Worker-files-") for name in threads)
+    assert pool.snapshot()["files"]["completed"] == 10
+
+
+def test_failed_job_is_counted(make_pool):
+    pool = make_pool(files=QueueSpec())
+    pool.submit("files", lambda: 1 / 0)
+
+    assert pool.wait_idle(timeout=TIMEOUT)
+    assert pool.snapshot()["files"]["failed"] == 1
+
+
+def test_full_queue_runs_job_inline(make_pool):
+    pool = make_pool(files=QueueSpec(workers=1, max_depth=1))
+    gate = fill(pool, "files")
+
+    ran_on = []
+    assert pool.submit("files", lambda: ran_on.append(threading.current_thread()))
+    assert ran_on == [threading.current_thread()]
+
+    gate.released.set()
+    assert pool.wait_idle(timeout=TIMEOUT)
+    assert pool.snapshot()["files"]["inline"] == 1
+
+
+def test_full_disposable_queue_drops_job(make_pool):
+    pool = make_pool(sound=QueueSpec(workers=1, max_depth=1, drop_when_full=True))
+    gate = fill(pool, "sound")
+
+    ran = []
+    assert not pool.submit("sound", lambda: ran.append(1))
+
+    gate.released.set()
+    assert pool.wait_idle(timeout=TIMEOUT)
+    assert ran == []
+    assert pool.snapshot()["sound"]["dropped"] == 1
+
+
+def test_cleanup_drains_queued_jobs(make_pool):
+    pool = make_pool(files=QueueSpec(workers=1, max_depth=8))
+    gate = Gate()
+    ran = []
+    pool.submit("files", gate)
+    for index in range(3):
+        pool.submit("files", ran.append, index)
+
+    gate.released.set()
+    pool.cleanup(timeout=TIMEOUT)
+    assert ran == [0, 1, 2]
+
+    # Late jobs still run, inline
+    assert pool.submit("files", ran.append, 3)
+    assert ran == [0, 1, 2, 3]
+
+
+def test_unknown_queue_is_an_error(make_pool):
+    pool = make_pool(files=QueueSpec())
+    with pytest.raises(KeyError):
+        pool.submit("missing", lambda: None)
+
+
+def test_full_ordered_queue_waits_for_space(make_pool):
+    pool = make_pool(events=QueueSpec(workers=1, max_depth=1, block_when_full=True))
+    order = []
+    gate = Gate()
+    pool.submit("events", gate)
+    assert gate.started.wait(TIMEOUT)
+    pool.submit("events", order.append, "queued")
+
+    submitter = threading.Thread(
+        target=pool.submit, args=("events", order.append, "waiting")
+    )
+    submitter.start()
+    submitter.join(0.1)
+    assert submitter.is_alive()
+    assert order == []
+
+    gate.released.set()
+    submitter.join(TIMEOUT)
+    assert pool.wait_idle(timeout=TIMEOUT)
+    assert order == ["queued", "waiting"]
+    assert pool.snapshot()["events"]["blocked"] == 1
+
+
+def test_obs_events_are_handled_in_order(make_pool, obs, obs_server, wait_until):
+    pool = make_pool(**DEFAULT_QUEUES)
+    paths = []
+    obs.set_event_dispatcher(functools.partial(pool.submit, OBS_EVENTS))
+    obs.set_recording_completed_callback(paths.append)
+
+    # More events than the queue can hold at once
+    expected = [f"recordings/{index}.mkv" for index in range(300)]
+    for path in expected:
+        obs_server.emit_event(
+            "RecordStateChanged",
+            {
+                "outputActive": False,
+                "outputState": "OBS_WEBSOCKET_OUTPUT_STOPPED",
+                "outputPath": path,
+            },
+        )
+
+    wait_until(lambda: len(paths) == len(expected))
+    assert paths == expected
+    assert pool.snapshot()[OBS_EVENTS]["dropped"] == 0